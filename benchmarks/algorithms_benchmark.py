@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Graph algorithms benchmark.
+
+Times BFS, topological sort, connected components and degree
+statistics three ways: the naive approach that scans all edges per step,
+src.algorithms on a Graph, and src.algorithms on a FrozenGraph
+(vectorized, freeze time reported separately). The naive approach is
+quadratic, so it runs on a smaller graph.
+
+Usage:
+    python benchmarks/algorithms_benchmark.py [nodes] [naive_nodes]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models import Graph, Node, Edge
+from src import algorithms
+
+
+def build_dag(count, seed=0):
+    """DAG with count nodes and three forward edges per node."""
+    random.seed(seed)
+    graph = Graph(name="Benchmark")
+    nodes = [Node(label=f"Step {i}") for i in range(count)]
+    graph.add_nodes(nodes)
+    edges = []
+    for i in range(count - 1):
+        for _ in range(3):
+            # mostly short jumps, like process flows
+            j = min(count - 1, i + 1 + int(random.expovariate(0.1)))
+            edges.append(Edge(source=nodes[i], target=nodes[j]))
+    graph.add_edges(edges)
+    return graph
+
+
+def naive_bfs(graph, start):
+    order = [start]
+    seen = {start.id}
+    queue = [start]
+    while queue:
+        current = queue.pop(0)
+        for edge in graph.edges:
+            if edge.source is current and edge.target.id not in seen:
+                seen.add(edge.target.id)
+                order.append(edge.target)
+                queue.append(edge.target)
+    return order
+
+
+def naive_topological_sort(graph):
+    remaining = {node.id: node for node in graph.nodes}
+    order = []
+    while remaining:
+        blocked = {edge.target.id for edge in graph.edges
+                   if edge.source.id in remaining and edge.target.id in remaining}
+        ready = [node for node_id, node in remaining.items() if node_id not in blocked]
+        for node in ready:
+            del remaining[node.id]
+        order.extend(ready)
+    return order
+
+
+def naive_components(graph):
+    labels = {}
+    for seed in graph.nodes:
+        if seed.id in labels:
+            continue
+        labels[seed.id] = seed.id
+        stack = [seed]
+        while stack:
+            current = stack.pop()
+            for edge in graph.edges:
+                for a, b in ((edge.source, edge.target), (edge.target, edge.source)):
+                    if a is current and b.id not in labels:
+                        labels[b.id] = seed.id
+                        stack.append(b)
+    return len(set(labels.values()))
+
+
+def naive_degrees(graph):
+    return [sum(1 for edge in graph.edges if edge.source is node or edge.target is node)
+            for node in graph.nodes]
+
+
+def timed(function):
+    """Return seconds taken by function()."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def run_benchmark(count=200000, naive_count=2000):
+    """Print timings of each approach."""
+    small = build_dag(naive_count)
+    small_start = small.nodes[0]
+    naive = {
+        "bfs": timed(lambda: naive_bfs(small, small_start)),
+        "topological_sort": timed(lambda: naive_topological_sort(small)),
+        "components": timed(lambda: naive_components(small)),
+        "degree_stats": timed(lambda: naive_degrees(small)),
+    }
+
+    graph = build_dag(count)
+    start = graph.nodes[0]
+    freeze = timed(graph.freeze)
+    frozen = graph.freeze()
+    runs = {
+        "bfs": lambda g: algorithms.bfs(g, start),
+        "topological_sort": algorithms.topological_sort,
+        "components": algorithms.connected_components,
+        "degree_stats": algorithms.degree_stats,
+    }
+
+    print(f"Algorithms benchmark (naive: {naive_count} nodes; indexed/frozen: {count} nodes, "
+          f"{graph.edge_count()} edges; freeze {freeze:.2f} s)")
+    print(f"  {'algorithm':<18} {'naive s':>9} {'graph s':>9} {'frozen s':>9}")
+    for name, run in runs.items():
+        print(f"  {name:<18} {naive[name]:9.3f} {timed(lambda: run(graph)):9.3f} {timed(lambda: run(frozen)):9.3f}")
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    )
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Memory report for graph entities.
+
+Prints bytes per node and per edge for the current compact models and
+for a replica of the previous dict-based layout.
+
+Usage:
+    python benchmarks/memory_report.py [count]
+"""
+
+import sys
+import tracemalloc
+import uuid
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models import Node, Edge
+
+
+class LegacyPosition:
+    """Previous Position layout (instance __dict__)."""
+
+    def __init__(self, x=0.0, y=0.0):
+        self.x = x
+        self.y = y
+
+
+class LegacyNode:
+    """Previous Node layout (instance __dict__, eager dict and position)."""
+
+    def __init__(self, label, node_type="default", properties=None, position=None):
+        self.id = str(uuid.uuid4())
+        self.label = label
+        self.node_type = node_type
+        self.properties = properties or {}
+        self.position = position or LegacyPosition()
+
+
+class LegacyEdge:
+    """Previous Edge layout (instance __dict__, eager properties dict)."""
+
+    def __init__(self, source, target, edge_type="default", directed=True, label="", properties=None):
+        self.id = str(uuid.uuid4())
+        self.source = source
+        self.target = target
+        self.edge_type = edge_type
+        self.directed = directed
+        self.label = label
+        self.properties = properties or {}
+
+
+def measure(factory, count):
+    """Return average bytes allocated per object created by factory."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Exclude the list that holds the objects
+    total -= sys.getsizeof(objects)
+    return total / count
+
+
+def run_report(count=100000):
+    """Print memory usage per node and per edge, before and after."""
+    # Labels and types come from a small vocabulary, as in parsed models;
+    # fresh() builds a new string object each time, like a parser would
+    fresh = "".join
+    labels = [f"Step {i}" for i in range(100)]
+    legacy_nodes = [LegacyNode(label="a"), LegacyNode(label="b")]
+    nodes = [Node(label="a"), Node(label="b")]
+
+    rows = [
+        ("node", "before",
+         measure(lambda i: LegacyNode(label=fresh(labels[i % 100]), node_type=fresh("task")), count)),
+        ("node", "after",
+         measure(lambda i: Node(label=fresh(labels[i % 100]), node_type=fresh("task")), count)),
+        ("edge", "before",
+         measure(lambda i: LegacyEdge(legacy_nodes[0], legacy_nodes[1], edge_type=fresh("flow")), count)),
+        ("edge", "after",
+         measure(lambda i: Edge(nodes[0], nodes[1], edge_type=fresh("flow")), count)),
+    ]
+
+    print(f"Memory report ({count} objects each)")
+    for kind, layout, size in rows:
+        print(f"  {kind:<5} {layout:<7} {size:8.1f} bytes")
+
+
+if __name__ == "__main__":
+    run_report(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
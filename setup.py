@@ -14,6 +14,9 @@ setup(
         "flask>=2.0.0",
         "flask-cors>=3.0.0",
     ],
+    extras_require={
+        "analytics": ["numpy>=1.20"],
+    },
     python_requires=">=3.8",
     include_package_data=True,
     package_data={
@@ -2,8 +2,10 @@
 Adapters module for ExpresiVeNess.
 """
 
-from .base import SyntaxRegistry
+from .base import Diagnostic, SyntaxParseError, SyntaxRegistry
 
 __all__ = [
+    "Diagnostic",
+    "SyntaxParseError",
     "SyntaxRegistry",
 ]
\ No newline at end of file
@@ -3,9 +3,86 @@ Basic adapter interfaces and registry
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from ..models.graph import Graph
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from ..platform.model_manager import ModelManager
+    from .batch import ImportResult, ProgressCallback
+
+
+class Diagnostic:
+    """Problem found while parsing, located by 1-based line and column"""
+
+    ERROR = "error"
+    WARNING = "warning"
+
+    __slots__ = ("line", "column", "severity", "message")
+
+    def __init__(self, line: int, column: int, message: str, severity: str = ERROR):
+        self.line = line
+        self.column = column
+        self.severity = severity
+        self.message = message
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert diagnostic to dictionary"""
+        return {
+            "line": self.line,
+            "column": self.column,
+            "severity": self.severity,
+            "message": self.message
+        }
+
+    def __str__(self) -> str:
+        return f"{self.line}:{self.column}: {self.severity}: {self.message}"
+
+    def __repr__(self) -> str:
+        return f"Diagnostic({self})"
+
+
+class SyntaxParseError(ValueError):
+    """Raised by strict parsing when the input has errors"""
+
+    def __init__(self, diagnostics: List[Diagnostic]):
+        self.diagnostics = diagnostics
+        errors = [d for d in diagnostics if d.severity == Diagnostic.ERROR]
+        more = f" (and {len(errors) - 1} more errors)" if len(errors) > 1 else ""
+        super().__init__(f"{errors[0] if errors else 'invalid input'}{more}")
+
+
+def has_errors(diagnostics: Iterable[Diagnostic]) -> bool:
+    """Check whether any diagnostic is an error"""
+    return any(d.severity == Diagnostic.ERROR for d in diagnostics)
+
+
+def split_edge_line(line: str, number: int, diagnostics: List[Diagnostic]) -> Optional[Tuple[str, str]]:
+    """Split a 'source -> target' line into its names
+
+    Returns None for blank and invalid lines; problems are appended to
+    diagnostics.
+    """
+    arrow = line.find('->')
+    if arrow < 0:
+        if line.strip():
+            column = len(line) - len(line.lstrip()) + 1
+            diagnostics.append(Diagnostic(number, column, "expected 'source -> target'"))
+        return None
+    second = line.find('->', arrow + 2)
+    if second >= 0:
+        diagnostics.append(Diagnostic(number, second + 1, "more than one '->' on a line"))
+        return None
+    source = line[:arrow].strip()
+    target = line[arrow + 2:].strip()
+    if not source:
+        diagnostics.append(Diagnostic(number, arrow + 1, "missing source before '->'"))
+        return None
+    if not target:
+        diagnostics.append(Diagnostic(number, arrow + 3, "missing target after '->'"))
+        return None
+    return source, target
+
 
 class ISyntaxAdapter(ABC):
     """Interface for syntax adapters"""
@@ -21,10 +98,29 @@ class ISyntaxAdapter(ABC):
         pass
 
     @abstractmethod
-    def parse(self, input_data: str) -> Graph:
-        """Parse input data to graph"""
+    def parse(self, input_data: str, strict: bool = False) -> Graph:
+        """Parse input data to graph
+
+        Invalid lines are skipped; with strict, SyntaxParseError is raised
+        instead, carrying all diagnostics. Adapters without strict mode may
+        implement parse(input_data) only; strict is never passed to them
+        unless a caller asks for it.
+        """
         pass
 
+    def parse_stream(self, lines: Iterable[str], strict: bool = False) -> Graph:
+        """Parse input read line by line (iterable of lines or text file)"""
+        text = '\n'.join(line.rstrip('\r\n') for line in lines)
+        return self.parse(text, strict) if strict else self.parse(text)
+
+    def parse_with_diagnostics(self, lines: Iterable[str]) -> Tuple[Graph, List[Diagnostic]]:
+        """Parse leniently and report problems (input as lines or a text file)
+
+        Adapters that check their input while parsing override this; the
+        default reports nothing.
+        """
+        return self.parse_stream(lines), []
+
     @abstractmethod
     def export(self, graph: Graph) -> str:
         """Export graph to string format"""
@@ -57,6 +153,38 @@ class SyntaxRegistry:
         """Get list of available syntax names"""
         return list(self._adapters.keys())
 
+    def import_files(
+        self,
+        paths: Sequence[str],
+        model_manager: 'ModelManager',
+        syntax: Optional[str] = None,
+        executor: Optional['Executor'] = None,
+        max_workers: Optional[int] = None,
+        progress: Optional['ProgressCallback'] = None,
+        strict: bool = False
+    ) -> 'ImportResult':
+        """
+        Parses many files in parallel and adds the graphs to a model manager
+
+        Files are parsed in a process pool and sent back in the binary
+        graph format; each graph is named after its file. A file that
+        cannot be read or parsed is recorded in the result's errors and
+        does not stop the import.
+
+        Args:
+            paths: Files to import
+            model_manager: Manager the parsed graphs are added to
+            syntax: Syntax of all files (default: from the file extension,
+                see batch.FILE_EXTENSIONS)
+            executor: Executor running the parsers (default: own process pool);
+                adapters must be picklable for process pools
+            max_workers: Size of the own process pool (default: CPU count)
+            progress: Called as progress(done, total, path) after each file
+            strict: Reject files with syntax errors instead of skipping invalid lines
+        """
+        from .batch import import_files
+        return import_files(self, paths, model_manager, syntax, executor, max_workers, progress, strict)
+
     def _register_default_adapters(self):
         """Register default adapters"""
         try:
@@ -0,0 +1,159 @@
+"""
+Parallel batch import of syntax files
+"""
+
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..models import binary
+from ..models.graph import Graph
+
+if TYPE_CHECKING:
+    from ..platform.model_manager import ModelManager
+    from .base import ISyntaxAdapter, SyntaxRegistry
+
+# file extension -> syntax name, used when no syntax is given
+FILE_EXTENSIONS = {
+    ".graph": "basic_graph",
+    ".hierarchy": "hierarchy",
+    ".process": "process",
+}
+
+# progress(done, total, path) is called in the importing thread after each file
+ProgressCallback = Callable[[int, int, str], None]
+
+
+class ImportResult:
+    """Outcome of a batch import
+
+    imported maps each successfully imported path to its model ID,
+    errors maps each failed path to a message.
+    """
+
+    def __init__(self):
+        self.imported: Dict[str, str] = {}
+        self.errors: Dict[str, str] = {}
+        self.elapsed = 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert result to dictionary."""
+        return {
+            "imported": dict(self.imported),
+            "errors": dict(self.errors),
+            "elapsed_ms": round(self.elapsed * 1000, 1)
+        }
+
+    def __repr__(self) -> str:
+        return f"ImportResult(imported={len(self.imported)}, errors={len(self.errors)})"
+
+
+def _parse_file(path: str, adapter: 'ISyntaxAdapter', strict: bool) -> Graph:
+    """Parse one file; the graph is named after it"""
+    with open(path, encoding="utf-8") as file:
+        graph = adapter.parse_stream(file, strict) if strict else adapter.parse_stream(file)
+    graph.name = os.path.splitext(os.path.basename(path))[0]
+    return graph
+
+
+def _parse_files(
+    tasks: List[Tuple[str, 'ISyntaxAdapter']],
+    strict: bool
+) -> List[Tuple[str, Optional[bytes], Optional[str]]]:
+    """Worker: parse files and return them in the binary graph format
+
+    Graphs travel back as bytes, which is far cheaper to pickle than the
+    object graph. Failures are reported per file.
+    """
+    results = []
+    for path, adapter in tasks:
+        try:
+            results.append((path, binary.dumps(_parse_file(path, adapter, strict)), None))
+        except Exception as error:
+            results.append((path, None, f"{type(error).__name__}: {error}"))
+    return results
+
+
+def import_files(
+    registry: 'SyntaxRegistry',
+    paths: Sequence[str],
+    model_manager: 'ModelManager',
+    syntax: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    strict: bool = False
+) -> ImportResult:
+    """Parse files in a process pool and add the graphs to model_manager
+
+    See SyntaxRegistry.import_files.
+    """
+    start = time.perf_counter()
+    result = ImportResult()
+    total = len(paths)
+    done = 0
+
+    tasks = []
+    for path in paths:
+        name = syntax or FILE_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        try:
+            if name is None:
+                raise ValueError("unknown file extension")
+            adapter = registry.get_adapter(name)
+        except Exception as error:
+            result.errors[path] = f"{type(error).__name__}: {error}"
+            done += 1
+            if progress is not None:
+                progress(done, total, path)
+            continue
+        tasks.append((path, adapter))
+
+    workers = max_workers or os.cpu_count() or 1
+    if executor is None and workers == 1:
+        # a pool would only add serialization overhead
+        for path, adapter in tasks:
+            try:
+                result.imported[path] = model_manager.add_model(_parse_file(path, adapter, strict))
+            except Exception as error:
+                result.errors[path] = f"{type(error).__name__}: {error}"
+            done += 1
+            if progress is not None:
+                progress(done, total, path)
+        tasks = []
+
+    owns_executor = executor is None and bool(tasks)
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    # several files per task amortize the round trip; a few tasks per
+    # worker keep the pool balanced when file sizes differ
+    chunk = max(1, min(64, len(tasks) // (workers * 4)))
+
+    try:
+        futures = {
+            executor.submit(_parse_files, tasks[i:i + chunk], strict): tasks[i:i + chunk]
+            for i in range(0, len(tasks), chunk)
+        }
+        for future in as_completed(futures):
+            try:
+                parsed = future.result()
+            except Exception as error:
+                # the worker itself failed (e.g. the pool broke)
+                parsed = [(path, None, f"{type(error).__name__}: {error}") for path, _ in futures[future]]
+            for path, data, message in parsed:
+                if data is not None:
+                    try:
+                        result.imported[path] = model_manager.add_model(binary.loads(data))
+                    except Exception as error:
+                        message = f"{type(error).__name__}: {error}"
+                if message is not None:
+                    result.errors[path] = message
+                done += 1
+                if progress is not None:
+                    progress(done, total, path)
+    finally:
+        if owns_executor:
+            executor.shutdown()
+
+    result.elapsed = time.perf_counter() - start
+    return result
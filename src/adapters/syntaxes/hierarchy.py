@@ -2,7 +2,11 @@
 Hierarchy syntax adapter
 """
 
-from ..base import ISyntaxAdapter
+import io
+import itertools
+from typing import Dict, Iterable, List, Tuple
+
+from ..base import Diagnostic, ISyntaxAdapter, SyntaxParseError, has_errors
 from ...models.graph import Graph, Node, Edge
 
 
@@ -15,19 +19,43 @@ class HierarchyAdapter(ISyntaxAdapter):
     def get_version(self) -> str:
         return "1.0.0"
 
-    def parse(self, input_data: str) -> Graph:
+    def parse(self, input_data: str, strict: bool = False) -> Graph:
         """Parse hierarchy format using indentation"""
+        return self.parse_stream(io.StringIO(input_data), strict)
+
+    def parse_stream(self, lines: Iterable[str], strict: bool = False) -> Graph:
+        """Parse line by line from an iterable of lines or a text file"""
+        graph, diagnostics = self.parse_with_diagnostics(lines)
+        if strict and has_errors(diagnostics):
+            raise SyntaxParseError(diagnostics)
+        return graph
+
+    def parse_with_diagnostics(self, lines: Iterable[str]) -> Tuple[Graph, List[Diagnostic]]:
+        """Check and parse in one pass
+
+        A line indented more than one level below the previous one is an
+        error; it is still attached to the nearest open parent.
+        """
         graph = Graph(name="Hierarchy", directed=True)
         node_stack = []  # Stack to track parent nodes
+        diagnostics: List[Diagnostic] = []
+        prev_level = -1
 
-        lines = input_data.strip().split('\n')
-        for line in lines:
-            if not line.strip():
+        for number, line in enumerate(lines, 1):
+            node_name = line.strip()
+            if not node_name:
                 continue
 
             # Calculate indentation level
-            indent_level = (len(line) - len(line.lstrip())) // 2
-            node_name = line.strip()
+            indent = len(line) - len(line.lstrip())
+            indent_level = indent // 2
+            if indent % 2:
+                diagnostics.append(Diagnostic(number, indent + 1, "indentation is not a multiple of two spaces",
+                                              Diagnostic.WARNING))
+            # Level can increase by at most 1
+            if indent_level > prev_level + 1:
+                diagnostics.append(Diagnostic(number, indent + 1, "indented more than one level below its parent"))
+            prev_level = indent_level
 
             # Create node
             node = Node(
@@ -55,55 +83,56 @@ class HierarchyAdapter(ISyntaxAdapter):
             # Add to stack
             node_stack.append(node)
 
-        return graph
+        return graph, diagnostics
 
     def export(self, graph: Graph) -> str:
-        """Export graph to hierarchy format"""
-        # Find root nodes (no incoming edges)
-        root_nodes = []
-        for node in graph.nodes:
-            has_parent = any(edge.target == node for edge in graph.edges)
-            if not has_parent:
-                root_nodes.append(node)
-
-        lines = []
-        for root in root_nodes:
-            self._export_node_hierarchy(root, graph, lines, 0)
-
-        return '\n'.join(lines)
-
-    def _export_node_hierarchy(self, node: Node, graph: Graph, lines: list, level: int):
-        """Recursively export node hierarchy"""
-        indent = "  " * level
-        lines.append(f"{indent}{node.label}")
-
-        # Find children
-        children = []
+        """Export graph to hierarchy format
+
+        Every node is written exactly once. A child shared by several parents
+        is written under the first parent reached, and edges closing a cycle
+        are skipped. Nodes reachable only through a cycle are exported starting
+        from the first of them in graph order.
+        """
+        # Build child index and find root nodes (no incoming edges)
+        children: Dict[str, List[Node]] = {}
+        has_parent = set()
         for edge in graph.edges:
-            if edge.source == node:
-                children.append(edge.target)
+            children.setdefault(edge.source.id, []).append(edge.target)
+            has_parent.add(edge.target.id)
 
-        for child in children:
-            self._export_node_hierarchy(child, graph, lines, level + 1)
+        root_nodes = [node for node in graph.nodes if node.id not in has_parent]
 
-    def validate(self, input_data: str) -> bool:
-        """Validate hierarchy syntax"""
-        try:
-            lines = input_data.strip().split('\n')
-            prev_level = -1
+        lines = []
+        visited = set()
+        for root in itertools.chain(root_nodes, graph.nodes):
+            if root.id in visited:
+                continue
 
-            for line in lines:
-                if not line.strip():
+            # Depth-first walk with an explicit stack, children kept in order
+            stack = [(root, 0)]
+            while stack:
+                node, level = stack.pop()
+                if node.id in visited:
                     continue
+                visited.add(node.id)
+                lines.append(f"{'  ' * level}{node.label}")
 
-                indent_level = (len(line) - len(line.lstrip())) // 2
-
-                # Level can increase by at most 1
-                if indent_level > prev_level + 1:
-                    return False
+                node_children = children.get(node.id)
+                if node_children:
+                    stack.extend((child, level + 1) for child in reversed(node_children)
+                                 if child.id not in visited)
 
-                prev_level = indent_level
+        return '\n'.join(lines)
 
-            return True
-        except:
-            return False
\ No newline at end of file
+    def validate(self, input_data: str) -> bool:
+        """Validate hierarchy syntax"""
+        prev_level = -1
+        for line in io.StringIO(input_data):
+            if not line.strip():
+                continue
+            indent_level = (len(line) - len(line.lstrip())) // 2
+            # Level can increase by at most 1
+            if indent_level > prev_level + 1:
+                return False
+            prev_level = indent_level
+        return True
@@ -2,7 +2,10 @@
 Process diagram syntax adapter
 """
 
-from ..base import ISyntaxAdapter
+import io
+from typing import Dict, Iterable, List, Tuple
+
+from ..base import Diagnostic, ISyntaxAdapter, SyntaxParseError, has_errors, split_edge_line
 from ...models.graph import Graph, Node, Edge
 
 
@@ -19,40 +22,47 @@ class ProcessAdapter(ISyntaxAdapter):
     def get_version(self) -> str:
         return self.version
 
-    def parse(self, input_data: str) -> Graph:
+    def parse(self, input_data: str, strict: bool = False) -> Graph:
         """Parse process diagram from text"""
+        return self.parse_stream(io.StringIO(input_data), strict)
+
+    def parse_stream(self, lines: Iterable[str], strict: bool = False) -> Graph:
+        """Parse line by line from an iterable of lines or a text file"""
+        graph, diagnostics = self.parse_with_diagnostics(lines)
+        if strict and has_errors(diagnostics):
+            raise SyntaxParseError(diagnostics)
+        return graph
+
+    def parse_with_diagnostics(self, lines: Iterable[str]) -> Tuple[Graph, List[Diagnostic]]:
+        """Check and parse in one pass; invalid lines are reported and skipped"""
         graph = Graph(name="Process Diagram", directed=True)
+        nodes: Dict[str, Node] = {}  # label -> node
+        diagnostics: List[Diagnostic] = []
 
-        lines = input_data.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if '->' in line:
-                # Process step relationship
-                parts = line.split('->')
-                if len(parts) == 2:
-                    source_name = parts[0].strip()
-                    target_name = parts[1].strip()
-
-                    # Create or get nodes
-                    source = self._get_or_create_node(graph, source_name, "process_step")
-                    target = self._get_or_create_node(graph, target_name, "process_step")
-
-                    # Create edge
-                    edge = Edge(
-                        source=source,
-                        target=target,
-                        edge_type="process_flow",
-                        directed=True
-                    )
-                    graph.add_edge(edge)
+        for number, line in enumerate(lines, 1):
+            names = split_edge_line(line, number, diagnostics)
+            if names is None:
+                continue
+            source_name, target_name = names
 
-        return graph
+            # Process step relationship
+            source = self._get_or_create_node(graph, nodes, source_name, "process_step")
+            target = self._get_or_create_node(graph, nodes, target_name, "process_step")
+            edge = Edge(
+                source=source,
+                target=target,
+                edge_type="process_flow",
+                directed=True
+            )
+            graph.add_edge(edge)
+
+        return graph, diagnostics
 
-    def _get_or_create_node(self, graph: Graph, name: str, node_type: str) -> Node:
+    def _get_or_create_node(self, graph: Graph, nodes: Dict[str, Node], name: str, node_type: str) -> Node:
         """Get existing node or create new one"""
-        for node in graph.nodes:
-            if node.label == name:
-                return node
+        node = nodes.get(name)
+        if node is not None:
+            return node
 
         node = Node(
             label=name,
@@ -60,6 +70,7 @@ class ProcessAdapter(ISyntaxAdapter):
             properties={"name": name}
         )
         graph.add_node(node)
+        nodes[name] = node
         return node
 
     def export(self, graph: Graph) -> str:
@@ -71,12 +82,7 @@ class ProcessAdapter(ISyntaxAdapter):
 
     def validate(self, input_data: str) -> bool:
         """Validate process diagram syntax"""
-        try:
-            lines = input_data.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line and '->' not in line:
-                    return False
-            return True
-        except:
-            return False
\ No newline at end of file
+        diagnostics: List[Diagnostic] = []
+        for number, line in enumerate(io.StringIO(input_data), 1):
+            split_edge_line(line, number, diagnostics)
+        return not diagnostics
@@ -0,0 +1,40 @@
+"""
+Algorithms module for ExpresiVeNess.
+
+Functions take a Graph, MappedGraph or FrozenGraph and run in time
+linear in the graph size; on a FrozenGraph (``graph.freeze()``) they use
+vectorized NumPy kernels where the algorithm allows it.
+ProcessAnalytics keeps reachability of process graphs and HierarchyIndex
+the ancestor intervals of hierarchies up to date as observers.
+"""
+
+from .base import CycleError
+from .hierarchy import HierarchyIndex
+from .paths import shortest_path, shortest_path_lengths
+from .process import ProcessAnalytics
+from .structure import (
+    connected_components,
+    degree_stats,
+    find_cycle,
+    has_cycle,
+    strongly_connected_components,
+    topological_sort,
+)
+from .traversal import bfs, bfs_depths, dfs
+
+__all__ = [
+    "CycleError",
+    "HierarchyIndex",
+    "ProcessAnalytics",
+    "bfs",
+    "bfs_depths",
+    "connected_components",
+    "degree_stats",
+    "dfs",
+    "find_cycle",
+    "has_cycle",
+    "shortest_path",
+    "shortest_path_lengths",
+    "strongly_connected_components",
+    "topological_sort",
+]
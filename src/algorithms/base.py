@@ -0,0 +1,102 @@
+"""
+Integer adjacency shared by the graph algorithms
+"""
+
+from typing import Any, List, Optional, Union
+
+from ..models.node import Node
+
+try:
+    from ..models.frozen import FrozenGraph
+except ImportError:  # numpy is optional
+    FrozenGraph = None
+
+
+class CycleError(ValueError):
+    """Raised when an algorithm needs an acyclic graph; cycle holds the nodes of one cycle"""
+
+    def __init__(self, cycle: List[Node]):
+        self.cycle = cycle
+        super().__init__("graph has a cycle: " + " -> ".join(node.label for node in cycle))
+
+
+def is_frozen(graph: Any) -> bool:
+    """Check whether graph is a FrozenGraph, i.e. the vectorized code path applies"""
+    return FrozenGraph is not None and isinstance(graph, FrozenGraph)
+
+
+class Adjacency:
+    """Nodes numbered in graph order with outgoing/incoming neighbour lists
+
+    Built in one pass over graph.nodes and graph.edges, so every
+    algorithm on top of it stays linear. Parallel edges give repeated
+    entries and self loops appear in both lists of their node.
+    """
+
+    __slots__ = ("nodes", "index", "out", "incoming", "edge_count", "directed")
+
+    def __init__(self, graph: Any):
+        self.nodes: List[Node] = list(graph.nodes)
+        self.index = {node.id: i for i, node in enumerate(self.nodes)}
+        self.directed: bool = graph.directed
+        n = len(self.nodes)
+        self.out: List[List[int]] = [[] for _ in range(n)]
+        self.incoming: List[List[int]] = [[] for _ in range(n)]
+        index = self.index
+        if is_frozen(graph):
+            # incoming lists follow the FrozenGraph in-CSR order, like its get_neighbors
+            sources = graph.edge_sources.tolist()
+            targets = graph.targets.tolist()
+            order = graph.in_edge_order.tolist()
+            for source, target in zip(sources, targets):
+                self.out[source].append(target)
+            for i in order:
+                self.incoming[targets[i]].append(sources[i])
+        else:
+            for edge in graph.edges:
+                source = index[edge.source.id]
+                target = index[edge.target.id]
+                self.out[source].append(target)
+                self.incoming[target].append(source)
+        self.edge_count = sum(len(targets) for targets in self.out)
+
+    def neighbors(self, i: int) -> List[int]:
+        """Successors of node i; in undirected graphs all neighbours (self loops once)"""
+        if self.directed:
+            return self.out[i]
+        return self.out[i] + [j for j in self.incoming[i] if j != i]
+
+    def node_index(self, node: Union[Node, str]) -> int:
+        """Index of a node (or node ID); raises KeyError if it is not in the graph"""
+        node_id = node if isinstance(node, str) else node.id
+        try:
+            return self.index[node_id]
+        except KeyError:
+            raise KeyError(f"node {node_id} is not in the graph") from None
+
+
+def resolve_node(graph: Any, node: Union[Node, str]) -> Node:
+    """The graph's node for a node or node ID; raises KeyError if it is not in the graph"""
+    node_id = node if isinstance(node, str) else node.id
+    found = graph.get_node_by_id(node_id)
+    if found is None:
+        raise KeyError(f"node {node_id} is not in the graph")
+    return found
+
+
+def frozen_index(graph: Any, node: Union[Node, str]) -> int:
+    """Index of a node in a FrozenGraph; raises KeyError if it is not in the graph"""
+    i: Optional[int] = graph.index_of(node)
+    if i is None:
+        raise KeyError(f"node {node if isinstance(node, str) else node.id} is not in the graph")
+    return i
+
+
+def path_from_parents(parents: List[int], target: int) -> List[int]:
+    """Follow parent links (-1 ends) back from target; returns indices from the root"""
+    path = []
+    while target >= 0:
+        path.append(target)
+        target = parents[target]
+    path.reverse()
+    return path
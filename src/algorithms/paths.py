@@ -0,0 +1,103 @@
+"""
+Shortest paths
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..models.node import Node
+from .base import frozen_index, is_frozen, path_from_parents, resolve_node
+from .traversal import bfs_depths, bfs_tree
+
+
+def shortest_path(
+    graph: Any,
+    source: Union[Node, str],
+    target: Union[Node, str],
+    weight: Optional[str] = None
+) -> Optional[List[Node]]:
+    """Nodes of a shortest path from source to target, or None if unreachable.
+
+    Without weight every edge counts 1 (BFS, vectorized on a FrozenGraph).
+    With weight, the edge property of that name is the edge length
+    (missing means 1, negative values are rejected) and Dijkstra is used.
+    """
+    if weight is not None:
+        lengths, parent, nodes, index = _dijkstra(graph, source, weight)
+        end = _node_index(index, target)
+        return [nodes[i] for i in path_from_parents(parent, end)] if lengths[end] is not None else None
+    if is_frozen(graph):
+        from .vectorized import bfs as bfs_kernel
+        end = frozen_index(graph, target)
+        _, parent, depth = bfs_kernel(graph, frozen_index(graph, source))
+        if depth[end] < 0:
+            return None
+        nodes = graph.nodes
+        return [nodes[i] for i in path_from_parents(parent.tolist(), end)]
+    end_node = resolve_node(graph, target)
+    _, parents, _ = bfs_tree(graph, resolve_node(graph, source))
+    path = [end_node]
+    while path[-1].id in parents:
+        path.append(parents[path[-1].id])
+    if path[-1].id != (source if isinstance(source, str) else source.id):
+        return None
+    path.reverse()
+    return path
+
+
+def shortest_path_lengths(graph: Any, source: Union[Node, str], weight: Optional[str] = None) -> Dict[str, float]:
+    """Distance from source to every reachable node, keyed by node ID (see shortest_path)"""
+    if weight is None:
+        return bfs_depths(graph, source)
+    lengths, _, nodes, _ = _dijkstra(graph, source, weight)
+    return {node.id: length for node, length in zip(nodes, lengths) if length is not None}
+
+
+def _node_index(index: Dict[str, int], node: Union[Node, str]) -> int:
+    node_id = node if isinstance(node, str) else node.id
+    try:
+        return index[node_id]
+    except KeyError:
+        raise KeyError(f"node {node_id} is not in the graph") from None
+
+
+def _dijkstra(
+    graph: Any,
+    source: Union[Node, str],
+    weight: str
+) -> Tuple[List[Optional[float]], List[int], List[Node], Dict[str, int]]:
+    """Dijkstra with a binary heap; returns lengths (None if unreached), parents, nodes and index"""
+    nodes = list(graph.nodes)
+    index = {node.id: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+    out: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+    for edge in graph.edges:
+        properties = edge._properties
+        length = properties.get(weight, 1) if properties else 1
+        if length < 0:
+            raise ValueError(f"edge {edge.id} has negative {weight} {length}")
+        s = index[edge.source.id]
+        t = index[edge.target.id]
+        out[s].append((t, length))
+        if not graph.directed and s != t:
+            out[t].append((s, length))
+
+    start = _node_index(index, source)
+    lengths: List[Optional[float]] = [None] * n
+    parent = [-1] * n
+    done = [False] * n
+    lengths[start] = 0
+    heap = [(0, start)]
+    while heap:
+        length, current = heapq.heappop(heap)
+        if done[current]:
+            continue
+        done[current] = True
+        for neighbor, edge_length in out[current]:
+            candidate = length + edge_length
+            known = lengths[neighbor]
+            if known is None or candidate < known:
+                lengths[neighbor] = candidate
+                parent[neighbor] = current
+                heapq.heappush(heap, (candidate, neighbor))
+    return lengths, parent, nodes, index
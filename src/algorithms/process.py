@@ -0,0 +1,494 @@
+"""
+Reachability and critical-path analytics for process graphs
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ..models.node import Node
+from ..models.observers import ModelEvent, ModelObserver, event_cache_key, event_elements
+from .base import resolve_node
+from .structure import strongly_connected_components
+
+START_TYPE = "start"
+END_TYPE = "end"
+
+
+class Reachability:
+    """Which marked nodes each node reaches (or is reached from), as bitmasks by node ID
+
+    Every marked node owns a bit, or with shared=True all of them share
+    one, which only answers whether any marked node is involved. With
+    upstream=True bits flow against edge direction, so a node's mask
+    holds the marked nodes it can reach; otherwise they flow along edges
+    and the mask holds the marked nodes that reach it. Edge additions
+    push new bits on until nothing changes; an edge removal clears the
+    bits it may have carried on the nodes it feeds and re-derives them
+    from the rest of the graph. Unmarking a node with its own bit only
+    retires the bit.
+    """
+
+    def __init__(self, graph: Any, upstream: bool, shared: bool = False):
+        self.graph = graph
+        self.upstream = upstream
+        self.shared = shared
+        self.masks: Dict[str, int] = {}
+        self.bit_of: Dict[str, int] = {}
+        self.node_of: Dict[int, str] = {}
+        # bits of currently marked nodes; retired bits stay in masks until a rebuild
+        self.live = 1 if shared else 0
+        self.retired = 0
+        self._next_bit = 1
+
+    def rebuild(self, marked: List[str]) -> None:
+        """Recompute all masks for the given marked node IDs in one pass over the components"""
+        self.masks = {node.id: 0 for node in self.graph.nodes}
+        self.bit_of = {}
+        self.node_of = {}
+        self.live = 1 if self.shared else 0
+        self.retired = 0
+        self._next_bit = 1
+        for node_id in marked:
+            self._assign(node_id)
+        # reverse topological order: the feeders of a component come before it
+        components = strongly_connected_components(self.graph)
+        if not self.upstream:
+            components.reverse()
+        masks = self.masks
+        for component in components:
+            mask = 0
+            for node in component:
+                mask |= masks[node.id]
+                for other in self._feeders(node.id):
+                    mask |= masks[other]
+            for node in component:
+                masks[node.id] = mask
+
+    def _assign(self, node_id: str) -> int:
+        if self.shared:
+            bit = 1
+        else:
+            bit = self._next_bit
+            self._next_bit <<= 1
+            self.node_of[bit] = node_id
+            self.live |= bit
+        self.bit_of[node_id] = bit
+        self.masks[node_id] = self.masks.get(node_id, 0) | bit
+        return bit
+
+    def _feeders(self, node_id: str) -> List[str]:
+        """Nodes whose bits flow into node_id"""
+        node = self.graph.get_node_by_id(node_id)
+        if node is None:
+            # removed from the graph, its NODE_REMOVED event is still to come
+            return []
+        if self.upstream:
+            return [edge.target.id for edge in self.graph.get_outgoing_edges(node)]
+        return [edge.source.id for edge in self.graph.get_incoming_edges(node)]
+
+    def _fed(self, node_id: str) -> List[str]:
+        """Nodes that node_id passes its bits on to"""
+        node = self.graph.get_node_by_id(node_id)
+        if node is None:
+            return []
+        if self.upstream:
+            return [edge.source.id for edge in self.graph.get_incoming_edges(node)]
+        return [edge.target.id for edge in self.graph.get_outgoing_edges(node)]
+
+    def _propagate(self, stack: List[str], within: Optional[set] = None) -> None:
+        masks = self.masks
+        while stack:
+            current = stack.pop()
+            mask = masks[current]
+            for other in self._fed(current):
+                if within is not None and other not in within:
+                    continue
+                known = masks.get(other, 0)
+                if mask & ~known:
+                    masks[other] = known | mask
+                    stack.append(other)
+
+    def mark(self, node_id: str) -> None:
+        """Give a node its own bit and spread it"""
+        if node_id not in self.bit_of:
+            self._assign(node_id)
+            self._propagate([node_id])
+
+    def unmark(self, node_id: str) -> None:
+        """Drop the mark of a node"""
+        bit = self.bit_of.pop(node_id, None)
+        if bit is None:
+            return
+        if self.shared:
+            # other marked nodes may still supply the bit
+            if self.graph.get_node_by_id(node_id) is not None:
+                self._rederive(node_id, bit)
+            return
+        del self.node_of[bit]
+        self.live &= ~bit
+        self.retired += 1
+
+    def add_node(self, node_id: str) -> None:
+        self.masks.setdefault(node_id, 0)
+
+    def remove_node(self, node_id: str) -> None:
+        self.unmark(node_id)
+        self.masks.pop(node_id, None)
+
+    def edge_added(self, source_id: str, target_id: str) -> None:
+        feeder, fed = (target_id, source_id) if self.upstream else (source_id, target_id)
+        self.masks.setdefault(feeder, 0)
+        known = self.masks.setdefault(fed, 0)
+        if self.masks[feeder] & ~known:
+            self.masks[fed] = known | self.masks[feeder]
+            self._propagate([fed])
+
+    def edge_removed(self, source_id: str, target_id: str, single: bool = True) -> None:
+        """Update masks after an edge was removed.
+
+        single says the removal is the only change since the masks were
+        last updated, so the feeder's mask is still what the edge carried
+        and only its bits can be lost. After batched or delayed events that
+        no longer holds and all bits of the fed node are re-derived.
+        """
+        feeder, fed = (target_id, source_id) if self.upstream else (source_id, target_id)
+        get_node = self.graph.get_node_by_id
+        if fed not in self.masks or get_node(fed) is None:
+            # a removed node's own edges are reported too and handled there
+            return
+        lost = self.masks[fed]
+        if single and get_node(feeder) is not None:
+            lost &= self.masks.get(feeder, 0)
+        if lost:
+            self._rederive(fed, lost)
+
+    def _rederive(self, fed: str, lost: int) -> None:
+        """Clear lost bits on fed and the nodes it feeds, then take them back from the remaining feeders"""
+        # every node fed by fed got those bits through it
+        affected = {fed}
+        stack = [fed]
+        while stack:
+            for other in self._fed(stack.pop()):
+                if other not in affected and self.masks.get(other, 0) & lost:
+                    affected.add(other)
+                    stack.append(other)
+        masks = self.masks
+        for node_id in affected:
+            masks[node_id] &= ~lost
+        seeds = []
+        for node_id in affected:
+            regained = self.bit_of.get(node_id, 0) & lost
+            for other in self._feeders(node_id):
+                if other not in affected:
+                    regained |= masks.get(other, 0) & lost
+            if regained:
+                masks[node_id] |= regained
+                seeds.append(node_id)
+        self._propagate(seeds, affected)
+
+    def marked_in(self, node_id: str) -> List[str]:
+        """Marked node IDs in the mask of a node"""
+        mask = self.masks.get(node_id, 0) & self.live
+        result = []
+        while mask:
+            bit = mask & -mask
+            result.append(self.node_of[bit])
+            mask ^= bit
+        return result
+
+    def is_empty(self, node_id: str) -> bool:
+        return not self.masks.get(node_id, 0) & self.live
+
+
+class ProcessState:
+    """Analytics of one process graph, kept in step with its events"""
+
+    def __init__(self, graph: Any):
+        self.graph = graph
+        self.ends = Reachability(graph, upstream=True)
+        # only whether a start reaches a node is needed, and graphs may have many sources
+        self.starts = Reachability(graph, upstream=False, shared=True)
+        self.typed_ends = False
+        self.typed_starts = False
+        self.version = -1
+        self.stale = True
+        # report cached for self.version
+        self.report: Optional[Dict[str, Any]] = None
+
+    def is_end(self, node: Node) -> bool:
+        if self.typed_ends:
+            return node.node_type == END_TYPE
+        return not self.graph.get_outgoing_edges(node)
+
+    def is_start(self, node: Node) -> bool:
+        if self.typed_starts:
+            return node.node_type == START_TYPE
+        return not self.graph.get_incoming_edges(node)
+
+    def rebuild(self) -> None:
+        nodes = list(self.graph.nodes)
+        self.typed_ends = any(node.node_type == END_TYPE for node in nodes)
+        self.typed_starts = any(node.node_type == START_TYPE for node in nodes)
+        self.ends.rebuild([node.id for node in nodes if self.is_end(node)])
+        self.starts.rebuild([node.id for node in nodes if self.is_start(node)])
+        self.version = self.graph.version
+        self.stale = False
+        self.report = None
+
+    def refresh(self, node_id: str) -> None:
+        """Re-evaluate whether a node is a start/end after its edges or type changed"""
+        node = self.graph.get_node_by_id(node_id)
+        if node is None:
+            return
+        for reachability, marked in ((self.ends, self.is_end(node)), (self.starts, self.is_start(node))):
+            if marked:
+                reachability.mark(node_id)
+            else:
+                reachability.unmark(node_id)
+
+    def apply(self, event_type: ModelEvent, elements: List[Any]) -> None:
+        """Update the masks for an element event; falls back to a rebuild when the start/end rules change"""
+        graph = self.graph
+        # otherwise the graph has moved past the event (batches, coalesced or queued delivery)
+        single = graph.version == self.version + 1
+        if event_type == ModelEvent.EDGE_ADDED:
+            for edge in elements:
+                if not graph.has_edge(edge):
+                    continue
+                self.ends.edge_added(edge.source.id, edge.target.id)
+                self.starts.edge_added(edge.source.id, edge.target.id)
+                self.refresh(edge.source.id)
+                self.refresh(edge.target.id)
+        elif event_type == ModelEvent.EDGE_REMOVED:
+            for edge in elements:
+                self.ends.edge_removed(edge.source.id, edge.target.id, single)
+                self.starts.edge_removed(edge.source.id, edge.target.id, single)
+                self.refresh(edge.source.id)
+                self.refresh(edge.target.id)
+        elif event_type in (ModelEvent.NODE_ADDED, ModelEvent.NODE_UPDATED):
+            for node in elements:
+                if not graph.has_node(node):
+                    continue
+                if (node.node_type == END_TYPE and not self.typed_ends
+                        or node.node_type == START_TYPE and not self.typed_starts):
+                    self.stale = True
+                    return
+                self.ends.add_node(node.id)
+                self.starts.add_node(node.id)
+                self.refresh(node.id)
+        elif event_type == ModelEvent.NODE_REMOVED:
+            for node in elements:
+                self.ends.remove_node(node.id)
+                self.starts.remove_node(node.id)
+        if (self.typed_ends and not self.ends.bit_of) or (self.typed_starts and not self.starts.bit_of):
+            # the last typed start/end is gone; fall back to sources/sinks
+            self.stale = True
+            return
+        # retired bits only cost memory; compact once they outnumber the live ones
+        for reachability in (self.ends, self.starts):
+            if reachability.retired > 64 + len(reachability.bit_of):
+                self.stale = True
+                return
+        self.version = graph.version
+        self.report = None
+
+
+def node_duration(duration: str) -> Callable[[Node], float]:
+    """Duration getter for a node property name; missing or non-numeric values count 0"""
+    def get(node: Node) -> float:
+        value = node._properties.get(duration) if node._properties else None
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0
+    return get
+
+
+def step_count(node: Node) -> float:
+    """Duration of a node when no node has one: every step counts 1"""
+    return 1
+
+
+def critical_path(
+    graph: Any,
+    starts: List[str],
+    ends: List[str],
+    duration: str = "duration"
+) -> Tuple[List[Node], float, int]:
+    """Longest path from a start to an end node, weighted by node duration.
+
+    Nodes are weighted by their duration property; if no node has one,
+    every node counts 1, so the path is the longest chain of steps.
+    Process loops are cut: edges closing a cycle in a depth-first search
+    from the starts (in the order given) are never followed. Returns the
+    path, its total duration and the number of loop edges ignored.
+    """
+    if any(duration in node._properties for node in graph.nodes if node._properties):
+        get_duration = node_duration(duration)
+    else:
+        get_duration = step_count
+    nodes = {node_id: graph.get_node_by_id(node_id) for node_id in starts}
+
+    # reverse DFS postorder without back edges is a topological order
+    state: Dict[str, int] = {}  # 1 on the DFS path, 2 finished
+    postorder: List[str] = []
+    loops = 0
+    successors: Dict[str, List[str]] = {}
+    for root in starts:
+        if root in state:
+            continue
+        state[root] = 1
+        stack = [(root, iter(graph.get_outgoing_edges(nodes[root])))]
+        successors[root] = []
+        while stack:
+            current, edges = stack[-1]
+            for edge in edges:
+                target = edge.target.id
+                seen = state.get(target)
+                if seen == 1:
+                    loops += 1
+                    continue
+                successors[current].append(target)
+                if seen is None:
+                    state[target] = 1
+                    nodes[target] = edge.target
+                    successors[target] = []
+                    stack.append((target, iter(graph.get_outgoing_edges(edge.target))))
+                    break
+            else:
+                state[current] = 2
+                postorder.append(current)
+                stack.pop()
+
+    best: Dict[str, float] = {node_id: get_duration(nodes[node_id]) for node_id in starts}
+    previous: Dict[str, str] = {}
+    for current in reversed(postorder):
+        length = best.get(current)
+        if length is None:
+            continue
+        for target in successors[current]:
+            candidate = length + get_duration(nodes[target])
+            if candidate > best.get(target, float("-inf")):
+                best[target] = candidate
+                previous[target] = current
+
+    reached = [node_id for node_id in ends if node_id in best]
+    if not reached:
+        return [], 0, loops
+    last = max(reached, key=best.__getitem__)
+    path = [last]
+    while path[-1] in previous:
+        path.append(previous[path[-1]])
+    path.reverse()
+    return [nodes[node_id] for node_id in path], best[last], loops
+
+
+class ProcessAnalytics(ModelObserver):
+    """Reachability, critical-path and dead-end analytics of process graphs
+
+    End nodes are the nodes of type "end", or the sinks if the graph has
+    none; start nodes likewise are of type "start", or the sources.
+    For every node the analytics keep the set of end nodes it reaches and
+    the set of start nodes reaching it. As an observer of ModelManager
+    (or of a graph) these sets are updated incrementally on node and edge
+    changes instead of being recomputed; the report with the critical
+    path is cached per graph version. Pass model_id for graphs served by
+    ModelManager whose model ID differs from the graph ID, so the state
+    follows that model's events and is dropped with it.
+    """
+
+    def __init__(self, duration: str = "duration"):
+        self.duration = duration
+        self._states: Dict[str, ProcessState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, graph: Any, model_id: Optional[str] = None) -> ProcessState:
+        """State of a graph, rebuilt if events were missed (caller holds the lock)"""
+        if not graph.directed:
+            raise ValueError("process analytics need a directed graph")
+        key = model_id or graph.id
+        state = self._states.get(key)
+        if state is None or state.graph is not graph:
+            state = ProcessState(graph)
+            self._states[key] = state
+        if state.stale or state.version != graph.version:
+            state.rebuild()
+        return state
+
+    def reachable_ends(self, graph: Any, node: Union[Node, str], model_id: Optional[str] = None) -> List[Node]:
+        """End nodes reachable from a node (including itself if it is one)"""
+        node = resolve_node(graph, node)
+        with self._lock:
+            end_ids = self._state(graph, model_id).ends.marked_in(node.id)
+        return [graph.get_node_by_id(node_id) for node_id in end_ids]
+
+    def is_reachable(self, graph: Any, node: Union[Node, str], model_id: Optional[str] = None) -> bool:
+        """Check whether a node is reachable from some start node"""
+        node = resolve_node(graph, node)
+        with self._lock:
+            return not self._state(graph, model_id).starts.is_empty(node.id)
+
+    def can_complete(self, graph: Any, node: Union[Node, str], model_id: Optional[str] = None) -> bool:
+        """Check whether some end node is reachable from a node"""
+        node = resolve_node(graph, node)
+        with self._lock:
+            return not self._state(graph, model_id).ends.is_empty(node.id)
+
+    def report(self, graph: Any, model_id: Optional[str] = None) -> Dict[str, Any]:
+        """Starts, ends, dead ends, unreachable nodes and the critical path, by node ID.
+
+        Dead ends are nodes from which no end node is reachable;
+        unreachable nodes cannot be reached from any start node.
+        """
+        with self._lock:
+            state = self._state(graph, model_id)
+            if state.report is not None:
+                return state.report
+            version = state.version
+            # graph order, so loops are cut the same way however the state came about
+            starts = [node.id for node in graph.nodes if node.id in state.starts.bit_of]
+            ends = [node.id for node in graph.nodes if node.id in state.ends.bit_of]
+            dead_ends = [node.id for node in graph.nodes if state.ends.is_empty(node.id)]
+            unreachable = [node.id for node in graph.nodes if state.starts.is_empty(node.id)]
+            path, length, loops = critical_path(graph, starts, ends, self.duration)
+            state.report = {
+                'version': version,
+                'starts': starts,
+                'ends': ends,
+                'dead_ends': dead_ends,
+                'unreachable': unreachable,
+                'critical_path': {
+                    'nodes': [node.id for node in path],
+                    'duration': length,
+                    'loops_ignored': loops
+                }
+            }
+            return state.report
+
+    def invalidate(self, key: str) -> None:
+        """Drop the analytics of a model (or graph)"""
+        with self._lock:
+            self._states.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all analytics"""
+        with self._lock:
+            self._states.clear()
+
+    def on_model_changed(self, event_type: ModelEvent, data: Dict[str, Any]) -> None:
+        key = event_cache_key(event_type, data)
+        if key is None:
+            return
+        if event_type in (ModelEvent.MODEL_REMOVED, ModelEvent.MODEL_EVICTED):
+            self.invalidate(key)
+            return
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or state.stale:
+                return
+            elements = event_elements(event_type, data)
+            if elements is None:
+                # cleared or reloaded
+                state.stale = True
+            elif event_type != ModelEvent.EDGE_UPDATED:
+                state.apply(event_type, elements)
+            else:
+                state.report = None
+                state.version = state.graph.version
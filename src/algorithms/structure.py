@@ -0,0 +1,257 @@
+"""
+Topological order, components, cycles and degree statistics
+"""
+
+from collections import deque
+from statistics import median
+from typing import Any, Dict, List, Optional
+
+from ..models.node import Node
+from .base import Adjacency, CycleError, is_frozen
+
+
+def topological_sort(graph: Any) -> List[Node]:
+    """Nodes ordered so every edge points forward (Kahn's algorithm).
+
+    Raises CycleError if the graph has a cycle and ValueError for
+    undirected graphs. On a FrozenGraph nodes are removed one level at a
+    time with array operations; the order may then differ from the
+    queue-based order but is equally valid.
+    """
+    if not graph.directed:
+        raise ValueError("topological order needs a directed graph")
+    if is_frozen(graph):
+        from .vectorized import topological_order
+        order, _ = topological_order(graph)
+        if len(order) < graph.node_count():
+            raise CycleError(find_cycle(graph))
+        nodes = graph.nodes
+        return [nodes[i] for i in order.tolist()]
+
+    adjacency = Adjacency(graph)
+    indegree = [len(sources) for sources in adjacency.incoming]
+    queue = deque(i for i, degree in enumerate(indegree) if degree == 0)
+    order = []
+    out = adjacency.out
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        for target in out[current]:
+            indegree[target] -= 1
+            if indegree[target] == 0:
+                queue.append(target)
+    if len(order) < len(adjacency.nodes):
+        raise CycleError(_find_cycle(adjacency))
+    nodes = adjacency.nodes
+    return [nodes[i] for i in order]
+
+
+def strongly_connected_components(graph: Any) -> List[List[Node]]:
+    """Strongly connected components (iterative Tarjan).
+
+    Components come in reverse topological order of the condensation:
+    no edge leads from a component to a later one. Undirected graphs
+    give their connected components.
+    """
+    if not graph.directed:
+        return connected_components(graph)
+    adjacency = Adjacency(graph)
+    out = adjacency.out
+    n = len(adjacency.nodes)
+    order = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+    for root in range(n):
+        if order[root] >= 0:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        # (node, position of the next successor to visit)
+        work = [[root, 0]]
+        while work:
+            frame = work[-1]
+            current, position = frame
+            successors = out[current]
+            if position < len(successors):
+                frame[1] = position + 1
+                successor = successors[position]
+                if order[successor] < 0:
+                    order[successor] = low[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack[successor] = True
+                    work.append([successor, 0])
+                elif on_stack[successor] and order[successor] < low[current]:
+                    low[current] = order[successor]
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[current] < low[parent]:
+                    low[parent] = low[current]
+            if low[current] == order[current]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == current:
+                        break
+                components.append(component)
+    nodes = adjacency.nodes
+    return [[nodes[i] for i in component] for component in components]
+
+
+def connected_components(graph: Any) -> List[List[Node]]:
+    """Connected components ignoring edge direction (weakly connected when directed).
+
+    Components are ordered by their first node in graph order, members in
+    graph order. Vectorized on a FrozenGraph.
+    """
+    if is_frozen(graph):
+        from .vectorized import components
+        labels = components(graph).tolist()
+        nodes = graph.nodes
+    else:
+        adjacency = Adjacency(graph)
+        nodes = adjacency.nodes
+        labels = [-1] * len(nodes)
+        count = 0
+        for seed in range(len(nodes)):
+            if labels[seed] >= 0:
+                continue
+            labels[seed] = count
+            stack = [seed]
+            while stack:
+                current = stack.pop()
+                for neighbor in adjacency.out[current] + adjacency.incoming[current]:
+                    if labels[neighbor] < 0:
+                        labels[neighbor] = count
+                        stack.append(neighbor)
+            count += 1
+    result: List[List[Node]] = [[] for _ in range(max(labels) + 1 if labels else 0)]
+    for node, label in zip(nodes, labels):
+        result[label].append(node)
+    return result
+
+
+def find_cycle(graph: Any) -> Optional[List[Node]]:
+    """Nodes of one cycle in path order, or None if the graph is acyclic.
+
+    In undirected graphs a cycle needs distinct edges, so parallel edges
+    and self loops count but going back along the same edge does not.
+    """
+    return _find_cycle(Adjacency(graph))
+
+
+def has_cycle(graph: Any) -> bool:
+    """Check whether the graph has a cycle (see find_cycle)"""
+    if graph.directed and is_frozen(graph):
+        from .vectorized import topological_order
+        order, _ = topological_order(graph)
+        return len(order) < graph.node_count()
+    return find_cycle(graph) is not None
+
+
+def _find_cycle(adjacency: Adjacency) -> Optional[List[Node]]:
+    """Iterative DFS; a neighbour on the current path closes a cycle"""
+    n = len(adjacency.nodes)
+    directed = adjacency.directed
+    # position on the current DFS path, -1 when not on it
+    on_path = [-1] * n
+    visited = [False] * n
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = True
+        on_path[root] = 0
+        path = [root]
+        # (neighbours, next position, parent edge still to be skipped)
+        work = [[adjacency.neighbors(root), 0, -1]]
+        while work:
+            frame = work[-1]
+            neighbors, position, parent = frame
+            if position == len(neighbors):
+                on_path[path.pop()] = -1
+                work.pop()
+                continue
+            frame[1] = position + 1
+            neighbor = neighbors[position]
+            if not directed and neighbor == parent:
+                # leave through the edge we came in by only once
+                frame[2] = -1
+                continue
+            if on_path[neighbor] >= 0:
+                return [adjacency.nodes[i] for i in path[on_path[neighbor]:]]
+            if not visited[neighbor]:
+                visited[neighbor] = True
+                on_path[neighbor] = len(path)
+                parent_of_next = path[-1]
+                path.append(neighbor)
+                work.append([adjacency.neighbors(neighbor), 0, parent_of_next])
+    return None
+
+
+def degree_stats(graph: Any, direction: str = "total") -> Dict[str, Any]:
+    """Summary of node degrees.
+
+    direction is "out", "in" or "total" (self loops count twice in
+    total). Returns count, min, max, mean, median, the number of isolated
+    nodes and a histogram {degree: number of nodes}. Vectorized on a
+    FrozenGraph.
+    """
+    if direction not in ("out", "in", "total"):
+        raise ValueError(f"Unknown direction: {direction}")
+    if is_frozen(graph):
+        import numpy as np
+        out_degrees = graph.out_degrees()
+        in_degrees = graph.in_degrees()
+        degrees = {"out": out_degrees, "in": in_degrees}.get(direction)
+        if degrees is None:
+            degrees = out_degrees + in_degrees
+        if not len(degrees):
+            return _empty_stats()
+        counts = np.bincount(degrees)
+        present = np.flatnonzero(counts)
+        return {
+            "count": int(len(degrees)),
+            "min": int(degrees.min()),
+            "max": int(degrees.max()),
+            "mean": float(degrees.mean()),
+            "median": float(np.median(degrees)),
+            "isolated": int(((out_degrees + in_degrees) == 0).sum()),
+            "histogram": dict(zip(present.tolist(), counts[present].tolist()))
+        }
+
+    adjacency = Adjacency(graph)
+    out_degrees = [len(targets) for targets in adjacency.out]
+    in_degrees = [len(sources) for sources in adjacency.incoming]
+    if direction == "out":
+        degrees = out_degrees
+    elif direction == "in":
+        degrees = in_degrees
+    else:
+        degrees = [a + b for a, b in zip(out_degrees, in_degrees)]
+    if not degrees:
+        return _empty_stats()
+    histogram: Dict[int, int] = {}
+    for degree in degrees:
+        histogram[degree] = histogram.get(degree, 0) + 1
+    return {
+        "count": len(degrees),
+        "min": min(degrees),
+        "max": max(degrees),
+        "mean": sum(degrees) / len(degrees),
+        "median": float(median(degrees)),
+        "isolated": sum(1 for a, b in zip(out_degrees, in_degrees) if a + b == 0),
+        "histogram": dict(sorted(histogram.items()))
+    }
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {"count": 0, "min": 0, "max": 0, "mean": 0.0, "median": 0.0, "isolated": 0, "histogram": {}}
@@ -0,0 +1,93 @@
+"""
+Breadth-first and depth-first traversal
+"""
+
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from ..models.node import Node
+from .base import Adjacency, frozen_index, is_frozen, resolve_node
+
+
+def bfs(graph: Any, start: Union[Node, str], max_depth: Optional[int] = None) -> List[Node]:
+    """Nodes reachable from start in breadth-first order (start first).
+
+    Follows edge direction in directed graphs; neighbours are visited in
+    get_neighbors order. max_depth limits the number of hops. Only the
+    reachable part of a Graph is touched; on a FrozenGraph each level is
+    expanded with array operations.
+    """
+    if is_frozen(graph):
+        from .vectorized import bfs as bfs_kernel
+        order, _, _ = bfs_kernel(graph, frozen_index(graph, start), -1 if max_depth is None else max_depth)
+        nodes = graph.nodes
+        return [nodes[i] for i in order.tolist()]
+    order, _, _ = bfs_tree(graph, resolve_node(graph, start), max_depth)
+    return order
+
+
+def bfs_depths(graph: Any, start: Union[Node, str], max_depth: Optional[int] = None) -> Dict[str, int]:
+    """Hop count from start to every reachable node, keyed by node ID"""
+    if is_frozen(graph):
+        from .vectorized import bfs as bfs_kernel
+        order, _, depth = bfs_kernel(graph, frozen_index(graph, start), -1 if max_depth is None else max_depth)
+        node_ids = graph.node_ids
+        return {node_ids[i]: d for i, d in zip(order.tolist(), depth[order].tolist())}
+    _, _, depth = bfs_tree(graph, resolve_node(graph, start), max_depth)
+    return depth
+
+
+def bfs_tree(
+    graph: Any,
+    start: Node,
+    max_depth: Optional[int] = None
+) -> Tuple[List[Node], Dict[str, Node], Dict[str, int]]:
+    """Queue-based BFS; returns visit order, parent and depth by node ID"""
+    depth = {start.id: 0}
+    parent: Dict[str, Node] = {}
+    order = [start]
+    queue = deque(order)
+    get_neighbors = graph.get_neighbors
+    while queue:
+        current = queue.popleft()
+        next_depth = depth[current.id] + 1
+        if max_depth is not None and next_depth > max_depth:
+            continue
+        for neighbor in get_neighbors(current):
+            if neighbor.id not in depth:
+                depth[neighbor.id] = next_depth
+                parent[neighbor.id] = current
+                order.append(neighbor)
+                queue.append(neighbor)
+    return order, parent, depth
+
+
+def dfs(graph: Any, start: Union[Node, str]) -> List[Node]:
+    """Nodes reachable from start in depth-first preorder (start first).
+
+    Visits neighbours in get_neighbors order, like the recursive
+    formulation, but uses an explicit stack so deep graphs are fine.
+    """
+    if is_frozen(graph):
+        adjacency = Adjacency(graph)
+        order = _preorder(adjacency.node_index(start), adjacency.neighbors, int)
+        nodes = adjacency.nodes
+        return [nodes[i] for i in order]
+    return _preorder(resolve_node(graph, start), graph.get_neighbors, lambda node: node.id)
+
+
+def _preorder(root: Any, neighbors: Callable[[Any], List[Any]], key: Callable[[Any], Hashable]) -> List[Any]:
+    seen = {key(root)}
+    order = [root]
+    stack = [iter(neighbors(root))]
+    while stack:
+        for neighbor in stack[-1]:
+            neighbor_key = key(neighbor)
+            if neighbor_key not in seen:
+                seen.add(neighbor_key)
+                order.append(neighbor)
+                stack.append(iter(neighbors(neighbor)))
+                break
+        else:
+            stack.pop()
+    return order
@@ -0,0 +1,183 @@
+"""
+Vectorized algorithm kernels over FrozenGraph CSR arrays
+"""
+
+from collections import deque
+from typing import Tuple
+
+import numpy as np
+
+
+def gather(offsets: np.ndarray, values: np.ndarray, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate values[offsets[i]:offsets[i + 1]] for every i in frontier.
+
+    Returns the gathered values and, for each, its position in frontier.
+    """
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    owners = np.repeat(np.arange(len(frontier)), counts)
+    # position of each gathered entry within its own slice
+    local = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return values[starts[owners] + local], owners
+
+
+def expand(frozen, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Neighbours of the frontier in graph neighbour order, with the frontier node they came from.
+
+    Undirected graphs list outgoing before incoming neighbours of each
+    node and skip self loops on the incoming side, like Graph.get_neighbors.
+    """
+    targets, owners = gather(frozen.offsets, frozen.targets, frontier)
+    if frozen.directed:
+        return targets, frontier[owners]
+    sources, in_owners = gather(frozen.in_offsets, frozen.sources, frontier)
+    keep = sources != frontier[in_owners]
+    sources, in_owners = sources[keep], in_owners[keep]
+    neighbours = np.concatenate((targets, sources))
+    owner_all = np.concatenate((owners, in_owners))
+    # stable sort by (frontier position, outgoing first)
+    key = owner_all * 2 + np.concatenate((np.zeros(len(targets), np.int64), np.ones(len(sources), np.int64)))
+    order = np.argsort(key, kind="stable")
+    return neighbours[order], frontier[owner_all[order]]
+
+
+def bfs(frozen, start: int, max_depth: int = -1, min_frontier: int = 64) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Level-synchronous BFS from start.
+
+    Returns visit order, parent (-1 for start and unreached nodes) and
+    depth (-1 for unreached nodes) arrays; visit order equals that of a
+    queue-based BFS. Levels smaller than min_frontier are expanded with
+    a plain queue, since array overhead dominates there.
+    """
+    n = frozen.node_count()
+    depth = np.full(n, -1, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+    depth[start] = 0
+    frontier = np.array([start], dtype=np.int64)
+    levels = [frontier]
+    level = 0
+    while len(frontier) and level != max_depth:
+        if len(frontier) < min_frontier:
+            levels.append(_queue_bfs(frozen, frontier, level, max_depth, depth, parent))
+            break
+        candidates, owners = expand(frozen, frontier)
+        fresh = depth[candidates] < 0
+        candidates, owners = candidates[fresh], owners[fresh]
+        if not len(candidates):
+            break
+        # keep the first discovery of each node, in discovery order
+        _, first = np.unique(candidates, return_index=True)
+        first.sort()
+        frontier = candidates[first].astype(np.int64)
+        level += 1
+        depth[frontier] = level
+        parent[frontier] = owners[first]
+        levels.append(frontier)
+    return np.concatenate(levels), parent, depth
+
+
+def _queue_bfs(frozen, frontier: np.ndarray, level: int, max_depth: int,
+               depth: np.ndarray, parent: np.ndarray) -> np.ndarray:
+    """Continue a BFS whose last discovered level is frontier; fills depth and parent"""
+    offsets = frozen.offsets.tolist()
+    targets = frozen.targets.tolist()
+    in_offsets = frozen.in_offsets.tolist()
+    sources = frozen.sources.tolist()
+    directed = frozen.directed
+    depths = depth.tolist()
+    parents = parent.tolist()
+    queue = deque(frontier.tolist())
+    order = []
+    while queue:
+        current = queue.popleft()
+        next_depth = depths[current] + 1
+        if next_depth - 1 == max_depth:
+            continue
+        neighbours = targets[offsets[current]:offsets[current + 1]]
+        if not directed:
+            neighbours = neighbours + [source for source in sources[in_offsets[current]:in_offsets[current + 1]]
+                                       if source != current]
+        for neighbour in neighbours:
+            if depths[neighbour] < 0:
+                depths[neighbour] = next_depth
+                parents[neighbour] = current
+                order.append(neighbour)
+                queue.append(neighbour)
+    depth[:] = depths
+    parent[:] = parents
+    return np.array(order, dtype=np.int64)
+
+
+def topological_order(frozen, min_frontier: int = 64) -> Tuple[np.ndarray, np.ndarray]:
+    """Kahn's algorithm, removing one level of sources at a time.
+
+    Long thin DAGs have many small levels where array overhead dominates,
+    so once a level is smaller than min_frontier the rest runs as a
+    queue over the CSR lists. Returns the sorted node indices and the
+    remaining in-degrees; nodes left with a positive in-degree lie on or
+    behind a cycle.
+    """
+    indegree = frozen.in_degrees().astype(np.int64)
+    frontier = np.flatnonzero(indegree == 0)
+    levels = [frontier]
+    while len(frontier) >= min_frontier:
+        targets, _ = gather(frozen.offsets, frozen.targets, frontier)
+        touched, counts = np.unique(targets, return_counts=True)
+        indegree[touched] -= counts
+        frontier = touched[indegree[touched] == 0]
+        levels.append(frontier)
+    if not len(frontier):
+        return np.concatenate(levels), indegree
+
+    # finish with a plain queue; the last level is already in levels
+    offsets = frozen.offsets.tolist()
+    targets = frozen.targets.tolist()
+    remaining = indegree.tolist()
+    queue = deque(frontier.tolist())
+    order = []
+    while queue:
+        current = queue.popleft()
+        for target in targets[offsets[current]:offsets[current + 1]]:
+            remaining[target] -= 1
+            if remaining[target] == 0:
+                order.append(target)
+                queue.append(target)
+    levels.append(np.array(order, dtype=np.int64))
+    return np.concatenate(levels), np.array(remaining, dtype=np.int64)
+
+
+def components(frozen) -> np.ndarray:
+    """Component label per node (weakly connected components when directed).
+
+    Labels are numbered in order of each component's first node.
+    """
+    n = frozen.node_count()
+    label = np.full(n, -1, dtype=np.int64)
+    # isolated nodes are components of their own without a search
+    isolated = (frozen.out_degrees() + frozen.in_degrees()) == 0
+    label[isolated] = np.arange(int(isolated.sum()))
+    count = int(isolated.sum())
+    for seed in np.flatnonzero(~isolated).tolist():
+        if label[seed] >= 0:
+            continue
+        label[seed] = count
+        frontier = np.array([seed], dtype=np.int64)
+        while len(frontier):
+            targets, _ = gather(frozen.offsets, frozen.targets, frontier)
+            sources, _ = gather(frozen.in_offsets, frozen.sources, frontier)
+            candidates = np.concatenate((targets, sources))
+            candidates = np.unique(candidates[label[candidates] < 0])
+            label[candidates] = count
+            frontier = candidates
+        count += 1
+    if n == 0:
+        return label
+    # renumber by first node
+    _, first, inverse = np.unique(label, return_index=True, return_inverse=True)
+    rank = np.empty(len(first), dtype=np.int64)
+    rank[np.argsort(first, kind="stable")] = np.arange(len(first))
+    return rank[inverse]
@@ -0,0 +1,16 @@
+"""
+Layout module for ExpresiVeNess.
+"""
+
+from .aggregation import GraphAggregator
+from .base import ILayout, LayoutRegistry
+from .layered import LayeredLayout
+from .tree import TreeLayout
+
+__all__ = [
+    "GraphAggregator",
+    "ILayout",
+    "LayoutRegistry",
+    "LayeredLayout",
+    "TreeLayout",
+]
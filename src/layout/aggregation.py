@@ -0,0 +1,287 @@
+"""
+Level-of-detail aggregation of graphs into supernodes
+"""
+
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from .tree import spanning_forest
+from ..models.graph import Graph, Node, Edge
+from ..models.observers import ModelEvent, ModelObserver, event_cache_key
+from ..models.position import Position
+
+STRATEGIES = ("type", "hierarchy", "community")
+
+
+def local_moving(neighbours: List[Dict[int, float]], loops: List[float], max_visits: int = 20) -> List[int]:
+    """Detect communities by greedy modularity optimization (the Louvain local moving phase).
+
+    Nodes move to the neighbouring community with the largest modularity
+    gain. Instead of sweeping all nodes until nothing moves, only the
+    neighbours of moved nodes are revisited (fast local moving), capped at
+    max_visits times the node count. loops holds the self-loop weight of
+    each node. Returns community numbers 0..c-1.
+    """
+    count = len(neighbours)
+    degree = [sum(adjacent.values()) + 2 * loop for adjacent, loop in zip(neighbours, loops)]
+    total = sum(degree)
+    community = list(range(count))
+    if not total:
+        return community
+    community_degree = degree[:]
+    queue = deque(v for v in range(count) if neighbours[v])
+    queued = [bool(adjacent) for adjacent in neighbours]
+    budget = max_visits * count
+    while queue and budget:
+        budget -= 1
+        v = queue.popleft()
+        queued[v] = False
+        adjacent = neighbours[v]
+        current = community[v]
+        community_degree[current] -= degree[v]
+        links: Dict[int, float] = {}
+        for w, weight in adjacent.items():
+            links[community[w]] = links.get(community[w], 0.0) + weight
+        scale = degree[v] / total
+        best = current
+        best_gain = links.get(current, 0.0) - community_degree[current] * scale
+        for candidate, weight in links.items():
+            gain = weight - community_degree[candidate] * scale
+            if gain > best_gain + 1e-12:
+                best = candidate
+                best_gain = gain
+        community_degree[best] += degree[v]
+        if best != current:
+            community[v] = best
+            for w in adjacent:
+                if not queued[w] and community[w] != best:
+                    queued[w] = True
+                    queue.append(w)
+
+    numbers: Dict[int, int] = {}
+    return [numbers.setdefault(label, len(numbers)) for label in community]
+
+
+def collapse(
+    graph: Graph,
+    nodes: List[Node],
+    group_of: List[int],
+    keys: List[str],
+    labels: List[str],
+    level: int,
+    group_by: str
+) -> Graph:
+    """Build the graph of groups.
+
+    Groups with one member keep the original node; larger groups become a
+    "supernode" at the centroid of its members, with the member count in
+    its properties. Edges between groups are merged into one edge per
+    group pair carrying the number of original edges as "count".
+    """
+    count = len(keys)
+    size = [0] * count
+    sum_x = [0.0] * count
+    sum_y = [0.0] * count
+    for node, group in zip(nodes, group_of):
+        size[group] += 1
+        position = node.position
+        sum_x[group] += position.x
+        sum_y[group] += position.y
+
+    index = {node.id: i for i, node in enumerate(nodes)}
+    internal = [0] * count
+    edge_counts: Dict[Tuple[int, int], int] = {}
+    for edge in graph.edges:
+        source = group_of[index[edge.source.id]]
+        target = group_of[index[edge.target.id]]
+        if source == target:
+            internal[source] += 1
+            continue
+        if not graph.directed and source > target:
+            source, target = target, source
+        edge_counts[(source, target)] = edge_counts.get((source, target), 0) + 1
+
+    members: List[Optional[Node]] = [None] * count
+    for node, group in zip(nodes, group_of):
+        if size[group] == 1:
+            members[group] = node
+    for group in range(count):
+        if members[group] is None:
+            supernode = Node(
+                label=f"{labels[group]} ({size[group]})",
+                node_type="supernode",
+                properties={
+                    "size": size[group],
+                    "group": keys[group],
+                    "internal_edges": internal[group]
+                },
+                position=Position(sum_x[group] / size[group], sum_y[group] / size[group]),
+                # stable IDs let clients animate between levels
+                node_id=f"super:{keys[group]}"
+            )
+            members[group] = supernode
+
+    aggregated = Graph(name=graph.name, directed=graph.directed, graph_id=graph.id)
+    aggregated.properties.update({"level": level, "group_by": group_by, "source_node_count": len(nodes)})
+    aggregated.add_nodes(members)
+    edges = []
+    for (source, target), edge_count in edge_counts.items():
+        edge = Edge(
+            source=members[source],
+            target=members[target],
+            edge_type="aggregate",
+            directed=graph.directed,
+            properties={"count": edge_count},
+            edge_id=f"{members[source].id}->{members[target].id}"
+        )
+        edges.append(edge)
+    aggregated.add_edges(edges)
+    return aggregated
+
+
+class GraphAggregator(ModelObserver):
+    """Multi-level aggregation of graphs, cached per graph version
+
+    Level 0 is the graph itself; each higher level is coarser:
+
+    - "type": one group per node_type (from level 1 on)
+    - "hierarchy": subtrees below depth max_depth - level collapse into
+      their root, so level 1 folds the leaves into their parents
+    - "community": Louvain-style modularity communities of the graph,
+      then of the community graph of the previous level, until it stops
+      shrinking
+
+    As an observer of ModelManager it drops the levels of a graph as soon
+    as the graph changes or is removed; levels are kept under the model ID
+    when given (what ModelManager events carry), else the graph ID.
+    """
+
+    def __init__(self):
+        # model (or graph) ID -> (version, {(group_by, level): graph}, community memberships)
+        self._entries: Dict[str, Tuple[int, Dict[Tuple[str, int], Graph], List[List[int]]]] = {}
+        self._lock = threading.Lock()
+
+    def aggregate(self, graph: Graph, level: int, group_by: str = "community",
+                  model_id: Optional[str] = None) -> Graph:
+        """Get the aggregated graph at a level of detail"""
+        if group_by not in STRATEGIES:
+            raise ValueError(f"Unknown grouping: {group_by}")
+        if level < 0:
+            raise ValueError("Level must be non-negative")
+        if level == 0:
+            return graph
+
+        key = model_id or graph.id
+        version = graph.version
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                entry = (version, {}, [])
+                self._entries[key] = entry
+        cached = entry[1].get((group_by, level))
+        if cached is not None:
+            return cached
+
+        nodes = list(graph.nodes)
+        if group_by == "type":
+            group_of, keys, labels = self._group_by_type(nodes)
+        elif group_by == "hierarchy":
+            group_of, keys, labels = self._group_by_subtree(graph, nodes, level)
+        else:
+            memberships = list(entry[2])
+            group_of, keys, labels = self._group_by_community(graph, nodes, level, memberships)
+        aggregated = collapse(graph, nodes, group_of, keys, labels, level, group_by)
+
+        # Only store if the graph did not change while aggregating
+        if graph.version == version:
+            with self._lock:
+                entry[1][(group_by, level)] = aggregated
+                if group_by == "community" and len(memberships) > len(entry[2]):
+                    entry[2][:] = memberships
+        return aggregated
+
+    def invalidate(self, key: str) -> None:
+        """Drop cached levels of a model (or graph)"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached levels"""
+        with self._lock:
+            self._entries.clear()
+
+    def on_model_changed(self, event_type: ModelEvent, data: Dict[str, Any]) -> None:
+        key = event_cache_key(event_type, data)
+        if key is not None:
+            self.invalidate(key)
+
+    @staticmethod
+    def _group_by_type(nodes: List[Node]) -> Tuple[List[int], List[str], List[str]]:
+        groups: Dict[str, int] = {}
+        group_of = [groups.setdefault(node.node_type, len(groups)) for node in nodes]
+        types = list(groups)
+        return group_of, [f"type:{node_type}" for node_type in types], types
+
+    @staticmethod
+    def _group_by_subtree(graph: Graph, nodes: List[Node], level: int) -> Tuple[List[int], List[str], List[str]]:
+        _, depth, children = spanning_forest(graph)
+        cut = max(max(depth, default=0) - level, 0)
+        root_of = list(range(len(nodes)))
+        stack = [v for v in range(len(nodes)) if depth[v] == 0]
+        while stack:
+            v = stack.pop()
+            for child in children[v]:
+                if depth[child] > cut:
+                    root_of[child] = root_of[v]
+                stack.append(child)
+
+        groups: Dict[int, int] = {}
+        group_of = [groups.setdefault(root, len(groups)) for root in root_of]
+        roots = list(groups)
+        return group_of, [f"subtree:{nodes[root].id}" for root in roots], [nodes[root].label for root in roots]
+
+    @staticmethod
+    def _group_by_community(
+        graph: Graph,
+        nodes: List[Node],
+        level: int,
+        memberships: List[List[int]]
+    ) -> Tuple[List[int], List[str], List[str]]:
+        """Communities of a level; coarser levels are built on the cached finer ones"""
+        index = {node.id: i for i, node in enumerate(nodes)}
+        pairs = [(index[edge.source.id], index[edge.target.id]) for edge in graph.edges]
+        while len(memberships) < level:
+            current = memberships[-1] if memberships else list(range(len(nodes)))
+            count = max(current, default=-1) + 1
+            neighbours: List[Dict[int, float]] = [{} for _ in range(count)]
+            loops = [0.0] * count
+            for source, target in pairs:
+                source = current[source]
+                target = current[target]
+                if source == target:
+                    loops[source] += 1.0
+                else:
+                    neighbours[source][target] = neighbours[source].get(target, 0.0) + 1.0
+                    neighbours[target][source] = neighbours[target].get(source, 0.0) + 1.0
+            communities = local_moving(neighbours, loops)
+            if max(communities, default=-1) + 1 == count:
+                # no further merging possible
+                break
+            memberships.append([communities[c] for c in current])
+
+        degree = [0] * len(nodes)
+        for source, target in pairs:
+            degree[source] += 1
+            degree[target] += 1
+        group_of = memberships[min(level, len(memberships)) - 1] if memberships else list(range(len(nodes)))
+        # name each community after its best connected member
+        representative: Dict[int, int] = {}
+        for v, group in enumerate(group_of):
+            best = representative.get(group)
+            if best is None or degree[v] > degree[best]:
+                representative[group] = v
+        order = [representative[group] for group in range(len(representative))]
+        return (group_of,
+                [f"community:{nodes[v].id}" for v in order],
+                [nodes[v].label for v in order])
@@ -0,0 +1,140 @@
+"""
+Basic layout interfaces and registry
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+from ..models.graph import Graph
+
+
+class ILayout(ABC):
+    """Interface for layout algorithms"""
+
+    @abstractmethod
+    def get_layout_name(self) -> str:
+        """Get layout name"""
+        pass
+
+    @abstractmethod
+    def compute(self, graph: Graph, **options: Any) -> Dict[str, Tuple[float, float]]:
+        """Compute positions, mapping node ID to (x, y)"""
+        pass
+
+    def apply(self, graph: Graph, **options: Any) -> Dict[str, Tuple[float, float]]:
+        """Compute positions and write them into the graph nodes"""
+        positions = self.compute(graph, **options)
+        with graph.batch():
+            for node_id, (x, y) in positions.items():
+                node = graph.get_node_by_id(node_id)
+                if node is not None:
+                    graph.move_node(node, x, y)
+        return positions
+
+
+class LayoutRegistry:
+    """Simple registry for layout algorithms
+
+    Applied layouts are cached per graph: the graph version after applying
+    is remembered, so applying the same layout with the same options again
+    is a no-op until the graph changes. Layouts that are only computed
+    (not written into the graph) are cached the same way.
+    """
+
+    # Preferred layout for graphs of a syntax
+    SYNTAX_LAYOUTS = {
+        "hierarchy": "tree",
+        "process": "layered",
+    }
+
+    def __init__(self):
+        self._layouts: Dict[str, ILayout] = {}
+        # model (or graph) ID -> (layout name, options key, version, positions)
+        self._applied: Dict[str, Tuple[str, str, int, Dict[str, Tuple[float, float]]]] = {}
+        # same for computed layouts, which leave the graph untouched
+        self._computed: Dict[str, Tuple[str, str, int, Dict[str, Tuple[float, float]]]] = {}
+        self._lock = threading.Lock()
+        self._register_default_layouts()
+
+    def register_layout(self, layout: ILayout):
+        """Register layout algorithm"""
+        self._layouts[layout.get_layout_name()] = layout
+
+    def get_layout(self, layout_name: str) -> ILayout:
+        """Get layout by name"""
+        if layout_name not in self._layouts:
+            raise ValueError(f"Unknown layout: {layout_name}")
+        return self._layouts[layout_name]
+
+    def get_available_layouts(self) -> List[str]:
+        """Get list of available layout names"""
+        return list(self._layouts.keys())
+
+    def default_layout_for(self, syntax: Optional[str] = None) -> str:
+        """Get name of the preferred layout for a syntax"""
+        name = self.SYNTAX_LAYOUTS.get(syntax)
+        if name in self._layouts:
+            return name
+        return "force" if "force" in self._layouts else "layered"
+
+    def apply_layout(self, graph: Graph, layout_name: str, *, model_id: Optional[str] = None,
+                     **options: Any) -> Dict[str, Tuple[float, float]]:
+        """Lay out graph with the named algorithm, reusing the cached result if unchanged
+
+        Results are cached under model_id if given, else the graph ID.
+        """
+        layout = self.get_layout(layout_name)
+        positions = self.get_applied(graph, layout_name, model_id=model_id, **options)
+        if positions is not None:
+            return positions
+
+        positions = layout.apply(graph, **options)
+        with self._lock:
+            self._applied[model_id or graph.id] = (layout_name, repr(sorted(options.items())), graph.version, positions)
+        return positions
+
+    def compute_layout(self, graph: Graph, layout_name: str, *, model_id: Optional[str] = None,
+                       **options: Any) -> Dict[str, Tuple[float, float]]:
+        """Get positions of the named layout without moving the graph nodes"""
+        layout = self.get_layout(layout_name)
+        key = repr(sorted(options.items()))
+        version = graph.version
+        with self._lock:
+            cached = self._computed.get(model_id or graph.id)
+        if cached is not None and cached[:3] == (layout_name, key, version):
+            return cached[3]
+        positions = self.get_applied(graph, layout_name, model_id=model_id, **options)
+        if positions is None:
+            positions = layout.compute(graph, **options)
+        with self._lock:
+            self._computed[model_id or graph.id] = (layout_name, key, version, positions)
+        return positions
+
+    def get_applied(self, graph: Graph, layout_name: str, *, model_id: Optional[str] = None,
+                    **options: Any) -> Optional[Dict[str, Tuple[float, float]]]:
+        """Get cached positions if the graph is unchanged since the layout was applied"""
+        with self._lock:
+            cached = self._applied.get(model_id or graph.id)
+        if (cached is None or cached[0] != layout_name or cached[2] != graph.version
+                or cached[1] != repr(sorted(options.items()))):
+            return None
+        return cached[3]
+
+    def invalidate(self, key: str) -> None:
+        """Drop the cached layout of a model (or graph)"""
+        with self._lock:
+            self._applied.pop(key, None)
+            self._computed.pop(key, None)
+
+    def _register_default_layouts(self):
+        """Register default layouts"""
+        from .layered import LayeredLayout
+        from .tree import TreeLayout
+        self.register_layout(TreeLayout())
+        self.register_layout(LayeredLayout())
+        try:
+            # requires numpy
+            from .force import ForceDirectedLayout
+            self.register_layout(ForceDirectedLayout())
+        except ImportError:
+            pass
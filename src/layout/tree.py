@@ -0,0 +1,206 @@
+"""
+Tidy tree layout for hierarchies
+"""
+
+from collections import deque
+from typing import Dict, List, Tuple
+
+from .base import ILayout
+from ..models.graph import Graph
+
+
+def spanning_forest(graph: Graph) -> Tuple[List[str], List[int], List[List[int]]]:
+    """Get node IDs, BFS depths and child lists of a spanning forest.
+
+    Roots are the nodes without incoming edges. A node with several parents
+    is placed under the first one reached, and nodes reachable only through
+    a cycle start a new tree from the first of them in graph order.
+    """
+    node_ids = [node.id for node in graph.nodes]
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    n = len(node_ids)
+    adjacent: List[List[int]] = [[] for _ in range(n)]
+    has_parent = [False] * n
+    for edge in graph.edges:
+        source = index[edge.source.id]
+        target = index[edge.target.id]
+        if source != target:
+            adjacent[source].append(target)
+            has_parent[target] = True
+
+    depth = [-1] * n
+    children: List[List[int]] = [[] for _ in range(n)]
+    roots = [i for i in range(n) if not has_parent[i]]
+    roots.extend(range(n))
+    for root in roots:
+        if depth[root] >= 0:
+            continue
+        depth[root] = 0
+        queue = deque([root])
+        while queue:
+            current = queue.popleft()
+            for child in adjacent[current]:
+                if depth[child] < 0:
+                    depth[child] = depth[current] + 1
+                    children[current].append(child)
+                    queue.append(child)
+    return node_ids, depth, children
+
+
+class TreeLayout(ILayout):
+    """Tidy tree layout (Reingold-Tilford, with Buchheim's linear-time apportion)
+
+    Parents are centred over their children, subtrees are packed as close
+    as node_spacing allows and identical subtrees get identical shapes.
+    Runs in O(N) without recursion, so deep hierarchies are fine.
+
+    Options:
+        node_spacing: Minimum distance between neighbouring nodes of a level (default 80)
+        level_spacing: Distance between levels (default 100)
+        direction: "top-down" or "left-right" (default "top-down")
+        padding: Offset of the top-left corner of the result (default 50)
+    """
+
+    def get_layout_name(self) -> str:
+        return "tree"
+
+    def compute(
+        self,
+        graph: Graph,
+        node_spacing: float = 80.0,
+        level_spacing: float = 100.0,
+        direction: str = "top-down",
+        padding: float = 50.0
+    ) -> Dict[str, Tuple[float, float]]:
+        if direction not in ("top-down", "left-right"):
+            raise ValueError(f"Unknown direction: {direction}")
+        node_ids, depth, children = spanning_forest(graph)
+        n = len(node_ids)
+        if n == 0:
+            return {}
+
+        # A virtual root joins the forest into one tree
+        root = n
+        children.append([i for i in range(n) if depth[i] == 0])
+        x = self._tidy_x(children, root, node_spacing)
+
+        min_x = min(x[:n])
+        positions = {}
+        for i, node_id in enumerate(node_ids):
+            along = x[i] - min_x + padding
+            across = depth[i] * level_spacing + padding
+            positions[node_id] = (along, across) if direction == "top-down" else (across, along)
+        return positions
+
+    @staticmethod
+    def _tidy_x(children: List[List[int]], root: int, distance: float) -> List[float]:
+        """Compute x coordinates of all nodes of the tree below root."""
+        size = len(children)
+        parent = [-1] * size
+        number = [0] * size  # 1-based position among siblings
+        for v in range(size):
+            for i, w in enumerate(children[v], 1):
+                parent[w] = v
+                number[w] = i
+
+        prelim = [0.0] * size
+        mod = [0.0] * size
+        shift = [0.0] * size
+        change = [0.0] * size
+        thread = [-1] * size
+        ancestor = list(range(size))
+        default_ancestor = [-1] * size
+
+        def left_sibling(v: int) -> int:
+            return children[parent[v]][number[v] - 2] if number[v] > 1 else -1
+
+        def next_left(v: int) -> int:
+            return children[v][0] if children[v] else thread[v]
+
+        def next_right(v: int) -> int:
+            return children[v][-1] if children[v] else thread[v]
+
+        def apportion(v: int, default: int) -> int:
+            w = left_sibling(v)
+            if w < 0:
+                return default
+            vir = vor = v
+            vil = w
+            vol = children[parent[v]][0]
+            sir = mod[vir]
+            sor = mod[vor]
+            sil = mod[vil]
+            sol = mod[vol]
+            while next_right(vil) >= 0 and next_left(vir) >= 0:
+                vil = next_right(vil)
+                vir = next_left(vir)
+                vol = next_left(vol)
+                vor = next_right(vor)
+                ancestor[vor] = v
+                gap = (prelim[vil] + sil) - (prelim[vir] + sir) + distance
+                if gap > 0:
+                    left = ancestor[vil] if parent[ancestor[vil]] == parent[v] else default
+                    subtrees = number[v] - number[left]
+                    change[v] -= gap / subtrees
+                    shift[v] += gap
+                    change[left] += gap / subtrees
+                    prelim[v] += gap
+                    mod[v] += gap
+                    sir += gap
+                    sor += gap
+                sil += mod[vil]
+                sir += mod[vir]
+                sol += mod[vol]
+                sor += mod[vor]
+            if next_right(vil) >= 0 and next_right(vor) < 0:
+                thread[vor] = next_right(vil)
+                mod[vor] += sil - sor
+            if next_left(vir) >= 0 and next_left(vol) < 0:
+                thread[vol] = next_left(vir)
+                mod[vol] += sir - sol
+                default = v
+            return default
+
+        # First walk in post-order: preliminary x relative to the parent
+        stack = [(root, 0)]
+        while stack:
+            v, next_child = stack.pop()
+            if next_child < len(children[v]):
+                stack.append((v, next_child + 1))
+                stack.append((children[v][next_child], 0))
+                continue
+
+            w = left_sibling(v)
+            if children[v]:
+                # execute shifts accumulated by apportion
+                total_shift = 0.0
+                total_change = 0.0
+                for child in reversed(children[v]):
+                    prelim[child] += total_shift
+                    mod[child] += total_shift
+                    total_change += change[child]
+                    total_shift += shift[child] + total_change
+                midpoint = (prelim[children[v][0]] + prelim[children[v][-1]]) / 2
+                if w >= 0:
+                    prelim[v] = prelim[w] + distance
+                    mod[v] = prelim[v] - midpoint
+                else:
+                    prelim[v] = midpoint
+            elif w >= 0:
+                prelim[v] = prelim[w] + distance
+
+            if v != root:
+                p = parent[v]
+                if number[v] == 1:
+                    default_ancestor[p] = v
+                default_ancestor[p] = apportion(v, default_ancestor[p])
+
+        # Second walk in pre-order: absolute x from accumulated modifiers
+        x = [0.0] * size
+        stack = [(root, 0.0)]
+        while stack:
+            v, offset = stack.pop()
+            x[v] = prelim[v] + offset
+            for child in children[v]:
+                stack.append((child, offset + mod[v]))
+        return x
@@ -0,0 +1,322 @@
+"""
+Compact binary graph file format
+
+Layout (all integers little-endian)::
+
+    header   magic b"EXPG", uint16 format version, uint16 flags,
+             uint32 section count
+    table    per section: 4-byte tag, uint64 offset, uint64 length
+    sections 8-byte aligned payloads
+
+Strings (IDs, labels, types, JSON-encoded properties) are stored once in
+the STRS string table and referenced by uint32 index everywhere else.
+Node and edge attributes are stored as columns; edges refer to nodes by
+uint32 index. Canonical UUID IDs are packed as 16 bytes (NIDU/EIDU),
+other IDs go through the string table (NIDS/EIDS). Readers skip
+sections with unknown tags, so new sections can be added without
+breaking older files.
+
+Version 2 adds indexes for reading a file in place (see models.mapped):
+CSR adjacency (OOFF/OEDG by source, IOFF/IEDG by target) and node and
+edge indices sorted by ID (NIDX/EIDX) for binary search.
+"""
+
+import json
+import re
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .graph import Graph
+from .node import Node
+from .edge import Edge
+from .position import Position
+
+MAGIC = b"EXPG"
+FORMAT_VERSION = 2
+# uint32 index meaning "no string" (e.g. no properties)
+NONE = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4sHHI")
+_SECTION = struct.Struct("<4sQQ")
+# graph id, name, properties, directed, version, node count, edge count
+_META = struct.Struct("<IIIBxxxQII")
+
+
+class BinaryFormatError(ValueError):
+    """Raised when a file is not a readable binary graph"""
+    pass
+
+
+class StringTable:
+    """Interning table mapping strings to uint32 indices"""
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def add(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self._index[value] = index
+            self.strings.append(value)
+        return index
+
+    def add_json(self, value: Optional[Dict[str, Any]]) -> int:
+        """Intern a properties dict as compact JSON (NONE if empty)"""
+        if not value:
+            return NONE
+        return self.add(json.dumps(value, separators=(',', ':'), sort_keys=True))
+
+    def to_bytes(self) -> bytes:
+        encoded = [value.encode("utf-8") for value in self.strings]
+        offsets = array("I", [0])
+        total = 0
+        for value in encoded:
+            total += len(value)
+            offsets.append(total)
+        return struct.pack("<I", len(encoded)) + _to_le(offsets) + b"".join(encoded)
+
+
+def _to_le(values: array) -> bytes:
+    """Array contents as little-endian bytes"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le(typecode: str, data: Union[bytes, memoryview]) -> array:
+    """Array from little-endian bytes"""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+_UUIDS = re.compile(r"(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})*")
+
+
+def _pack_ids(ids: List[str], strings: StringTable, tag: str) -> Tuple[str, bytes]:
+    """Pack IDs as 16-byte UUIDs if all are canonical, else as string indices"""
+    joined = "".join(ids)
+    if len(joined) == 36 * len(ids) and _UUIDS.fullmatch(joined):
+        return tag + "U", bytes.fromhex(joined.replace("-", ""))
+    return tag + "S", _to_le(array("I", (strings.add(value) for value in ids)))
+
+
+def _unpack_ids(sections: Dict[str, memoryview], tag: str, count: int, strings: List[str]) -> List[str]:
+    packed = sections.get(tag + "U")
+    if packed is not None:
+        raw = bytes(packed)
+        # uuid.UUID(bytes=...) is slow; format the hex directly
+        hexed = raw.hex()
+        return [f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+                for h in (hexed[i:i + 32] for i in range(0, count * 32, 32))]
+    return [strings[i] for i in _from_le("I", _require(sections, tag + "S"))]
+
+
+def _require(sections: Dict[str, memoryview], tag: str) -> memoryview:
+    section = sections.get(tag)
+    if section is None:
+        raise BinaryFormatError(f"missing section {tag}")
+    return section
+
+
+def write_sections(version: int, sections: Iterable[Tuple[str, bytes]]) -> bytes:
+    """Assemble header, section table and 8-byte aligned payloads"""
+    sections = list(sections)
+    position = _HEADER.size + _SECTION.size * len(sections)
+    table = []
+    payload = []
+    for tag, data in sections:
+        padding = -position % 8
+        payload.append(b"\0" * padding)
+        position += padding
+        table.append(_SECTION.pack(tag.encode("ascii"), position, len(data)))
+        payload.append(data)
+        position += len(data)
+    return _HEADER.pack(MAGIC, version, 0, len(sections)) + b"".join(table) + b"".join(payload)
+
+
+def read_sections(data: Union[bytes, memoryview], max_version: int = FORMAT_VERSION) -> Tuple[int, Dict[str, memoryview]]:
+    """Parse header and section table; returns format version and tag -> payload"""
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise BinaryFormatError("file too short")
+    magic, version, _, count = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise BinaryFormatError("not a binary graph file")
+    if version > max_version:
+        raise BinaryFormatError(f"unsupported format version {version}")
+    sections = {}
+    for i in range(count):
+        tag, offset, length = _SECTION.unpack_from(view, _HEADER.size + i * _SECTION.size)
+        if offset + length > len(view):
+            raise BinaryFormatError(f"truncated section {tag!r}")
+        sections[tag.decode("ascii")] = view[offset:offset + length]
+    return version, sections
+
+
+def read_strings(section: memoryview) -> List[str]:
+    """Decode the STRS string table"""
+    (count,) = struct.unpack_from("<I", section, 0)
+    offsets = _from_le("I", section[4:4 + 4 * (count + 1)])
+    blob = bytes(section[4 + 4 * (count + 1):])
+    if blob.isascii():
+        # byte offsets equal character offsets
+        text = blob.decode("ascii")
+        return [text[offsets[i]:offsets[i + 1]] for i in range(count)]
+    return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(count)]
+
+
+def group_by_key(keys: array, count: int) -> Tuple[array, array]:
+    """Group item indices by key in 0..count-1 (counting sort).
+
+    Returns CSR offsets (count + 1) and the item indices ordered by key;
+    items with equal keys keep their order.
+    """
+    offsets = array("I", bytes(4 * (count + 1)))
+    for key in keys:
+        offsets[key + 1] += 1
+    for i in range(count):
+        offsets[i + 1] += offsets[i]
+    fill = offsets[:-1]
+    items = array("I", bytes(4 * len(keys)))
+    for item, key in enumerate(keys):
+        items[fill[key]] = item
+        fill[key] += 1
+    return offsets, items
+
+
+def graph_sections(graph: Graph) -> Tuple[List[Tuple[str, bytes]], StringTable]:
+    """Encode the sections of a graph (without the string table)"""
+    strings = StringTable()
+    nodes = list(graph.nodes)
+    edges = list(graph.edges)
+    index = {node.id: i for i, node in enumerate(nodes)}
+
+    meta = _META.pack(
+        strings.add(graph.id), strings.add(graph.name), strings.add_json(graph.properties),
+        1 if graph.directed else 0, graph.version, len(nodes), len(edges)
+    )
+    node_ids = _pack_ids([node.id for node in nodes], strings, "NID")
+    positions = array("d")
+    nan = float("nan")
+    for node in nodes:
+        # lazily allocated positions stay absent (NaN)
+        position = node._position
+        if position is None:
+            positions.append(nan)
+            positions.append(nan)
+        else:
+            positions.append(position.x)
+            positions.append(position.y)
+    edge_ids = _pack_ids([edge.id for edge in edges], strings, "EID")
+    sources = array("I", (index[edge.source.id] for edge in edges))
+    targets = array("I", (index[edge.target.id] for edge in edges))
+    out_offsets, out_edges = group_by_key(sources, len(nodes))
+    in_offsets, in_edges = group_by_key(targets, len(nodes))
+    node_order = array("I", sorted(range(len(nodes)), key=[node.id for node in nodes].__getitem__))
+    edge_order = array("I", sorted(range(len(edges)), key=[edge.id for edge in edges].__getitem__))
+
+    sections = [
+        ("META", meta),
+        node_ids,
+        ("NLBL", _to_le(array("I", (strings.add(node.label) for node in nodes)))),
+        ("NTYP", _to_le(array("I", (strings.add(node.node_type) for node in nodes)))),
+        ("NPRP", _to_le(array("I", (strings.add_json(node._properties) for node in nodes)))),
+        ("NPOS", _to_le(positions)),
+        edge_ids,
+        ("ESRC", _to_le(sources)),
+        ("ETGT", _to_le(targets)),
+        ("ETYP", _to_le(array("I", (strings.add(edge.edge_type) for edge in edges)))),
+        ("ELBL", _to_le(array("I", (strings.add(edge.label) for edge in edges)))),
+        ("EPRP", _to_le(array("I", (strings.add_json(edge._properties) for edge in edges)))),
+        ("EDIR", bytes(1 if edge.directed else 0 for edge in edges)),
+        ("OOFF", _to_le(out_offsets)),
+        ("OEDG", _to_le(out_edges)),
+        ("IOFF", _to_le(in_offsets)),
+        ("IEDG", _to_le(in_edges)),
+        ("NIDX", _to_le(node_order)),
+        ("EIDX", _to_le(edge_order)),
+    ]
+    return sections, strings
+
+
+def dumps(graph: Graph) -> bytes:
+    """Serialize a graph to the binary format"""
+    sections, strings = graph_sections(graph)
+    # the string table is complete only after all columns are encoded
+    sections.insert(0, ("STRS", strings.to_bytes()))
+    return write_sections(FORMAT_VERSION, sections)
+
+
+def loads(data: Union[bytes, memoryview]) -> Graph:
+    """Deserialize a graph from the binary format"""
+    _, sections = read_sections(data)
+    strings = read_strings(_require(sections, "STRS"))
+    graph_id, name, properties, directed, version, node_count, edge_count = \
+        _META.unpack_from(_require(sections, "META"), 0)
+
+    graph = Graph(name=strings[name], directed=bool(directed), graph_id=strings[graph_id])
+    if properties != NONE:
+        graph.properties.update(json.loads(strings[properties]))
+
+    node_ids = _unpack_ids(sections, "NID", node_count, strings)
+    labels = _from_le("I", _require(sections, "NLBL"))
+    types = _from_le("I", _require(sections, "NTYP"))
+    node_props = _from_le("I", _require(sections, "NPRP"))
+    positions = _from_le("d", _require(sections, "NPOS"))
+    nodes = []
+    new_node = Node.__new__
+    xs = positions[0::2]
+    ys = positions[1::2]
+    for node_id, label, node_type, prop, x, y in zip(node_ids, labels, types, node_props, xs, ys):
+        # bypass __init__: IDs are known and strings are already shared
+        node = new_node(Node)
+        node.id = node_id
+        node.label = strings[label]
+        node.node_type = strings[node_type]
+        node._properties = None if prop == NONE else json.loads(strings[prop])
+        node._position = Position(x, y) if x == x else None
+        nodes.append(node)
+
+    edge_ids = _unpack_ids(sections, "EID", edge_count, strings)
+    sources = _from_le("I", _require(sections, "ESRC"))
+    targets = _from_le("I", _require(sections, "ETGT"))
+    edge_types = _from_le("I", _require(sections, "ETYP"))
+    edge_labels = _from_le("I", _require(sections, "ELBL"))
+    edge_props = _from_le("I", _require(sections, "EPRP"))
+    directions = bytes(_require(sections, "EDIR"))
+    edges = []
+    new_edge = Edge.__new__
+    for edge_id, source, target, edge_type, label, prop, directed in zip(
+            edge_ids, sources, targets, edge_types, edge_labels, edge_props, directions):
+        edge = new_edge(Edge)
+        edge.id = edge_id
+        edge.source = nodes[source]
+        edge.target = nodes[target]
+        edge.edge_type = strings[edge_type]
+        edge.directed = directed == 1
+        edge.label = strings[label]
+        edge._properties = None if prop == NONE else json.loads(strings[prop])
+        edges.append(edge)
+
+    graph._populate(nodes, edges, version)
+    return graph
+
+
+def save(graph: Graph, path: str) -> None:
+    """Write a graph to a binary file"""
+    with open(path, "wb") as file:
+        file.write(dumps(graph))
+
+
+def load(path: str) -> Graph:
+    """Read a graph from a binary file"""
+    with open(path, "rb") as file:
+        return loads(file.read())
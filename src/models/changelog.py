@@ -0,0 +1,100 @@
+"""
+Bounded change log for incremental graph sync
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class ChangeLog:
+    """Bounded log of node and edge changes keyed by graph version.
+
+    Entries hold element references, so a delta always serializes the
+    current state of an element. When the log is full the oldest entries
+    are dropped and deltas from before them are no longer available.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        # (version, op, kind, element)
+        self._entries: Deque[Tuple[int, str, str, Any]] = deque(maxlen=max_entries)
+        # deltas can be computed for any version >= base_version
+        self.base_version = 0
+        # readers (e.g. event streams) may run on other threads than writers
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickles and copies without the lock."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def record(self, version: int, op: str, kind: str, element: Any) -> None:
+        """Record a change (op is 'added', 'removed' or 'updated')."""
+        with self._lock:
+            if len(self._entries) == self.max_entries:
+                self.base_version = self._entries[0][0]
+            self._entries.append((version, op, kind, element))
+
+    def reset(self, version: int) -> None:
+        """Forget all entries; only deltas from version onwards are available."""
+        with self._lock:
+            self._entries.clear()
+            self.base_version = version
+
+    def entries_since(self, version: int) -> Optional[List[Tuple[int, str, str, Any]]]:
+        """Get entries newer than version, or None if the log was truncated."""
+        with self._lock:
+            if version < self.base_version:
+                return None
+            newer = []
+            for entry in reversed(self._entries):
+                if entry[0] <= version:
+                    break
+                newer.append(entry)
+        newer.reverse()
+        return newer
+
+    def delta_since(self, version: int) -> Optional[Dict[str, Dict[str, List[Any]]]]:
+        """Get the net node/edge changes since version, or None if truncated.
+
+        Returns ``{"nodes": {"updated": [...], "removed": [...]}, "edges": {...}}``
+        where updated holds serialized elements (added or changed) and removed
+        holds element IDs.
+        """
+        entries = self.entries_since(version)
+        if entries is None:
+            return None
+
+        # (kind, id) -> [first op, last op, element]
+        net: Dict[Tuple[str, str], List[Any]] = {}
+        for _, op, kind, element in entries:
+            key = (kind, element.id)
+            state = net.get(key)
+            if state is None:
+                net[key] = [op, op, element]
+            else:
+                state[1] = op
+                state[2] = element
+
+        delta = {
+            "nodes": {"updated": [], "removed": []},
+            "edges": {"updated": [], "removed": []},
+        }
+        for (kind, element_id), (first_op, last_op, element) in net.items():
+            changes = delta[kind]
+            if last_op == "removed":
+                # elements added and removed within the window never reached the client
+                if first_op != "added":
+                    changes["removed"].append(element_id)
+            else:
+                changes["updated"].append(element.to_dict())
+        return delta
+
+    def __len__(self) -> int:
+        return len(self._entries)
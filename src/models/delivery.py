@@ -0,0 +1,169 @@
+"""
+Asynchronous, backpressured observer delivery
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor
+from enum import Enum
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from .observers import EventCoalescer, ModelEvent, ModelObserver
+
+
+class OverflowPolicy(Enum):
+    """What to do when an observer queue is full"""
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+
+class ObserverChannel:
+    """Bounded event queue feeding one observer from an executor
+
+    Events are enqueued by the notifying thread and drained by a single
+    executor task at a time, so one observer never runs concurrently with
+    itself and a slow observer only fills its own queue. A full queue is
+    coalesced by default; BLOCK waits at most block_timeout seconds, and
+    never when the observer itself causes the event while being notified.
+    """
+
+    def __init__(
+        self,
+        observer: ModelObserver,
+        executor: Executor,
+        max_queue: int = 1000,
+        overflow: OverflowPolicy = OverflowPolicy.COALESCE,
+        block_timeout: Optional[float] = 1.0
+    ):
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        self.observer = observer
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self._executor = executor
+        self._queue: Deque[Tuple[float, ModelEvent, Dict[str, Any]]] = deque()
+        self._condition = threading.Condition()
+        self._draining = False
+        # thread delivering to the observer, which must not wait on its own queue
+        self._worker: Optional[int] = None
+        self._closed = False
+
+        # Metrics
+        self._enqueued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._errors = 0
+        self._max_depth = 0
+        self._last_latency = 0.0
+        self._max_latency = 0.0
+
+    def put(self, event_type: ModelEvent, data: Dict[str, Any]) -> None:
+        """Enqueue an event, applying the overflow policy when full"""
+        with self._condition:
+            if self._closed:
+                return
+            if len(self._queue) >= self.max_queue:
+                self._handle_overflow()
+            self._queue.append((time.monotonic(), event_type, data))
+            self._enqueued += 1
+            self._max_depth = max(self._max_depth, len(self._queue))
+            if not self._draining:
+                self._draining = True
+                self._executor.submit(self._drain)
+
+    def _handle_overflow(self) -> None:
+        """Make room in a full queue (called with the condition held)"""
+        if self.overflow == OverflowPolicy.BLOCK and self._worker != threading.get_ident():
+            deadline = None if self.block_timeout is None else time.monotonic() + self.block_timeout
+            while len(self._queue) >= self.max_queue and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if len(self._queue) < self.max_queue:
+                return
+        elif self.overflow == OverflowPolicy.COALESCE:
+            self._coalesce_queue()
+            if len(self._queue) < self.max_queue:
+                return
+
+        # DROP_OLDEST, or the other policies could not make room
+        self._queue.popleft()
+        self._dropped += 1
+
+    def _coalesce_queue(self) -> None:
+        """Merge queued events into their net effect"""
+        coalescer = EventCoalescer()
+        oldest = self._queue[0][0]
+        before = len(self._queue)
+        for _, event_type, data in self._queue:
+            coalescer.add(event_type, data)
+        merged = coalescer.drain()
+        self._queue = deque((oldest, event_type, data) for event_type, data in merged)
+        self._coalesced += before - len(self._queue)
+
+    def _drain(self) -> None:
+        """Deliver queued events until the queue is empty"""
+        with self._condition:
+            self._worker = threading.get_ident()
+        while True:
+            with self._condition:
+                if not self._queue or self._closed:
+                    self._draining = False
+                    self._worker = None
+                    self._condition.notify_all()
+                    return
+                items = list(self._queue)
+                self._queue.clear()
+                self._condition.notify_all()
+
+            failed = False
+            try:
+                self.observer.on_model_batch([(event_type, data) for _, event_type, data in items])
+            except Exception:
+                failed = True
+
+            latency = time.monotonic() - items[0][0]
+            with self._condition:
+                self._errors += failed
+                self._delivered += len(items)
+                self._last_latency = latency
+                self._max_latency = max(self._max_latency, latency)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued events are delivered"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._draining, timeout)
+
+    def close(self) -> None:
+        """Stop accepting events and discard queued ones"""
+        with self._condition:
+            self._closed = True
+            self._queue.clear()
+            self._condition.notify_all()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get queue and lag metrics for this observer"""
+        with self._condition:
+            lag = time.monotonic() - self._queue[0][0] if self._queue else 0.0
+            return {
+                "observer": type(self.observer).__name__,
+                "queue_depth": len(self._queue),
+                "max_queue": self.max_queue,
+                "max_depth": self._max_depth,
+                "overflow": self.overflow.value,
+                "lag_seconds": lag,
+                "last_latency_seconds": self._last_latency,
+                "max_latency_seconds": self._max_latency,
+                "enqueued": self._enqueued,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "coalesced": self._coalesced,
+                "errors": self._errors,
+            }
+
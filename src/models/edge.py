@@ -3,13 +3,15 @@ Edge model for graph connections
 """
 
 import uuid
-from typing import Any, Dict, Optional
-from .node import Node
+from typing import Any, Dict, Mapping, Optional
+from .node import Node, intern_string
 
 
 class Edge:
     """Graph edge connecting two nodes."""
 
+    __slots__ = ("id", "source", "target", "edge_type", "directed", "label", "_properties")
+
     def __init__(
         self,
         source: Node,
@@ -17,15 +19,27 @@ class Edge:
         edge_type: str = "default",
         directed: bool = True,
         label: str = "",
-        properties: Optional[Dict[str, Any]] = None
+        properties: Optional[Dict[str, Any]] = None,
+        edge_id: Optional[str] = None
     ):
-        self.id = str(uuid.uuid4())
+        self.id = edge_id if edge_id is not None else str(uuid.uuid4())
         self.source = source
         self.target = target
-        self.edge_type = edge_type
+        self.edge_type = intern_string(edge_type)
         self.directed = directed
-        self.label = label
-        self.properties = properties or {}
+        self.label = intern_string(label)
+        self._properties = properties or None
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        """Edge properties, allocated on first access."""
+        if self._properties is None:
+            self._properties = {}
+        return self._properties
+
+    @properties.setter
+    def properties(self, value: Dict[str, Any]) -> None:
+        self._properties = value
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert edge to dictionary."""
@@ -36,9 +50,25 @@ class Edge:
             "edge_type": self.edge_type,
             "directed": self.directed,
             "label": self.label,
-            "properties": self.properties.copy()
+            "properties": self._properties.copy() if self._properties else {}
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], nodes: Mapping[str, Node]) -> 'Edge':
+        """Create edge from dictionary, resolving its endpoints by ID in nodes.
+
+        Raises KeyError if source_id or target_id is not in nodes.
+        """
+        return cls(
+            source=nodes[data["source_id"]],
+            target=nodes[data["target_id"]],
+            edge_type=data.get("edge_type", "default"),
+            directed=data.get("directed", True),
+            label=data.get("label", ""),
+            properties=data.get("properties", {}),
+            edge_id=data.get("id")
+        )
+
     def __repr__(self) -> str:
         arrow = "->" if self.directed else "--"
         return f"Edge({self.source.label} {arrow} {self.target.label})"
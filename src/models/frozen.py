@@ -0,0 +1,182 @@
+"""
+Frozen, array-backed graph snapshot
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .node import Node
+from .edge import Edge
+
+
+def _encode(values: Sequence[str]) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """Encode strings as int32 codes into a table of distinct values."""
+    table: Dict[str, int] = {}
+    codes = np.fromiter((table.setdefault(value, len(table)) for value in values),
+                        dtype=np.int32, count=len(values))
+    return codes, tuple(table)
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    """Mark array as read-only and return it."""
+    array.flags.writeable = False
+    return array
+
+
+class FrozenGraph:
+    """Immutable CSR snapshot of a graph for read-heavy analytics.
+
+    Nodes are numbered 0..N-1 in graph order. Outgoing edges of node i are
+    ``targets[offsets[i]:offsets[i + 1]]`` and incoming edges of node i are
+    ``sources[in_offsets[i]:in_offsets[i + 1]]``. All edge arrays
+    (``targets``, ``edge_sources``, ``edge_type_codes``...) are in CSR order.
+    Positions are stored in a float64 ``(N, 2)`` matrix, so they serialize
+    exactly like the graph's.
+    """
+
+    def __init__(self, graph):
+        self.id = graph.id
+        self.name = graph.name
+        self.directed = graph.directed
+        self.version = graph.version
+        self.properties: Dict[str, Any] = graph.properties.copy()
+
+        # Nodes
+        self.nodes: Tuple[Node, ...] = tuple(graph.nodes)
+        self.node_ids: Tuple[str, ...] = tuple(node.id for node in self.nodes)
+        self._index: Dict[str, int] = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self.labels: Tuple[str, ...] = tuple(node.label for node in self.nodes)
+        codes, self.node_types = _encode([node.node_type for node in self.nodes])
+        self.node_type_codes = _readonly(codes)
+        # Empty property dicts are stored as None, nodes allocate them lazily
+        self._node_properties = tuple(node._properties.copy() if node._properties else None
+                                      for node in self.nodes)
+        positions = np.zeros((len(self.nodes), 2), dtype=np.float64)
+        for i, node in enumerate(self.nodes):
+            position = node._position
+            if position is not None:
+                positions[i, 0] = position.x
+                positions[i, 1] = position.y
+        self.positions = _readonly(positions)
+
+        # Edges, reordered by source index (stable, so per-node order is kept)
+        edges = list(graph.edges)
+        count = len(self.nodes)
+        index = self._index
+        sources = np.fromiter((index[edge.source.id] for edge in edges), dtype=np.int32, count=len(edges))
+        targets = np.fromiter((index[edge.target.id] for edge in edges), dtype=np.int32, count=len(edges))
+        order = np.argsort(sources, kind="stable")
+        self.edges: Tuple[Edge, ...] = tuple(edges[i] for i in order)
+        self.edge_sources = _readonly(sources[order])
+        self.targets = _readonly(targets[order])
+        self.offsets = _readonly(self._offsets(self.edge_sources, count))
+        codes, self.edge_types = _encode([edge.edge_type for edge in self.edges])
+        self.edge_type_codes = _readonly(codes)
+        self.edge_directed = _readonly(np.fromiter((edge.directed for edge in self.edges),
+                                                   dtype=bool, count=len(edges)))
+        self.edge_ids: Tuple[str, ...] = tuple(edge.id for edge in self.edges)
+        self._edge_properties = tuple(edge._properties.copy() if edge._properties else None
+                                      for edge in self.edges)
+        self._edge_labels = tuple(edge.label for edge in self.edges)
+
+        # Incoming CSR: permutation of edge positions grouped by target
+        self.in_edge_order = _readonly(np.argsort(self.targets, kind="stable").astype(np.int32))
+        self.sources = _readonly(self.edge_sources[self.in_edge_order])
+        self.in_offsets = _readonly(self._offsets(self.targets[self.in_edge_order], count))
+
+    @staticmethod
+    def _offsets(grouped: np.ndarray, count: int) -> np.ndarray:
+        """Build CSR offsets for a sorted array of group indices."""
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(grouped, minlength=count), out=offsets[1:])
+        return offsets
+
+    def index_of(self, node: Union[Node, str]) -> Optional[int]:
+        """Get integer index of a node (or node ID)."""
+        node_id = node if isinstance(node, str) else node.id
+        return self._index.get(node_id)
+
+    def get_node_by_id(self, node_id: str) -> Optional[Node]:
+        """Get node by ID."""
+        i = self._index.get(node_id)
+        return self.nodes[i] if i is not None else None
+
+    def neighbor_indices(self, index: int) -> np.ndarray:
+        """Get indices of neighboring nodes."""
+        out = self.targets[self.offsets[index]:self.offsets[index + 1]]
+        if self.directed:
+            return out
+        incoming = self.sources[self.in_offsets[index]:self.in_offsets[index + 1]]
+        return np.concatenate((out, incoming[incoming != index]))
+
+    def get_neighbors(self, node: Node) -> List[Node]:
+        """Get all neighboring nodes."""
+        i = self.index_of(node)
+        if i is None:
+            return []
+        nodes = self.nodes
+        return [nodes[j] for j in self.neighbor_indices(i).tolist()]
+
+    def out_degrees(self) -> np.ndarray:
+        """Get out-degree of every node."""
+        return np.diff(self.offsets)
+
+    def in_degrees(self) -> np.ndarray:
+        """Get in-degree of every node."""
+        return np.diff(self.in_offsets)
+
+    def node_count(self) -> int:
+        """Get number of nodes."""
+        return len(self.nodes)
+
+    def edge_count(self) -> int:
+        """Get number of edges."""
+        return len(self.edges)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert snapshot to the same dictionary shape as Graph.to_dict.
+
+        Edges are listed in CSR (source node) order.
+        """
+        node_types = self.node_types
+        edge_types = self.edge_types
+        node_ids = self.node_ids
+        nodes = [
+            {
+                "id": node_id,
+                "label": label,
+                "node_type": node_types[code],
+                "properties": properties.copy() if properties else {},
+                "position": {"x": x, "y": y}
+            }
+            for node_id, label, code, properties, (x, y) in zip(
+                node_ids, self.labels, self.node_type_codes.tolist(),
+                self._node_properties, self.positions.tolist())
+        ]
+        edges = [
+            {
+                "id": edge_id,
+                "source_id": node_ids[source],
+                "target_id": node_ids[target],
+                "edge_type": edge_types[code],
+                "directed": directed,
+                "label": label,
+                "properties": properties.copy() if properties else {}
+            }
+            for edge_id, source, target, code, directed, label, properties in zip(
+                self.edge_ids, self.edge_sources.tolist(), self.targets.tolist(),
+                self.edge_type_codes.tolist(), self.edge_directed.tolist(),
+                self._edge_labels, self._edge_properties)
+        ]
+        return {
+            "id": self.id,
+            "name": self.name,
+            "directed": self.directed,
+            "nodes": nodes,
+            "edges": edges,
+            "properties": self.properties.copy()
+        }
+
+    def __repr__(self) -> str:
+        return f"FrozenGraph(name='{self.name}', nodes={self.node_count()}, edges={self.edge_count()})"
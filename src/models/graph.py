@@ -2,10 +2,22 @@
 Graph model
 """
 
+import json
 import uuid
-from typing import Any, Dict, List, Optional
-from .node import Node
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+from .node import Node, intern_string
 from .edge import Edge
+from .position import Position
+from .changelog import ChangeLog
+from .spatial import QuadTree
+from .observers import ModelSubject, ModelEvent, ELEMENT_EVENTS, ELEMENT_EVENT_OPS
+
+if TYPE_CHECKING:
+    from .frozen import FrozenGraph
+
+
+T = TypeVar("T")
 
 
 class GraphValidationError(Exception):
@@ -13,75 +25,471 @@ class GraphValidationError(Exception):
     pass
 
 
-class Graph:
-    """graph structure with nodes and edges."""
+class ElementView(Generic[T]):
+    """read-only, insertion-ordered view over graph elements keyed by id.
+
+    compares equal to a list or tuple with the same elements in order.
+    indexing uses a list the graph caches until its elements change.
+    """
+
+    __slots__ = ("_items", "_sequence")
+
+    def __init__(self, items: Dict[str, T], sequence: Callable[[], List[T]]):
+        self._items = items
+        self._sequence = sequence
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        item_id = getattr(item, "id", None)
+        return item_id is not None and self._items.get(item_id) == item
+
+    def __getitem__(self, index):
+        try:
+            return self._sequence()[index]
+        except IndexError:
+            raise IndexError("element index out of range") from None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ElementView):
+            return list(self._items.values()) == list(other._items.values())
+        if isinstance(other, (list, tuple)):
+            return list(self._items.values()) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._items.values())!r})"
+
+
+class Graph(ModelSubject):
+    """graph structure with nodes and edges.
 
-    def __init__(self, name: str = "Graph", directed: bool = True):
-        self.id = str(uuid.uuid4())
+    Mutations notify attached observers. Single changes send the element
+    under both a singular and a plural key (``node`` and ``nodes``); inside
+    ``batch()`` observers get one summary event per event type instead.
+
+    Every mutation increments ``version`` and is recorded in a bounded
+    change log, so clients can fetch deltas with ``changes_since``.
+
+    A quadtree over node positions is built on the first viewport query
+    and then kept up to date by add/remove/update_node/move_node; positions
+    changed directly on ``node.position`` are not tracked.
+    """
+
+    # maximum number of changes kept for delta queries
+    CHANGE_LOG_SIZE = 10000
+
+    def __init__(self, name: str = "Graph", directed: bool = True, graph_id: Optional[str] = None):
+        super().__init__()
+        self.id = graph_id if graph_id is not None else str(uuid.uuid4())
         self.name = name
         self.directed = directed
-        self.nodes: List[Node] = []
-        self.edges: List[Edge] = []
         self.properties: Dict[str, Any] = {}
+        # id -> element maps (dicts keep insertion order for the public views)
+        self._nodes: Dict[str, Node] = {}
+        self._edges: Dict[str, Edge] = {}
+        # node id -> {edge id: edge}, used as ordered adjacency sets
+        self._out_edges: Dict[str, Dict[str, Edge]] = {}
+        self._in_edges: Dict[str, Dict[str, Edge]] = {}
+        # pending batch events, ordered by first occurrence of each type
+        self._batch_depth = 0
+        self._pending_events: Dict[ModelEvent, List[Any]] = {}
+        self.version = 0
+        self._changes = ChangeLog(self.CHANGE_LOG_SIZE)
+        self._spatial: Optional[QuadTree] = None
+        # snapshot returned by freeze() while the version is unchanged
+        self._frozen: Optional['FrozenGraph'] = None
+        # element lists for indexing the views, dropped when elements change
+        self._node_list: Optional[List[Node]] = None
+        self._edge_list: Optional[List[Edge]] = None
+
+    @property
+    def nodes(self) -> ElementView[Node]:
+        """read-only view of the graph nodes."""
+        return ElementView(self._nodes, self._node_sequence)
+
+    @property
+    def edges(self) -> ElementView[Edge]:
+        """read-only view of the graph edges."""
+        return ElementView(self._edges, self._edge_sequence)
+
+    def _node_sequence(self) -> List[Node]:
+        if self._node_list is None:
+            self._node_list = list(self._nodes.values())
+        return self._node_list
+
+    def _edge_sequence(self) -> List[Edge]:
+        if self._edge_list is None:
+            self._edge_list = list(self._edges.values())
+        return self._edge_list
+
+    def has_node(self, node: Node) -> bool:
+        """check if node is part of the graph."""
+        return node.id in self._nodes
+
+    def has_edge(self, edge: Edge) -> bool:
+        """check if edge is part of the graph."""
+        return edge.id in self._edges
 
     def add_node(self, node: Node) -> None:
         """add a node to the graph."""
-        if node not in self.nodes:
-            self.nodes.append(node)
+        if node.id not in self._nodes:
+            self._nodes[node.id] = node
+            self._node_list = None
+            self._out_edges[node.id] = {}
+            self._in_edges[node.id] = {}
+            if self._spatial is not None:
+                self._spatial.insert(node.id, node.position.x, node.position.y)
+            self._emit(ModelEvent.NODE_ADDED, node)
 
     def remove_node(self, node: Node) -> None:
         """remove a node and all its edges."""
-        if node in self.nodes:
+        if node.id in self._nodes:
             # Remove all edges connected to this node
-            self.edges = [edge for edge in self.edges
-                         if edge.source != node and edge.target != node]
-            self.nodes.remove(node)
+            for edge in list(self._out_edges[node.id].values()):
+                self.remove_edge(edge)
+            for edge in list(self._in_edges[node.id].values()):
+                self.remove_edge(edge)
+            del self._out_edges[node.id]
+            del self._in_edges[node.id]
+            node = self._nodes.pop(node.id)
+            self._node_list = None
+            if self._spatial is not None:
+                self._spatial.remove(node.id)
+            self._emit(ModelEvent.NODE_REMOVED, node)
 
     def add_edge(self, edge: Edge) -> None:
         """add an edge to the graph."""
         # Ensure both nodes are in the graph
-        if edge.source not in self.nodes:
-            self.add_node(edge.source)
-        if edge.target not in self.nodes:
-            self.add_node(edge.target)
+        self.add_node(edge.source)
+        self.add_node(edge.target)
 
-        if edge not in self.edges:
-            self.edges.append(edge)
+        if edge.id not in self._edges:
+            self._edges[edge.id] = edge
+            self._edge_list = None
+            self._out_edges[edge.source.id][edge.id] = edge
+            self._in_edges[edge.target.id][edge.id] = edge
+            self._emit(ModelEvent.EDGE_ADDED, edge)
 
     def remove_edge(self, edge: Edge) -> None:
         """remove an edge from the graph."""
-        if edge in self.edges:
-            self.edges.remove(edge)
+        if edge.id in self._edges:
+            edge = self._edges.pop(edge.id)
+            self._edge_list = None
+            self._out_edges[edge.source.id].pop(edge.id, None)
+            self._in_edges[edge.target.id].pop(edge.id, None)
+            self._emit(ModelEvent.EDGE_REMOVED, edge)
+
+    def add_nodes(self, nodes: Iterable[Node]) -> None:
+        """add several nodes with a single notification."""
+        with self.batch():
+            for node in nodes:
+                self.add_node(node)
+
+    def add_edges(self, edges: Iterable[Edge]) -> None:
+        """add several edges with a single notification."""
+        with self.batch():
+            for edge in edges:
+                self.add_edge(edge)
+
+    def remove_nodes(self, nodes: Iterable[Node]) -> None:
+        """remove several nodes and their edges with a single notification."""
+        with self.batch():
+            for node in nodes:
+                self.remove_node(node)
+
+    @contextmanager
+    def batch(self) -> Iterator['Graph']:
+        """group mutations so observers get one summary event per type.
+
+        Batches nest; events are delivered when the outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_events()
+
+    def _emit(self, event_type: ModelEvent, element: Any) -> None:
+        """record a change and notify observers, or queue it inside a batch."""
+        self.version += 1
+        key, batch_key = ELEMENT_EVENTS[event_type]
+        self._changes.record(self.version, ELEMENT_EVENT_OPS[event_type], batch_key, element)
+        if self._batch_depth:
+            self._pending_events.setdefault(event_type, []).append(element)
+        elif self._observers:
+            self.notify_observers(event_type, {
+                'graph_id': self.id,
+                key: element,
+                batch_key: [element]
+            })
+
+    def _flush_events(self) -> None:
+        """send one summary event per queued event type."""
+        pending, self._pending_events = self._pending_events, {}
+        if not self._observers:
+            return
+        for event_type, elements in pending.items():
+            if event_type == ModelEvent.GRAPH_CLEARED:
+                self.notify_observers(event_type, {'graph_id': self.id})
+                continue
+            _, batch_key = ELEMENT_EVENTS[event_type]
+            self.notify_observers(event_type, {
+                'graph_id': self.id,
+                batch_key: elements,
+                'batched': True
+            })
+
+    def update_node(
+        self,
+        node: Node,
+        label: Optional[str] = None,
+        node_type: Optional[str] = None,
+        properties: Optional[Dict[str, Any]] = None,
+        position: Optional[Position] = None
+    ) -> None:
+        """update node attributes; properties are merged into existing ones."""
+        node = self._require_node(node)
+        if label is not None:
+            node.label = intern_string(label)
+        if node_type is not None:
+            node.node_type = intern_string(node_type)
+        if properties:
+            node.properties.update(properties)
+        if position is not None:
+            node.position = position
+            if self._spatial is not None:
+                self._spatial.move(node.id, position.x, position.y)
+        self._emit(ModelEvent.NODE_UPDATED, node)
+
+    def move_node(self, node: Node, x: float, y: float) -> None:
+        """set node position."""
+        node = self._require_node(node)
+        position = node.position
+        position.x = x
+        position.y = y
+        if self._spatial is not None:
+            self._spatial.move(node.id, x, y)
+        self._emit(ModelEvent.NODE_UPDATED, node)
+
+    def update_edge(
+        self,
+        edge: Edge,
+        label: Optional[str] = None,
+        edge_type: Optional[str] = None,
+        properties: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """update edge attributes; properties are merged into existing ones."""
+        if edge.id not in self._edges:
+            raise GraphValidationError(f"edge {edge.id} is not in graph {self.id}")
+        edge = self._edges[edge.id]
+        if label is not None:
+            edge.label = intern_string(label)
+        if edge_type is not None:
+            edge.edge_type = intern_string(edge_type)
+        if properties:
+            edge.properties.update(properties)
+        self._emit(ModelEvent.EDGE_UPDATED, edge)
+
+    def _require_node(self, node: Node) -> Node:
+        """get the graph's node with the same id or raise."""
+        if node.id not in self._nodes:
+            raise GraphValidationError(f"node {node.id} is not in graph {self.id}")
+        return self._nodes[node.id]
+
+    def changes_since(self, version: int) -> Optional[Dict[str, Any]]:
+        """get net node/edge changes after version.
+
+        returns None when the change log no longer covers that version;
+        callers should then fall back to a full snapshot.
+        """
+        if version > self.version:
+            return None
+        delta = self._changes.delta_since(version)
+        if delta is None:
+            return None
+        delta["since"] = version
+        delta["version"] = self.version
+        return delta
+
+    def _populate(self, nodes: Iterable[Node], edges: Iterable[Edge], version: int) -> None:
+        """fill an empty graph from a loader without per-element events.
+
+        edges must only connect the given nodes. the graph continues at
+        version and observers get a single GRAPH_LOADED event.
+        """
+        node_map = self._nodes
+        out_edges = self._out_edges
+        in_edges = self._in_edges
+        for node in nodes:
+            node_map[node.id] = node
+            out_edges[node.id] = {}
+            in_edges[node.id] = {}
+        edge_map = self._edges
+        for edge in edges:
+            edge_map[edge.id] = edge
+            out_edges[edge.source.id][edge.id] = edge
+            in_edges[edge.target.id][edge.id] = edge
+        self._spatial = None
+        self._node_list = None
+        self._edge_list = None
+        self.restore_version(version)
+        self.notify_observers(ModelEvent.GRAPH_LOADED, {'graph_id': self.id})
+
+    def restore_version(self, version: int) -> None:
+        """set the version of a graph loaded from storage.
+
+        the change log restarts there, so older versions get a full snapshot.
+        """
+        self.version = version
+        self._changes.reset(version)
+        self._frozen = None
+
+    def nodes_in_bbox(self, x0: float, y0: float, x1: float, y1: float) -> List[Node]:
+        """get nodes whose position lies inside the rectangle."""
+        if self._spatial is None:
+            self.rebuild_spatial_index()
+        nodes = self._nodes
+        return [nodes[node_id] for node_id in self._spatial.query(x0, y0, x1, y1)]
+
+    def rebuild_spatial_index(self) -> None:
+        """(re)build the position index, e.g. after editing positions directly."""
+        spatial = QuadTree()
+        for node in self._nodes.values():
+            position = node.position
+            spatial.insert(node.id, position.x, position.y)
+        self._spatial = spatial
+
+    def viewport_to_dict(self, x0: float, y0: float, x1: float, y1: float) -> Dict[str, Any]:
+        """convert the nodes inside a rectangle and their edges to dictionary."""
+        nodes = self.nodes_in_bbox(x0, y0, x1, y1)
+        edges: Dict[str, Edge] = {}
+        for node in nodes:
+            edges.update(self._out_edges[node.id])
+            edges.update(self._in_edges[node.id])
+        return {
+            "id": self.id,
+            "name": self.name,
+            "directed": self.directed,
+            "nodes": [node.to_dict() for node in nodes],
+            "edges": [edge.to_dict() for edge in edges.values()],
+            "properties": self.properties.copy()
+        }
 
     def get_node_by_id(self, node_id: str) -> Optional[Node]:
         """get node by ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self._nodes.get(node_id)
+
+    def get_edge_by_id(self, edge_id: str) -> Optional[Edge]:
+        """get edge by ID."""
+        return self._edges.get(edge_id)
 
     def get_neighbors(self, node: Node) -> List[Node]:
         """get all neighboring nodes."""
-        neighbors = []
-        for edge in self.edges:
-            if edge.source == node:
-                neighbors.append(edge.target)
-            elif not self.directed and edge.target == node:
-                neighbors.append(edge.source)
+        neighbors = [edge.target for edge in self._out_edges.get(node.id, {}).values()]
+        if not self.directed:
+            neighbors.extend(edge.source for edge in self._in_edges.get(node.id, {}).values()
+                             if edge.source != edge.target)
         return neighbors
 
+    def get_outgoing_edges(self, node: Node) -> List[Edge]:
+        """get edges leaving the node."""
+        return list(self._out_edges.get(node.id, {}).values())
+
+    def get_incoming_edges(self, node: Node) -> List[Edge]:
+        """get edges entering the node."""
+        return list(self._in_edges.get(node.id, {}).values())
+
+    def degree(self, node: Node) -> int:
+        """get number of edges touching the node."""
+        return len(self._out_edges.get(node.id, ())) + len(self._in_edges.get(node.id, ()))
+
     def node_count(self) -> int:
         """get number of nodes."""
-        return len(self.nodes)
+        return len(self._nodes)
 
     def edge_count(self) -> int:
         """get number of edges."""
-        return len(self.edges)
+        return len(self._edges)
 
     def clear(self) -> None:
         """clear all nodes and edges."""
-        self.nodes.clear()
-        self.edges.clear()
+        self._nodes.clear()
+        self._edges.clear()
+        self._node_list = None
+        self._edge_list = None
+        self._out_edges.clear()
+        self._in_edges.clear()
+        self._spatial = None
+        self.version += 1
+        self._changes.reset(self.version)
+        if self._batch_depth:
+            # earlier batched changes are superseded by the clear
+            self._pending_events.clear()
+            self._pending_events[ModelEvent.GRAPH_CLEARED] = []
+        else:
+            self.notify_observers(ModelEvent.GRAPH_CLEARED, {'graph_id': self.id})
+
+    def freeze(self) -> 'FrozenGraph':
+        """get an immutable array-backed snapshot (requires numpy).
+
+        the snapshot is reused until the graph version changes.
+        """
+        frozen = self._frozen
+        if frozen is None or frozen.version != self.version:
+            from .frozen import FrozenGraph
+            frozen = self._frozen = FrozenGraph(self)
+        return frozen
+
+    def save(self, path: str) -> None:
+        """write graph to a compact binary file (see models.binary)."""
+        from .binary import save
+        save(self, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'Graph':
+        """read graph from a binary file written by save()."""
+        from .binary import load
+        return load(path)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Graph':
+        """rebuild a graph from to_dict() output, keeping all IDs.
+
+        edges resolve their endpoints through an ID index, so loading is
+        linear in the size of the graph.
+        """
+        graph = cls(name=data.get("name", "Graph"), directed=data.get("directed", True),
+                    graph_id=data.get("id"))
+        graph.properties.update(data.get("properties", {}))
+        node_from_dict = Node.from_dict
+        nodes = {}
+        for node_data in data.get("nodes", []):
+            node = node_from_dict(node_data)
+            nodes[node.id] = node
+        edge_from_dict = Edge.from_dict
+        edges = []
+        for edge_data in data.get("edges", []):
+            try:
+                edges.append(edge_from_dict(edge_data, nodes))
+            except KeyError as error:
+                raise GraphValidationError(
+                    f"edge {edge_data.get('id')} references unknown node {error.args[0]}") from None
+        graph._populate(nodes.values(), edges, 0)
+        return graph
+
+    @classmethod
+    def from_json(cls, text: str) -> 'Graph':
+        """rebuild a graph from its JSON form (see from_dict)."""
+        return cls.from_dict(json.loads(text))
 
     def to_dict(self) -> Dict[str, Any]:
         """convert graph to dictionary."""
@@ -89,13 +497,13 @@ class Graph:
             "id": self.id,
             "name": self.name,
             "directed": self.directed,
-            "nodes": [node.to_dict() for node in self.nodes],
-            "edges": [edge.to_dict() for edge in self.edges],
+            "nodes": [node.to_dict() for node in self._nodes.values()],
+            "edges": [edge.to_dict() for edge in self._edges.values()],
             "properties": self.properties.copy()
         }
 
     def __repr__(self) -> str:
-        return f"Graph(name='{self.name}', nodes={len(self.nodes)}, edges={len(self.edges)})"
+        return f"Graph(name='{self.name}', nodes={len(self._nodes)}, edges={len(self._edges)})"
 
 
 class GraphBuilder:
@@ -103,6 +511,7 @@ class GraphBuilder:
 
     def __init__(self):
         self.graph = Graph()
+        self._nodes_by_label: Dict[str, Node] = {}
 
     def set_name(self, name: str) -> 'GraphBuilder':
         """set graph name."""
@@ -118,12 +527,13 @@ class GraphBuilder:
         """add a node to the graph."""
         node = Node(label=label, node_type=node_type, properties=kwargs)
         self.graph.add_node(node)
+        self._nodes_by_label.setdefault(label, node)
         return self
 
     def add_edge(self, source_label: str, target_label: str, edge_type: str = "default") -> 'GraphBuilder':
         """add an edge between nodes with given labels."""
-        source = next((n for n in self.graph.nodes if n.label == source_label), None)
-        target = next((n for n in self.graph.nodes if n.label == target_label), None)
+        source = self._nodes_by_label.get(source_label)
+        target = self._nodes_by_label.get(target_label)
 
         if source and target:
             edge = Edge(source=source, target=target, edge_type=edge_type)
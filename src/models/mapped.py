@@ -0,0 +1,370 @@
+"""
+Memory-mapped read-only graphs
+"""
+
+import json
+import mmap
+import struct
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
+
+from .binary import BinaryFormatError, NONE, _META, _UUIDS, read_sections
+from .edge import Edge
+from .node import Node
+from .observers import ModelSubject
+from .position import Position
+
+if TYPE_CHECKING:
+    from .frozen import FrozenGraph
+
+
+class MappedElements:
+    """Read-only sequence of nodes or edges materialized on access"""
+
+    __slots__ = ("_count", "_get", "_find")
+
+    def __init__(self, count: int, get, find):
+        self._count = count
+        self._get = get
+        self._find = find
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        get = self._get
+        for i in range(self._count):
+            yield get(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("element index out of range")
+        return self._get(index)
+
+    def __contains__(self, item: object) -> bool:
+        element_id = getattr(item, "id", None)
+        return isinstance(element_id, str) and self._find(element_id) is not None
+
+
+class MappedGraph(ModelSubject):
+    """Read-only graph backed by mmap over a binary graph file
+
+    Columns, adjacency and the string table are read in place through
+    memoryviews, so the operating system pages data in on demand and
+    the file may be larger than memory. Nodes and edges are created when
+    accessed (recently used ones are cached); lookups by ID use binary
+    search over the sorted ID index, neighbours come from the CSR
+    sections. Requires a file written in format version 2 or later.
+
+    Supports the read API of Graph; there are no mutation methods.
+    """
+
+    read_only = True
+
+    def __init__(self, path: str, cache_size: int = 65536):
+        if sys.byteorder != "little":
+            raise BinaryFormatError("memory-mapped graphs require a little-endian platform")
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise BinaryFormatError("file too short")
+        super().__init__()
+        try:
+            format_version, sections = read_sections(self._mmap)
+            if format_version < 2:
+                raise BinaryFormatError("file has no index sections; save it again with Graph.save")
+        except BinaryFormatError:
+            # the traceback still references views of the mapping; it is
+            # unmapped once they are dropped
+            self._mmap = None
+            self._file.close()
+            raise
+        self._sections = sections
+
+        strings = sections["STRS"]
+        (count,) = struct.unpack_from("<I", strings, 0)
+        self._string_offsets = strings[4:4 + 4 * (count + 1)].cast("I")
+        self._string_blob = strings[4 + 4 * (count + 1):]
+        self._string = lru_cache(maxsize=cache_size)(self._decode_string)
+
+        graph_id, name, properties, directed, version, node_count, edge_count = \
+            _META.unpack_from(sections["META"], 0)
+        self.id = self._string(graph_id)
+        self.name = self._string(name)
+        self.directed = bool(directed)
+        self.properties: Dict[str, Any] = json.loads(self._string(properties)) if properties != NONE else {}
+        self.version = version
+        self._node_count = node_count
+        self._edge_count = edge_count
+
+        self._node_uuids = sections.get("NIDU")
+        self._node_id_refs = sections["NIDS"].cast("I") if "NIDS" in sections else None
+        self._edge_uuids = sections.get("EIDU")
+        self._edge_id_refs = sections["EIDS"].cast("I") if "EIDS" in sections else None
+        self._labels = sections["NLBL"].cast("I")
+        self._types = sections["NTYP"].cast("I")
+        self._node_props = sections["NPRP"].cast("I")
+        self._positions = sections["NPOS"].cast("d")
+        self._sources = sections["ESRC"].cast("I")
+        self._targets = sections["ETGT"].cast("I")
+        self._edge_types = sections["ETYP"].cast("I")
+        self._edge_labels = sections["ELBL"].cast("I")
+        self._edge_props = sections["EPRP"].cast("I")
+        self._directions = sections["EDIR"]
+        self._out_offsets = sections["OOFF"].cast("I")
+        self._out_edges = sections["OEDG"].cast("I")
+        self._in_offsets = sections["IOFF"].cast("I")
+        self._in_edges = sections["IEDG"].cast("I")
+        self._node_order = sections["NIDX"].cast("I")
+        self._edge_order = sections["EIDX"].cast("I")
+
+        self.node_at = lru_cache(maxsize=cache_size)(self._make_node)
+        self.edge_at = lru_cache(maxsize=cache_size)(self._make_edge)
+        self._frozen: Optional['FrozenGraph'] = None
+
+    # -- element access -------------------------------------------------
+
+    def _decode_string(self, index: int) -> str:
+        offsets = self._string_offsets
+        return bytes(self._string_blob[offsets[index]:offsets[index + 1]]).decode("utf-8")
+
+    def _json(self, index: int) -> Optional[Dict[str, Any]]:
+        return None if index == NONE else json.loads(self._string(index))
+
+    @staticmethod
+    def _format_uuid(raw: bytes) -> str:
+        h = raw.hex()
+        return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+    def _node_id(self, index: int) -> str:
+        if self._node_uuids is not None:
+            return self._format_uuid(bytes(self._node_uuids[16 * index:16 * index + 16]))
+        return self._string(self._node_id_refs[index])
+
+    def _edge_id(self, index: int) -> str:
+        if self._edge_uuids is not None:
+            return self._format_uuid(bytes(self._edge_uuids[16 * index:16 * index + 16]))
+        return self._string(self._edge_id_refs[index])
+
+    def _make_node(self, index: int) -> Node:
+        node = Node.__new__(Node)
+        node.id = self._node_id(index)
+        node.label = self._string(self._labels[index])
+        node.node_type = self._string(self._types[index])
+        node._properties = self._json(self._node_props[index])
+        x = self._positions[2 * index]
+        node._position = Position(x, self._positions[2 * index + 1]) if x == x else None
+        return node
+
+    def _make_edge(self, index: int) -> Edge:
+        edge = Edge.__new__(Edge)
+        edge.id = self._edge_id(index)
+        edge.source = self.node_at(self._sources[index])
+        edge.target = self.node_at(self._targets[index])
+        edge.edge_type = self._string(self._edge_types[index])
+        edge.directed = self._directions[index] == 1
+        edge.label = self._string(self._edge_labels[index])
+        edge._properties = self._json(self._edge_props[index])
+        return edge
+
+    def _search(self, order: memoryview, count: int, uuids: Optional[memoryview], element_id: str, id_at) -> int:
+        """Binary search the sorted ID index; returns element index or -1"""
+        if uuids is not None:
+            if len(element_id) != 36 or not _UUIDS.fullmatch(element_id):
+                return -1
+            key: Union[bytes, str] = bytes.fromhex(element_id.replace("-", ""))
+
+            def probe(i: int) -> bytes:
+                return bytes(uuids[16 * i:16 * i + 16])
+        else:
+            key = element_id
+            probe = id_at
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if probe(order[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < count and probe(order[low]) == key:
+            return order[low]
+        return -1
+
+    def index_of(self, node: Union[Node, str]) -> Optional[int]:
+        """Get the row index of a node (or node ID)"""
+        node_id = node if isinstance(node, str) else node.id
+        index = self._search(self._node_order, self._node_count, self._node_uuids, node_id, self._node_id)
+        return index if index >= 0 else None
+
+    # -- Graph read API -------------------------------------------------
+
+    @property
+    def nodes(self) -> MappedElements:
+        """read-only sequence of the graph nodes."""
+        return MappedElements(self._node_count, self.node_at, self.get_node_by_id)
+
+    @property
+    def edges(self) -> MappedElements:
+        """read-only sequence of the graph edges."""
+        return MappedElements(self._edge_count, self.edge_at, self.get_edge_by_id)
+
+    def has_node(self, node: Node) -> bool:
+        """check if node is part of the graph."""
+        return self.index_of(node) is not None
+
+    def has_edge(self, edge: Edge) -> bool:
+        """check if edge is part of the graph."""
+        return self.get_edge_by_id(edge.id) is not None
+
+    def get_node_by_id(self, node_id: str) -> Optional[Node]:
+        """get node by ID."""
+        index = self.index_of(node_id)
+        return self.node_at(index) if index is not None else None
+
+    def get_edge_by_id(self, edge_id: str) -> Optional[Edge]:
+        """get edge by ID."""
+        index = self._search(self._edge_order, self._edge_count, self._edge_uuids, edge_id, self._edge_id)
+        return self.edge_at(index) if index >= 0 else None
+
+    def get_outgoing_edges(self, node: Node) -> List[Edge]:
+        """get edges leaving the node."""
+        index = self.index_of(node)
+        if index is None:
+            return []
+        return [self.edge_at(e) for e in self._out_edges[self._out_offsets[index]:self._out_offsets[index + 1]]]
+
+    def get_incoming_edges(self, node: Node) -> List[Edge]:
+        """get edges entering the node."""
+        index = self.index_of(node)
+        if index is None:
+            return []
+        return [self.edge_at(e) for e in self._in_edges[self._in_offsets[index]:self._in_offsets[index + 1]]]
+
+    def get_neighbors(self, node: Node) -> List[Node]:
+        """get all neighboring nodes."""
+        index = self.index_of(node)
+        if index is None:
+            return []
+        out_edges = self._out_edges[self._out_offsets[index]:self._out_offsets[index + 1]]
+        neighbors = [self.node_at(self._targets[e]) for e in out_edges]
+        if not self.directed:
+            in_edges = self._in_edges[self._in_offsets[index]:self._in_offsets[index + 1]]
+            neighbors.extend(self.node_at(self._sources[e]) for e in in_edges if self._sources[e] != index)
+        return neighbors
+
+    def degree(self, node: Node) -> int:
+        """get number of edges touching the node."""
+        index = self.index_of(node)
+        if index is None:
+            return 0
+        return (self._out_offsets[index + 1] - self._out_offsets[index]
+                + self._in_offsets[index + 1] - self._in_offsets[index])
+
+    def node_count(self) -> int:
+        """get number of nodes."""
+        return self._node_count
+
+    def edge_count(self) -> int:
+        """get number of edges."""
+        return self._edge_count
+
+    def changes_since(self, version: int) -> Optional[Dict[str, Any]]:
+        """a mapped graph never changes; only its own version has a (empty) delta."""
+        if version != self.version:
+            return None
+        return {
+            "nodes": {"updated": [], "removed": []},
+            "edges": {"updated": [], "removed": []},
+            "since": version,
+            "version": version
+        }
+
+    def nodes_in_bbox(self, x0: float, y0: float, x1: float, y1: float) -> List[Node]:
+        """get nodes whose position lies inside the rectangle (scans the position column)."""
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        positions = self._positions
+        found = []
+        for i in range(self._node_count):
+            x = positions[2 * i]
+            y = positions[2 * i + 1]
+            if x != x:
+                # no position stored: the node is at the origin
+                x = y = 0.0
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                found.append(self.node_at(i))
+        return found
+
+    def viewport_to_dict(self, x0: float, y0: float, x1: float, y1: float) -> Dict[str, Any]:
+        """convert the nodes inside a rectangle and their edges to dictionary."""
+        nodes = self.nodes_in_bbox(x0, y0, x1, y1)
+        edges: Dict[str, Edge] = {}
+        for node in nodes:
+            for edge in self.get_outgoing_edges(node) + self.get_incoming_edges(node):
+                edges[edge.id] = edge
+        return self._dict([node.to_dict() for node in nodes], [edge.to_dict() for edge in edges.values()])
+
+    def to_dict(self, start: int = 0, stop: Optional[int] = None) -> Dict[str, Any]:
+        """convert graph, or the nodes start:stop and their outgoing edges, to dictionary."""
+        if start == 0 and stop is None:
+            return self._dict([node.to_dict() for node in self.nodes],
+                              [edge.to_dict() for edge in self.edges])
+        start, stop, _ = slice(start, stop).indices(self._node_count)
+        nodes = [self.node_at(i).to_dict() for i in range(start, stop)]
+        if start < stop:
+            edge_rows = self._out_edges[self._out_offsets[start]:self._out_offsets[stop]]
+        else:
+            edge_rows = []
+        return self._dict(nodes, [self.edge_at(e).to_dict() for e in edge_rows])
+
+    def freeze(self) -> 'FrozenGraph':
+        """get an array-backed snapshot (requires numpy); loads every element once."""
+        if self._frozen is None:
+            from .frozen import FrozenGraph
+            self._frozen = FrozenGraph(self)
+        return self._frozen
+
+    def _dict(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "directed": self.directed,
+            "nodes": nodes,
+            "edges": edges,
+            "properties": self.properties.copy()
+        }
+
+    def close(self) -> None:
+        """release the mapping and close the file."""
+        sections = getattr(self, "_sections", None)
+        if sections is not None:
+            # memoryviews must be released before the mmap can close
+            for name, value in list(vars(self).items()):
+                if isinstance(value, memoryview):
+                    value.release()
+            for view in sections.values():
+                view.release()
+            self._sections = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> 'MappedGraph':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MappedGraph(name='{self.name}', nodes={self._node_count}, edges={self._edge_count})"
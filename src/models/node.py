@@ -2,48 +2,82 @@
 Node model for graph structures
 """
 
+import sys
 import uuid
 from typing import Any, Dict, Optional
 from .position import Position
 
 
+def intern_string(value: Any) -> Any:
+    """Intern string values so repeated types and labels share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class Node:
     """Graph node with properties and position."""
 
+    # Slots keep per-node overhead low; properties and position are
+    # allocated on first access, since most nodes never touch them.
+    __slots__ = ("id", "label", "node_type", "_properties", "_position")
+
     def __init__(
         self,
         label: str,
         node_type: str = "default",
         properties: Optional[Dict[str, Any]] = None,
-        position: Optional[Position] = None
+        position: Optional[Position] = None,
+        node_id: Optional[str] = None
     ):
-        self.id = str(uuid.uuid4())
-        self.label = label
-        self.node_type = node_type
-        self.properties = properties or {}
-        self.position = position or Position()
+        # generating a UUID is a noticeable part of bulk loads; skip it for known IDs
+        self.id = node_id if node_id is not None else str(uuid.uuid4())
+        self.label = intern_string(label)
+        self.node_type = intern_string(node_type)
+        self._properties = properties or None
+        self._position = position
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        """Node properties, allocated on first access."""
+        if self._properties is None:
+            self._properties = {}
+        return self._properties
+
+    @properties.setter
+    def properties(self, value: Dict[str, Any]) -> None:
+        self._properties = value
+
+    @property
+    def position(self) -> Position:
+        """Node position, allocated on first access."""
+        if self._position is None:
+            self._position = Position()
+        return self._position
+
+    @position.setter
+    def position(self, value: Position) -> None:
+        self._position = value
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert node to dictionary."""
+        position = self._position
         return {
             "id": self.id,
             "label": self.label,
             "node_type": self.node_type,
-            "properties": self.properties.copy(),
-            "position": self.position.to_dict()
+            "properties": self._properties.copy() if self._properties else {},
+            "position": position.to_dict() if position is not None else {"x": 0.0, "y": 0.0}
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Node':
         """Create node from dictionary."""
-        node = cls(
+        return cls(
             label=data["label"],
             node_type=data.get("node_type", "default"),
             properties=data.get("properties", {}),
-            position=Position.from_dict(data.get("position", {}))
+            position=Position.from_dict(data.get("position", {})),
+            node_id=data.get("id")
         )
-        node.id = data.get("id", node.id)
-        return node
 
     def __repr__(self) -> str:
         return f"Node(id={self.id}, label='{self.label}', type='{self.node_type}')"
@@ -54,4 +88,4 @@ class Node:
         return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash(self.id)
\ No newline at end of file
+        return hash(self.id)
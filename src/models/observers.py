@@ -1,7 +1,13 @@
+import itertools
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from enum import Enum
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from .delivery import ObserverChannel, OverflowPolicy
+
 
 class ModelEvent(Enum):
     """Types of events in the model layer"""
@@ -15,6 +21,7 @@ class ModelEvent(Enum):
     GRAPH_LOADED = "graph_loaded"
     MODEL_CREATED = "model_created"
     MODEL_REMOVED = "model_removed"
+    MODEL_EVICTED = "model_evicted"
     MODEL_SWITCHED = "model_switched"
 
 
@@ -32,28 +39,355 @@ class ModelObserver(ABC):
         """
         pass
 
+    def on_model_batch(self, events: List[Tuple[ModelEvent, Dict[str, Any]]]) -> None:
+        """
+        Called with a batch of coalesced events
+
+        Args:
+            events: List of (event type, event data) pairs in delivery order
+        """
+        for event_type, data in events:
+            self.on_model_changed(event_type, data)
+
+
+# Element events and the payload keys they carry (single, batch)
+ELEMENT_EVENTS = {
+    ModelEvent.NODE_ADDED: ("node", "nodes"),
+    ModelEvent.NODE_REMOVED: ("node", "nodes"),
+    ModelEvent.NODE_UPDATED: ("node", "nodes"),
+    ModelEvent.EDGE_ADDED: ("edge", "edges"),
+    ModelEvent.EDGE_REMOVED: ("edge", "edges"),
+    ModelEvent.EDGE_UPDATED: ("edge", "edges"),
+}
+
+ELEMENT_EVENT_OPS = {
+    ModelEvent.NODE_ADDED: "added",
+    ModelEvent.NODE_REMOVED: "removed",
+    ModelEvent.NODE_UPDATED: "updated",
+    ModelEvent.EDGE_ADDED: "added",
+    ModelEvent.EDGE_REMOVED: "removed",
+    ModelEvent.EDGE_UPDATED: "updated",
+}
+
+_STATE_EVENT = {
+    ("node", "added"): ModelEvent.NODE_ADDED,
+    ("node", "removed"): ModelEvent.NODE_REMOVED,
+    ("node", "updated"): ModelEvent.NODE_UPDATED,
+    ("edge", "added"): ModelEvent.EDGE_ADDED,
+    ("edge", "removed"): ModelEvent.EDGE_REMOVED,
+    ("edge", "updated"): ModelEvent.EDGE_UPDATED,
+}
+
+# (group, group that must not be delivered before it) of one graph
+_DEPENDENT_GROUPS = (
+    (ModelEvent.NODE_ADDED, ModelEvent.EDGE_ADDED),
+    (ModelEvent.EDGE_REMOVED, ModelEvent.NODE_REMOVED),
+)
+# tie-break for groups moved to the same position
+_GROUP_RANK = {ModelEvent.EDGE_ADDED: 1, ModelEvent.NODE_REMOVED: 1}
+
+
+def event_elements(event_type: ModelEvent, data: Dict[str, Any]) -> Optional[List[Any]]:
+    """Get nodes/edges carried by an element event, or None for other events"""
+    keys = ELEMENT_EVENTS.get(event_type)
+    if keys is None:
+        return None
+    key, batch_key = keys
+    if batch_key in data:
+        return data[batch_key]
+    if key in data:
+        return [data[key]]
+    return None
+
+
+def event_cache_key(event_type: ModelEvent, data: Dict[str, Any]) -> Optional[str]:
+    """Get the ID whose cached data an event makes stale, or None
+
+    Events relayed by ModelManager name the model ('model_id'), which may
+    differ from the graph ID; events of a directly observed graph only
+    carry 'graph_id'. Switching the current model changes no graph.
+    """
+    if event_type == ModelEvent.MODEL_SWITCHED:
+        return None
+    return data.get('model_id', data.get('graph_id'))
+
+
+class EventCoalescer:
+    """Buffers events and merges redundant node/edge changes
+
+    Per element the net effect is kept: add + remove cancels out,
+    remove + add becomes an update and add + update stays an add.
+    Merged changes are regrouped into one event per graph and type;
+    other events pass through in order. GRAPH_CLEARED drops buffered
+    element changes of that graph.
+    """
+
+    def __init__(self):
+        self._sequence = itertools.count()
+        # (graph_id, kind, element_id) -> [first seen, state, element]
+        self._entries: Dict[Tuple[Any, str, str], List[Any]] = {}
+        self._passthrough: List[Tuple[int, ModelEvent, Dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._passthrough)
+
+    def add(self, event_type: ModelEvent, data: Dict[str, Any]) -> None:
+        """Add an event to the buffer"""
+        elements = event_elements(event_type, data)
+        if elements is None:
+            if event_type == ModelEvent.GRAPH_CLEARED:
+                graph_id = data.get('graph_id')
+                self._entries = {key: entry for key, entry in self._entries.items()
+                                 if key[0] != graph_id}
+            self._passthrough.append((next(self._sequence), event_type, data))
+            return
+
+        graph_id = data.get('graph_id')
+        kind = ELEMENT_EVENTS[event_type][0]
+        state = ELEMENT_EVENT_OPS[event_type]
+        for element in elements:
+            key = (graph_id, kind, element.id)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = [next(self._sequence), state, element]
+                continue
+            previous = entry[1]
+            if state == "added":
+                entry[1] = "updated" if previous == "removed" else "added"
+            elif state == "removed":
+                if previous == "added":
+                    del self._entries[key]
+                    continue
+                entry[1] = "removed"
+            elif previous == "removed":
+                continue
+            entry[2] = element
+
+    def drain(self) -> List[Tuple[ModelEvent, Dict[str, Any]]]:
+        """Return merged events and empty the buffer"""
+        groups: Dict[Tuple[Any, ModelEvent], List[Any]] = {}
+        for (graph_id, kind, _), (sequence, state, element) in self._entries.items():
+            group = groups.setdefault((graph_id, _STATE_EVENT[(kind, state)]), [sequence, []])
+            group[1].append(element)
+
+        # groups go by first-seen element, but nodes must arrive before their
+        # edges and edges must be gone before their nodes
+        for first, then in _DEPENDENT_GROUPS:
+            for (graph_id, event_type), group in groups.items():
+                if event_type == then and (graph_id, first) in groups:
+                    earlier = groups[(graph_id, first)]
+                    earlier[0] = min(earlier[0], group[0])
+
+        ordered = [(sequence, 0, event_type, data) for sequence, event_type, data in self._passthrough]
+        for (graph_id, event_type), (sequence, elements) in groups.items():
+            key, batch_key = ELEMENT_EVENTS[event_type]
+            data = {'graph_id': graph_id, batch_key: elements}
+            if len(elements) == 1:
+                data[key] = elements[0]
+            else:
+                data['batched'] = True
+            ordered.append((sequence, _GROUP_RANK.get(event_type, 0), event_type, data))
+        ordered.sort(key=lambda item: item[:2])
+
+        self._entries = {}
+        self._passthrough = []
+        return [(event_type, data) for _, _, event_type, data in ordered]
+
 
 class ModelSubject(ABC):
     """Interface for subjects that can have observers"""
     
     def __init__(self):
         self._observers: List[ModelObserver] = []
+        self._coalescer: Optional[EventCoalescer] = None
+        self._coalesce_window: Optional[float] = None
+        self._coalesce_timer: Optional[threading.Timer] = None
+        self._coalesce_lock = threading.Lock()
+        self._channels: Optional[Dict[int, 'ObserverChannel']] = None
+        self._channel_options: Dict[str, Any] = {}
+        self._executor: Optional['Executor'] = None
+        self._owns_executor = False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickles and copies without the lock, timer, delivery queues and buffered events
+
+        A copy keeps its observers and whether it coalesces, but delivers
+        synchronously until enable_async_delivery() is called on it.
+        """
+        state = self.__dict__.copy()
+        state['_coalescer'] = self._coalescer is not None
+        for name in ('_coalesce_timer', '_coalesce_lock', '_channels', '_executor', '_owns_executor'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._coalescer = EventCoalescer() if state['_coalescer'] else None
+        self._coalesce_timer = None
+        self._coalesce_lock = threading.Lock()
+        self._channels = None
+        self._executor = None
+        self._owns_executor = False
     
     def attach_observer(self, observer: ModelObserver) -> None:
         """Adds observer"""
         if observer not in self._observers:
             self._observers.append(observer)
+            if self._channels is not None:
+                self._open_channel(observer)
     
     def detach_observer(self, observer: ModelObserver) -> None:
         """Removes observer"""
         if observer in self._observers:
             self._observers.remove(observer)
+            if self._channels is not None:
+                channel = self._channels.pop(id(observer), None)
+                if channel is not None:
+                    channel.close()
     
     def notify_observers(self, event_type: ModelEvent, data: Dict[str, Any]) -> None:
         """Notifies all observers about the change"""
+        if self._coalescer is not None:
+            self._buffer_event(event_type, data)
+            return
+        if self._channels is not None:
+            self._enqueue([(event_type, data)])
+            return
         for observer in self._observers:
             observer.on_model_changed(event_type, data)
 
+    def enable_async_delivery(
+        self,
+        max_queue: int = 1000,
+        overflow: Optional['OverflowPolicy'] = None,
+        executor: Optional['Executor'] = None,
+        max_workers: int = 4,
+        block_timeout: Optional[float] = 1.0
+    ) -> None:
+        """
+        Delivers events to each observer through its own bounded queue
+
+        Args:
+            max_queue: Maximum number of queued events per observer
+            overflow: OverflowPolicy applied when a queue is full (default COALESCE)
+            executor: Executor draining the queues (default: own thread pool)
+            max_workers: Size of the own thread pool
+            block_timeout: Seconds a BLOCK policy waits before dropping the oldest event
+                (None waits until there is room)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from .delivery import OverflowPolicy
+
+        self.disable_async_delivery()
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers,
+                                          thread_name_prefix="observer-delivery")
+            self._owns_executor = True
+        self._executor = executor
+        self._channel_options = {
+            'max_queue': max_queue,
+            'overflow': overflow or OverflowPolicy.COALESCE,
+            'block_timeout': block_timeout
+        }
+        self._channels = {}
+        for observer in self._observers:
+            self._open_channel(observer)
+
+    def disable_async_delivery(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """Returns to synchronous delivery, optionally waiting for queued events"""
+        if self._channels is None:
+            return
+        if wait:
+            self.wait_for_delivery(timeout)
+        channels, self._channels = self._channels, None
+        for channel in channels.values():
+            channel.close()
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+        self._executor = None
+        self._owns_executor = False
+
+    def wait_for_delivery(self, timeout: Optional[float] = None) -> bool:
+        """Waits until all observer queues are drained"""
+        if self._channels is None:
+            return True
+        return all(channel.wait_idle(timeout) for channel in list(self._channels.values()))
+
+    def get_observer_metrics(self) -> List[Dict[str, Any]]:
+        """Gets per-observer queue depth, lag and delivery counters"""
+        if self._channels is None:
+            return []
+        return [channel.metrics() for channel in list(self._channels.values())]
+
+    def _open_channel(self, observer: ModelObserver) -> None:
+        """Creates the delivery queue for an observer"""
+        from .delivery import ObserverChannel
+        self._channels[id(observer)] = ObserverChannel(observer, self._executor, **self._channel_options)
+
+    def _enqueue(self, events: List[Tuple[ModelEvent, Dict[str, Any]]]) -> None:
+        """Puts events on every observer queue"""
+        for channel in list(self._channels.values()):
+            for event_type, data in events:
+                channel.put(event_type, data)
+
+    def enable_coalescing(self, window: Optional[float] = None) -> None:
+        """
+        Buffers events and delivers them as merged batches
+
+        Args:
+            window: Seconds to buffer after the first event before delivery.
+                None buffers until flush_events() is called (tick mode).
+        """
+        with self._coalesce_lock:
+            if self._coalescer is None:
+                self._coalescer = EventCoalescer()
+            self._coalesce_window = window
+
+    def disable_coalescing(self) -> None:
+        """Delivers buffered events and returns to synchronous delivery"""
+        self.flush_events()
+        with self._coalesce_lock:
+            self._coalescer = None
+
+    @property
+    def is_coalescing(self) -> bool:
+        """Whether events are buffered instead of delivered immediately"""
+        return self._coalescer is not None
+
+    def flush_events(self) -> None:
+        """Delivers buffered events, one batch per observer"""
+        with self._coalesce_lock:
+            if self._coalesce_timer is not None:
+                self._coalesce_timer.cancel()
+                self._coalesce_timer = None
+            if not self._coalescer:
+                return
+            events = self._coalescer.drain()
+        if not events:
+            return
+        if self._channels is not None:
+            self._enqueue(events)
+            return
+        for observer in list(self._observers):
+            observer.on_model_batch(events)
+
+    def _buffer_event(self, event_type: ModelEvent, data: Dict[str, Any]) -> None:
+        """Adds event to the coalescing buffer and arms the window timer"""
+        if not self._observers:
+            return
+        with self._coalesce_lock:
+            if self._coalescer is None:
+                deliver_now = True
+            else:
+                deliver_now = False
+                self._coalescer.add(event_type, data)
+                if self._coalesce_window is not None and self._coalesce_timer is None:
+                    self._coalesce_timer = threading.Timer(self._coalesce_window, self.flush_events)
+                    self._coalesce_timer.daemon = True
+                    self._coalesce_timer.start()
+        if deliver_now:
+            self.notify_observers(event_type, data)
+
 
 class ViewObserver(ABC):
     """Interface for view layer observers (for web notifications)"""
@@ -8,6 +8,8 @@ from typing import Dict, Any
 class Position:
     """Represents a 2D position with x and y coordinates."""
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float = 0.0, y: float = 0.0) -> None:
         self.x = x
         self.y = y
@@ -27,4 +29,4 @@ class Position:
     def __eq__(self, other) -> bool:
         if not isinstance(other, Position):
             return False
-        return self.x == other.x and self.y == other.y
\ No newline at end of file
+        return self.x == other.x and self.y == other.y
@@ -0,0 +1,77 @@
+"""
+Streaming JSON serialization for graphs
+"""
+
+import json
+import zlib
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator
+
+from .graph import Graph
+
+_encoder = json.JSONEncoder(separators=(',', ':'))
+
+
+def _iter_array(elements: Iterable[Any], chunk_size: int) -> Iterator[str]:
+    """Yield a JSON array of element dicts, chunk_size elements at a time."""
+    iterator = iter(elements)
+    encode = _encoder.encode
+    yield '['
+    first = True
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        body = ','.join(encode(element.to_dict()) for element in chunk)
+        yield body if first else ',' + body
+        first = False
+    yield ']'
+
+
+def iter_graph_json(graph: Graph, chunk_size: int = 500) -> Iterator[str]:
+    """Yield the JSON form of graph.to_dict() in chunks.
+
+    Each chunk holds up to chunk_size serialized nodes or edges, so memory
+    stays flat regardless of graph size. Element references of a Graph
+    are snapshotted first, so concurrent mutations do not break
+    iteration; read-only graphs (MappedGraph) are streamed in place.
+    """
+    encode = _encoder.encode
+    if isinstance(graph, Graph):
+        nodes, edges = tuple(graph.nodes), tuple(graph.edges)
+    else:
+        nodes, edges = graph.nodes, graph.edges
+    yield (f'{{"id":{encode(graph.id)},"name":{encode(graph.name)},'
+           f'"directed":{encode(graph.directed)},"nodes":')
+    yield from _iter_array(nodes, chunk_size)
+    yield ',"edges":'
+    yield from _iter_array(edges, chunk_size)
+    yield f',"properties":{encode(graph.properties)}}}'
+
+
+def iter_json_envelope(fields: Dict[str, Any], key: str, chunks: Iterable[str]) -> Iterator[str]:
+    """Wrap streamed JSON chunks as the value of key in an object with fields."""
+    encode = _encoder.encode
+    head = ','.join(f'{encode(name)}:{encode(value)}' for name, value in fields.items())
+    yield f'{{{head},{encode(key)}:' if head else f'{{{encode(key)}:'
+    yield from chunks
+    yield '}'
+
+
+def iter_gzip(chunks: Iterable[str], level: int = 6, min_chunk: int = 65536) -> Iterator[bytes]:
+    """Gzip-compress a stream of text chunks incrementally."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    pending = []
+    size = 0
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            pending.append(data)
+            size += len(data)
+        if size >= min_chunk:
+            yield b''.join(pending)
+            pending = []
+            size = 0
+    pending.append(compressor.flush())
+    yield b''.join(pending)
+
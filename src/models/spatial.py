@@ -0,0 +1,184 @@
+"""
+Spatial index over node positions
+"""
+
+import math
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class _Quad:
+    """Square quadtree cell; a leaf holds points, an inner cell four children."""
+
+    __slots__ = ("cx", "cy", "half", "points", "children", "count")
+
+    def __init__(self, cx: float, cy: float, half: float):
+        self.cx = cx
+        self.cy = cy
+        self.half = half
+        self.points: Optional[Dict[Hashable, Tuple[float, float]]] = {}
+        self.children: Optional[List['_Quad']] = None
+        self.count = 0
+
+    def child_for(self, x: float, y: float) -> '_Quad':
+        return self.children[(x >= self.cx) + 2 * (y >= self.cy)]
+
+    def split(self) -> None:
+        quarter = self.half / 2
+        self.children = [
+            _Quad(self.cx - quarter, self.cy - quarter, quarter),
+            _Quad(self.cx + quarter, self.cy - quarter, quarter),
+            _Quad(self.cx - quarter, self.cy + quarter, quarter),
+            _Quad(self.cx + quarter, self.cy + quarter, quarter),
+        ]
+        points, self.points = self.points, None
+        for key, (x, y) in points.items():
+            child = self.child_for(x, y)
+            child.points[key] = (x, y)
+            child.count += 1
+
+    def contains(self, x: float, y: float) -> bool:
+        return (self.cx - self.half <= x < self.cx + self.half
+                and self.cy - self.half <= y < self.cy + self.half)
+
+
+class QuadTree:
+    """Point quadtree supporting incremental insert, remove and move.
+
+    The root grows to cover points outside its bounds, leaves split above
+    ``capacity`` points (down to ``min_size``) and merge back when a
+    subtree shrinks below half the capacity.
+    """
+
+    def __init__(self, capacity: int = 16, initial_size: float = 1024.0, min_size: float = 1e-3):
+        self.capacity = capacity
+        self.initial_size = initial_size
+        self.min_size = min_size
+        self._points: Dict[Hashable, Tuple[float, float]] = {}
+        self._root: Optional[_Quad] = None
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._points
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, float]]:
+        """Get indexed coordinates of a key."""
+        return self._points.get(key)
+
+    def insert(self, key: Hashable, x: float, y: float) -> None:
+        """Index a point (replaces an existing entry for key)."""
+        if key in self._points:
+            self.remove(key)
+        x = float(x)
+        y = float(y)
+        if not (math.isfinite(x) and math.isfinite(y)):
+            raise ValueError(f"cannot index non-finite position ({x}, {y})")
+        if self._root is None:
+            self._root = _Quad(x, y, self.initial_size / 2)
+        while not self._root.contains(x, y):
+            self._grow(x, y)
+
+        self._points[key] = (x, y)
+        quad = self._root
+        while True:
+            quad.count += 1
+            if quad.children is None:
+                break
+            quad = quad.child_for(x, y)
+        quad.points[key] = (x, y)
+        while quad.count > self.capacity and quad.half > self.min_size:
+            quad.split()
+            quad = quad.child_for(x, y)
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove a point; returns False if key was not indexed."""
+        point = self._points.pop(key, None)
+        if point is None:
+            return False
+        x, y = point
+        path = []
+        quad = self._root
+        while quad.children is not None:
+            path.append(quad)
+            quad.count -= 1
+            quad = quad.child_for(x, y)
+        quad.count -= 1
+        del quad.points[key]
+
+        # merge the highest ancestor that became small enough
+        for ancestor in path:
+            if ancestor.count <= self.capacity // 2:
+                self._merge(ancestor)
+                break
+        if not self._points:
+            self._root = None
+        return True
+
+    def move(self, key: Hashable, x: float, y: float) -> None:
+        """Update the coordinates of a point."""
+        point = self._points.get(key)
+        if point is not None and point == (x, y):
+            return
+        self.insert(key, x, y)
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> List[Hashable]:
+        """Get keys of points inside the rectangle (bounds inclusive)."""
+        if self._root is None:
+            return []
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        found = []
+        stack = [self._root]
+        while stack:
+            quad = stack.pop()
+            half = quad.half
+            if (quad.cx + half < x0 or quad.cx - half > x1
+                    or quad.cy + half < y0 or quad.cy - half > y1):
+                continue
+            if quad.children is not None:
+                stack.extend(quad.children)
+                continue
+            for key, (x, y) in quad.points.items():
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    found.append(key)
+        return found
+
+    def clear(self) -> None:
+        """Remove all points."""
+        self._points.clear()
+        self._root = None
+
+    def _grow(self, x: float, y: float) -> None:
+        """Double the root towards (x, y); the old root becomes a quadrant."""
+        old = self._root
+        sx = 1 if x >= old.cx else -1
+        sy = 1 if y >= old.cy else -1
+        root = _Quad(old.cx + sx * old.half, old.cy + sy * old.half, old.half * 2)
+        root.points = None
+        quarter = old.half
+        root.children = [
+            _Quad(root.cx - quarter, root.cy - quarter, quarter),
+            _Quad(root.cx + quarter, root.cy - quarter, quarter),
+            _Quad(root.cx - quarter, root.cy + quarter, quarter),
+            _Quad(root.cx + quarter, root.cy + quarter, quarter),
+        ]
+        root.children[(old.cx >= root.cx) + 2 * (old.cy >= root.cy)] = old
+        root.count = old.count
+        self._root = root
+
+    @staticmethod
+    def _merge(quad: _Quad) -> None:
+        """Collapse a subtree into a single leaf."""
+        points = {}
+        stack = [quad]
+        while stack:
+            current = stack.pop()
+            if current.children is not None:
+                stack.extend(current.children)
+            else:
+                points.update(current.points)
+        quad.children = None
+        quad.points = points
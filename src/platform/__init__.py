@@ -4,8 +4,10 @@ Platform module for ExpresiVeNess core functionality.
 
 from .model_manager import ModelManager
 from .factories import GraphFactory
+from .storage import SQLiteModelStore
 
 __all__ = [
     "ModelManager",
     "GraphFactory",
+    "SQLiteModelStore",
 ]
\ No newline at end of file
@@ -2,21 +2,63 @@
 ModelManager for ExpresiVeNess
 """
 
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 from ..models.graph import Graph
+from ..models.mapped import MappedGraph
 from ..models.node import Node
 from ..models.edge import Edge
 from ..models.position import Position
-from ..models.observers import ModelSubject, ModelEvent
+from ..models.observers import ModelObserver, ModelSubject, ModelEvent
+from .storage import SQLiteModelStore
+
+
+class GraphEventRelay(ModelObserver):
+    """Forwards graph change events to the manager's observers"""
+
+    def __init__(self, manager: 'ModelManager', model_id: str):
+        self.manager = manager
+        self.model_id = model_id
+
+    def on_model_changed(self, event_type: ModelEvent, data: Dict[str, Any]) -> None:
+        relayed = dict(data)
+        relayed['model_id'] = self.model_id
+        self.manager.notify_observers(event_type, relayed)
 
 
 class ModelManager(ModelSubject):
-    """Model manager"""
+    """Model manager
+
+    Node/edge events of managed graphs are relayed to the manager's
+    observers with an added 'model_id' key.
+
+    With a store, models are loaded on first access and the least recently
+    used ones are written back (if changed) and unloaded once the estimated
+    size of resident graphs exceeds memory_budget bytes. Observers get
+    MODEL_EVICTED when a model is unloaded; it stays available through
+    get_model. Callers should not hold on to graphs of evicted models.
 
-    def __init__(self):
+    Memory-mapped graphs (register_mapped) are read-only views of a file;
+    they are never written to the store or evicted and do not count
+    towards the memory budget.
+    """
+
+    # rough resident size of a node/edge including indexes and change log
+    ESTIMATED_NODE_BYTES = 600
+    ESTIMATED_EDGE_BYTES = 450
+
+    def __init__(self, store: Optional[SQLiteModelStore] = None, memory_budget: Optional[int] = None):
         super().__init__()
-        self._models: Dict[str, Graph] = {}
+        # resident models, least recently used first
+        self._models: 'OrderedDict[str, Graph]' = OrderedDict()
+        self._relays: Dict[str, GraphEventRelay] = {}
         self._current_model_id: Optional[str] = None
+        self.store = store
+        self.memory_budget = memory_budget
+        # model ID -> graph version last written to / read from the store
+        self._saved_versions: Dict[str, int] = {}
+        self._lock = threading.RLock()
         self._initialize_sample_data()
 
     def add_model(self, graph: Graph) -> str:
@@ -25,46 +67,102 @@ class ModelManager(ModelSubject):
         if not hasattr(graph, 'id'):
             graph.id = model_id
 
-        self._models[model_id] = graph
-        self._current_model_id = model_id
+        with self._lock:
+            self._register(model_id, graph)
+            self._current_model_id = model_id
+            if self.store is not None:
+                self._saved_versions[model_id] = self.store.save(model_id, graph)
 
         self.notify_observers(ModelEvent.MODEL_CREATED, {
             'model_id': model_id,
             'graph': graph
         })
+        self._evict()
 
         return model_id
 
+    def register_mapped(self, path: str, model_id: Optional[str] = None) -> str:
+        """Add a read-only model memory-mapped from a binary graph file"""
+        graph = MappedGraph(path)
+        model_id = model_id or graph.id
+
+        with self._lock:
+            self._register(model_id, graph)
+
+        self.notify_observers(ModelEvent.MODEL_CREATED, {
+            'model_id': model_id,
+            'graph': graph
+        })
+        return model_id
+
     def get_model(self, model_id: str) -> Optional[Graph]:
-        """Get a model by ID"""
-        return self._models.get(model_id)
+        """Get a model by ID, loading it from the store if needed"""
+        with self._lock:
+            graph = self._models.get(model_id)
+            if graph is not None:
+                self._models.move_to_end(model_id)
+                return graph
+            if self.store is None:
+                return None
+            graph = self.store.load(model_id)
+            if graph is None:
+                return None
+            self._register(model_id, graph)
+            self._saved_versions[model_id] = graph.version
+        self._evict()
+        return graph
 
     def get_current_model(self) -> Optional[Graph]:
         """Get the current active model"""
         if self._current_model_id:
-            return self._models.get(self._current_model_id)
+            return self.get_model(self._current_model_id)
         return None
 
+    def get_current_model_id(self) -> Optional[str]:
+        """Get the ID of the current active model"""
+        return self._current_model_id
+
     def list_models(self) -> List[str]:
-        """List all model IDs"""
-        return list(self._models.keys())
+        """List all model IDs (resident and stored)"""
+        with self._lock:
+            model_ids = list(self._models.keys())
+        if self.store is not None:
+            resident = set(model_ids)
+            model_ids.extend(model_id for model_id in self.store.list_ids() if model_id not in resident)
+        return model_ids
+
+    def has_model(self, model_id: str) -> bool:
+        """Check whether a model exists without loading it"""
+        if model_id in self._models:
+            return True
+        return self.store is not None and self.store.contains(model_id)
+
+    def is_loaded(self, model_id: str) -> bool:
+        """Check whether a model is resident in memory"""
+        return model_id in self._models
 
     def remove_model(self, model_id: str) -> bool:
         """Remove a model"""
-        if model_id in self._models:
-            del self._models[model_id]
-            if self._current_model_id == model_id:
+        with self._lock:
+            removed = False
+            if model_id in self._models:
+                self._unregister(model_id)
+                removed = True
+            if self.store is not None:
+                removed = self.store.delete(model_id) or removed
+            self._saved_versions.pop(model_id, None)
+            if removed and self._current_model_id == model_id:
                 self._current_model_id = None
 
+        if removed:
             self.notify_observers(ModelEvent.MODEL_REMOVED, {
                 'model_id': model_id
             })
-            return True
-        return False
+        return removed
 
     def set_current_model(self, model_id: str) -> bool:
         """Set the current active model"""
-        if model_id in self._models:
+        if self.has_model(model_id):
             self._current_model_id = model_id
             self.notify_observers(ModelEvent.MODEL_SWITCHED, {
                 'model_id': model_id
@@ -72,17 +170,93 @@ class ModelManager(ModelSubject):
             return True
         return False
 
+    def save_model(self, model_id: str) -> bool:
+        """Write a resident model to the store if it changed since the last save"""
+        with self._lock:
+            graph = self._models.get(model_id)
+            if graph is None or self.store is None or isinstance(graph, MappedGraph):
+                return False
+            if self._saved_versions.get(model_id) != graph.version:
+                self._saved_versions[model_id] = self.store.save(model_id, graph)
+            return True
+
+    def flush(self) -> None:
+        """Write all changed resident models to the store"""
+        with self._lock:
+            model_ids = list(self._models.keys())
+        for model_id in model_ids:
+            self.save_model(model_id)
+
+    def estimated_size(self, graph: Graph) -> int:
+        """Estimate resident bytes of a graph"""
+        if isinstance(graph, MappedGraph):
+            # pages are loaded and dropped by the operating system
+            return 0
+        return (graph.node_count() * self.ESTIMATED_NODE_BYTES
+                + graph.edge_count() * self.ESTIMATED_EDGE_BYTES)
+
+    def resident_size(self) -> int:
+        """Estimate resident bytes of all loaded models"""
+        with self._lock:
+            return sum(self.estimated_size(graph) for graph in self._models.values())
+
+    def _evict(self) -> None:
+        """Unload least recently used models while over the memory budget"""
+        if self.store is None or self.memory_budget is None:
+            return
+        evicted = []
+        with self._lock:
+            total = sum(self.estimated_size(graph) for graph in self._models.values())
+            candidates = [model_id for model_id, graph in self._models.items()
+                          if not isinstance(graph, MappedGraph)]
+            # the most recently used model always stays resident
+            for model_id in candidates[:-1]:
+                if total <= self.memory_budget:
+                    break
+                graph = self._models[model_id]
+                self.save_model(model_id)
+                self._unregister(model_id)
+                total -= self.estimated_size(graph)
+                evicted.append(model_id)
+        for model_id in evicted:
+            self.notify_observers(ModelEvent.MODEL_EVICTED, {
+                'model_id': model_id
+            })
+
+    def _register(self, model_id: str, graph: Graph) -> None:
+        """Store a model and relay its change events"""
+        if model_id in self._models:
+            self._unregister(model_id)
+        self._models[model_id] = graph
+        relay = GraphEventRelay(self, model_id)
+        graph.attach_observer(relay)
+        self._relays[model_id] = relay
+
+    def _unregister(self, model_id: str) -> None:
+        """Drop a model and stop relaying its events"""
+        graph = self._models.pop(model_id)
+        relay = self._relays.pop(model_id, None)
+        if relay is not None:
+            graph.detach_observer(relay)
+        if isinstance(graph, MappedGraph):
+            graph.close()
+
     def _initialize_sample_data(self):
         """Initialize sample data for different syntax types"""
-        # Create sample graphs for each syntax type
-        basic_graph = self._create_basic_sample_graph()
-        process_graph = self._create_process_sample_graph()
-        hierarchy_graph = self._create_hierarchy_sample_graph()
-
-        # Add them to the manager without notifications during init
-        self._models["basic"] = basic_graph
-        self._models["process"] = process_graph
-        self._models["hierarchy"] = hierarchy_graph
+        samples = {
+            "basic": self._create_basic_sample_graph,
+            "process": self._create_process_sample_graph,
+            "hierarchy": self._create_hierarchy_sample_graph,
+        }
+        for model_id, create in samples.items():
+            # stored samples (possibly edited) are loaded lazily instead
+            if self.store is not None and self.store.contains(model_id):
+                continue
+            graph = create()
+            # Add them to the manager without notifications during init
+            self._register(model_id, graph)
+            if self.store is not None:
+                self._saved_versions[model_id] = self.store.save(model_id, graph)
 
         # Set basic as default
         self._current_model_id = "basic"
@@ -180,7 +354,7 @@ class ModelManager(ModelSubject):
 
     def get_model_by_syntax(self, syntax: str) -> Optional[Graph]:
         """Get a model by syntax type"""
-        return self._models.get(syntax)
+        return self.get_model(syntax)
 
     def get_all_syntaxes(self) -> List[str]:
         """Get all available syntax types"""
@@ -188,16 +362,31 @@ class ModelManager(ModelSubject):
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get system status information"""
-        return {
-            "total_models": len(self._models),
-            "current_model": self._current_model_id,
-            "available_syntaxes": self.get_all_syntaxes(),
-            "models_info": {
+        with self._lock:
+            models_info = {
                 model_id: {
                     "name": graph.name,
                     "nodes": graph.node_count(),
-                    "edges": graph.edge_count()
+                    "edges": graph.edge_count(),
+                    "loaded": True
                 }
                 for model_id, graph in self._models.items()
             }
-        }
\ No newline at end of file
+        if self.store is not None:
+            for model_id in self.store.list_ids():
+                if model_id not in models_info:
+                    info = self.store.info(model_id)
+                    if info is not None:
+                        models_info[model_id] = {
+                            "name": info["name"],
+                            "nodes": info["nodes"],
+                            "edges": info["edges"],
+                            "loaded": False
+                        }
+        return {
+            "total_models": len(models_info),
+            "loaded_models": len(self._models),
+            "current_model": self._current_model_id,
+            "available_syntaxes": self.get_all_syntaxes(),
+            "models_info": models_info
+        }
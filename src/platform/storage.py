@@ -0,0 +1,99 @@
+"""
+Persistent model storage for ModelManager
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from ..models import binary
+from ..models.graph import Graph
+
+
+class SQLiteModelStore:
+    """Stores graphs in a local SQLite file
+
+    Each model is one row keyed by model ID, together with the graph
+    version it was saved at, so a reloaded graph continues from the same
+    version (and ETags / sync clients stay consistent). Graphs are stored
+    in the binary graph format; rows holding JSON documents are still
+    read. Use ":memory:" as path for a throwaway store.
+    """
+
+    def __init__(self, path: str = "models.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS models ("
+                " id TEXT PRIMARY KEY,"
+                " name TEXT NOT NULL,"
+                " version INTEGER NOT NULL,"
+                " node_count INTEGER NOT NULL,"
+                " edge_count INTEGER NOT NULL,"
+                " data BLOB NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+
+    def save(self, model_id: str, graph: Graph) -> int:
+        """Persist a graph; returns the saved version"""
+        version = graph.version
+        data = binary.dumps(graph)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO models (id, name, version, node_count, edge_count, data, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (model_id, graph.name, version, graph.node_count(), graph.edge_count(), data, time.time())
+            )
+        return version
+
+    def load(self, model_id: str) -> Optional[Graph]:
+        """Load a graph, or None if it is not stored"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT version, data FROM models WHERE id = ?", (model_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        data = row[1]
+        if isinstance(data, bytes) and data.startswith(binary.MAGIC):
+            graph = binary.loads(data)
+        else:
+            graph = Graph.from_json(data)
+        graph.restore_version(row[0])
+        return graph
+
+    def delete(self, model_id: str) -> bool:
+        """Delete a stored graph"""
+        with self._lock, self._connection:
+            cursor = self._connection.execute("DELETE FROM models WHERE id = ?", (model_id,))
+        return cursor.rowcount > 0
+
+    def contains(self, model_id: str) -> bool:
+        """Check whether a graph is stored"""
+        with self._lock:
+            row = self._connection.execute("SELECT 1 FROM models WHERE id = ?", (model_id,)).fetchone()
+        return row is not None
+
+    def list_ids(self) -> List[str]:
+        """Get IDs of all stored graphs"""
+        with self._lock:
+            rows = self._connection.execute("SELECT id FROM models ORDER BY rowid").fetchall()
+        return [row[0] for row in rows]
+
+    def info(self, model_id: str) -> Optional[Dict[str, Any]]:
+        """Get name, version and size of a stored graph without loading it"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT name, version, node_count, edge_count FROM models WHERE id = ?", (model_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"name": row[0], "version": row[1], "nodes": row[2], "edges": row[3]}
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
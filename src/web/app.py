@@ -4,19 +4,26 @@ Flask Web Application for Expressiveness Graph Management
 
 import os
 import sys
+import time
 from pathlib import Path
 
 # Add parent directory to Python path for imports
 current_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(current_dir))
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
 from flask_cors import CORS
 
 from src.platform.model_manager import ModelManager
+from src.platform.storage import SQLiteModelStore
 from src.platform.factories import GraphFactory
 from src.adapters.base import SyntaxRegistry
 from src.models import Graph, Node, Edge, Position
+from src.models.serialization import iter_graph_json, iter_gzip, iter_json_envelope
+from src.layout import GraphAggregator, LayoutRegistry
+from src.algorithms import HierarchyIndex, ProcessAnalytics
+from src.web.cache import GraphPayloadCache
+from src.web.events import GraphEventBroadcaster, stream_graph_events
 import re
 
 
@@ -25,19 +32,199 @@ def create_app():
     """Create Flask application"""
     app = Flask(__name__)
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key')
+    app.config.setdefault('SSE_HEARTBEAT_SECONDS', 15.0)
+    app.config.setdefault('SSE_BATCH_WINDOW_SECONDS', 0.25)
+    # graphs with more nodes + edges are streamed instead of cached
+    app.config.setdefault('GRAPH_STREAMING_THRESHOLD', 50000)
+    app.config.setdefault('GRAPH_STREAMING_CHUNK_SIZE', 500)
+    # SQLite file for persistent models; unset keeps models in memory only
+    app.config.setdefault('MODEL_STORE_PATH', os.environ.get('MODEL_STORE_PATH'))
+    # estimated bytes of resident graphs before least recently used ones are unloaded
+    memory_budget = os.environ.get('MODEL_MEMORY_BUDGET')
+    app.config.setdefault('MODEL_MEMORY_BUDGET', int(memory_budget) if memory_budget else None)
 
     # Enable CORS
     CORS(app)
 
     # Initialize core components
-    model_manager = ModelManager()
+    store_path = app.config['MODEL_STORE_PATH']
+    model_manager = ModelManager(
+        store=SQLiteModelStore(store_path) if store_path else None,
+        memory_budget=app.config['MODEL_MEMORY_BUDGET']
+    )
     graph_factory = GraphFactory("web")
     syntax_registry = SyntaxRegistry()
+    event_broadcaster = GraphEventBroadcaster()
+    model_manager.attach_observer(event_broadcaster)
+    payload_cache = GraphPayloadCache()
+    model_manager.attach_observer(payload_cache)
+    layout_registry = LayoutRegistry()
+    aggregator = GraphAggregator()
+    model_manager.attach_observer(aggregator)
+    process_analytics = ProcessAnalytics()
+    model_manager.attach_observer(process_analytics)
+    hierarchy_index = HierarchyIndex()
+    model_manager.attach_observer(hierarchy_index)
 
     # Store components in app context
     app.model_manager = model_manager
     app.graph_factory = graph_factory
     app.syntax_registry = syntax_registry
+    app.event_broadcaster = event_broadcaster
+    app.payload_cache = payload_cache
+    app.layout_registry = layout_registry
+    app.aggregator = aggregator
+    app.process_analytics = process_analytics
+    app.hierarchy_index = hierarchy_index
+
+    def graph_response(graph, model_id=None):
+        """Serve a graph with ETag / If-None-Match support
+
+        Small graphs come from the payload cache; large graphs (or
+        ?stream=1) are serialized in chunks so memory use stays flat.
+        """
+        etag = payload_cache.etag_for(graph, model_id)
+        gzip_etag = f"{etag}-gzip"
+        element_count = graph.node_count() + graph.edge_count()
+        if request.if_none_match.contains(etag) or request.if_none_match.contains(gzip_etag):
+            response = Response(status=304)
+            response.set_etag(gzip_etag if request.if_none_match.contains(gzip_etag) else etag)
+        elif element_count > app.config['GRAPH_STREAMING_THRESHOLD'] or request.args.get('stream') == '1':
+            chunks = iter_json_envelope(
+                {'success': True, 'version': graph.version},
+                'graph',
+                iter_graph_json(graph, app.config['GRAPH_STREAMING_CHUNK_SIZE'])
+            )
+            if 'gzip' in request.accept_encodings:
+                response = Response(iter_gzip(chunks), mimetype='application/json')
+                response.headers['Content-Encoding'] = 'gzip'
+                response.set_etag(gzip_etag)
+            else:
+                response = Response(chunks, mimetype='application/json')
+                response.set_etag(etag)
+        else:
+            payload = payload_cache.get(graph, model_id)
+            if payload.gzip_body is not None and 'gzip' in request.accept_encodings:
+                response = Response(payload.gzip_body, mimetype='application/json')
+                response.headers['Content-Encoding'] = 'gzip'
+                response.set_etag(payload.gzip_etag)
+            else:
+                response = Response(payload.body, mimetype='application/json')
+                response.set_etag(payload.etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.vary.add('Accept-Encoding')
+        return response
+
+    def parse_bbox(bbox):
+        """Parse x0,y0,x1,y1; returns None if malformed"""
+        try:
+            x0, y0, x1, y1 = (float(value) for value in bbox.split(','))
+        except ValueError:
+            return None
+        return x0, y0, x1, y1
+
+    def bbox_error():
+        """Response for a malformed bbox parameter"""
+        return jsonify({
+            'success': False,
+            'error': 'Query parameter "bbox" must be x0,y0,x1,y1'
+        }), 400
+
+    def viewport_response(graph, bbox):
+        """Serve only the nodes inside bbox=x0,y0,x1,y1 and the edges touching them"""
+        bounds = parse_bbox(bbox)
+        if bounds is None:
+            return bbox_error()
+        x0, y0, x1, y1 = bounds
+        return jsonify({
+            'success': True,
+            'version': graph.version,
+            'bbox': [x0, y0, x1, y1],
+            'graph': graph.viewport_to_dict(x0, y0, x1, y1)
+        })
+
+    def level_response(graph, model_id=None):
+        """Serve the graph aggregated to ?level=N (optionally grouped by ?group_by=...)"""
+        level = request.args.get('level', type=int)
+        if level is None or level < 0:
+            return jsonify({
+                'success': False,
+                'error': 'Query parameter "level" must be a non-negative integer'
+            }), 400
+        group_by = request.args.get('group_by') or ('hierarchy' if model_id == 'hierarchy' else 'community')
+        version = graph.version
+        try:
+            aggregated = aggregator.aggregate(graph, level, group_by, model_id)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        payload = {'success': True, 'version': version, 'level': level, 'group_by': group_by}
+        if 'bbox' in request.args:
+            bounds = parse_bbox(request.args['bbox'])
+            if bounds is None:
+                return bbox_error()
+            payload['bbox'] = list(bounds)
+            payload['graph'] = aggregated.viewport_to_dict(*bounds)
+        else:
+            payload['graph'] = aggregated.to_dict()
+        return jsonify(payload)
+
+    def layout_response(graph, layout, model_id=None):
+        """Serve the graph with the positions of a layout, leaving the stored positions as they are
+
+        The positions are cached per graph version; storing them is up to
+        POST /api/graph/<syntax>/layout. Combines with bbox (tested against
+        the laid-out positions) but not with level.
+        """
+        if 'level' in request.args:
+            return jsonify({
+                'success': False,
+                'error': 'Query parameter "layout" cannot be combined with "level"'
+            }), 400
+        bounds = None
+        if 'bbox' in request.args:
+            bounds = parse_bbox(request.args['bbox'])
+            if bounds is None:
+                return bbox_error()
+        version = graph.version
+        try:
+            positions = layout_registry.compute_layout(graph, layout, model_id=model_id)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        data = graph.to_dict()
+        for node in data['nodes']:
+            if node['id'] in positions:
+                x, y = positions[node['id']]
+                node['position'] = {'x': x, 'y': y}
+        payload = {'success': True, 'version': version, 'layout': layout, 'graph': data}
+        if bounds is not None:
+            x0, y0, x1, y1 = bounds
+            data['nodes'] = [node for node in data['nodes']
+                             if min(x0, x1) <= node['position']['x'] <= max(x0, x1)
+                             and min(y0, y1) <= node['position']['y'] <= max(y0, y1)]
+            inside = {node['id'] for node in data['nodes']}
+            data['edges'] = [edge for edge in data['edges']
+                             if edge['source_id'] in inside or edge['target_id'] in inside]
+            payload['bbox'] = list(bounds)
+        return jsonify(payload)
+
+    def model_response(graph, model_id):
+        """Serve a model as asked by ?layout=, ?level= and ?bbox= (model IDs double as syntax names)"""
+        layout = request.args.get('layout')
+        if layout:
+            if layout == 'auto':
+                layout = layout_registry.default_layout_for(model_id)
+            return layout_response(graph, layout, model_id)
+        if 'level' in request.args:
+            return level_response(graph, model_id)
+        if 'bbox' in request.args:
+            return viewport_response(graph, request.args['bbox'])
+        return graph_response(graph, model_id)
 
     @app.route('/')
     def index():
@@ -72,21 +259,226 @@ def create_app():
         try:
             graph = model_manager.get_model_by_syntax(syntax)
             if graph:
+                return model_response(graph, syntax)
+            else:
+                return jsonify({
+                    'success': False,
+                    'error': f'No graph found for syntax: {syntax}'
+                }), 404
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+
+    @app.route('/api/graph/<syntax>/delta')
+    def get_graph_delta(syntax):
+        """Get changes to a graph since a version (full graph if no longer available)"""
+        try:
+            graph = model_manager.get_model_by_syntax(syntax)
+            if not graph:
+                return jsonify({
+                    'success': False,
+                    'error': f'No graph found for syntax: {syntax}'
+                }), 404
+
+            since = request.args.get('since', type=int)
+            if since is None or since < 0:
+                return jsonify({
+                    'success': False,
+                    'error': 'Query parameter "since" must be a non-negative integer'
+                }), 400
+
+            delta = graph.changes_since(since)
+            if delta is None:
                 return jsonify({
                     'success': True,
+                    'full': True,
+                    'version': graph.version,
                     'graph': graph.to_dict()
                 })
-            else:
+            return jsonify({
+                'success': True,
+                'full': False,
+                'version': graph.version,
+                'delta': delta
+            })
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    @app.route('/api/graph/<syntax>/events')
+    def stream_graph_changes(syntax):
+        """Server-Sent Events stream of graph changes"""
+        graph = model_manager.get_model_by_syntax(syntax)
+        if not graph:
+            return jsonify({
+                'success': False,
+                'error': f'No graph found for syntax: {syntax}'
+            }), 404
+
+        # Browsers resend the last id as a header on reconnect
+        last_event_id = request.headers.get('Last-Event-ID', request.args.get('last_event_id'))
+        try:
+            last_event_id = int(last_event_id) if last_event_id is not None else None
+        except ValueError:
+            last_event_id = None
+
+        events = stream_graph_events(
+            graph,
+            event_broadcaster,
+            syntax,
+            last_event_id=last_event_id,
+            heartbeat=app.config['SSE_HEARTBEAT_SECONDS'],
+            batch_window=app.config['SSE_BATCH_WINDOW_SECONDS']
+        )
+        return Response(events, mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        })
+
+    @app.route('/api/graph/<syntax>/layout', methods=['POST'])
+    def layout_graph(syntax):
+        """Compute a layout server-side and store the positions in the graph"""
+        try:
+            graph = model_manager.get_model_by_syntax(syntax)
+            if not graph:
                 return jsonify({
                     'success': False,
                     'error': f'No graph found for syntax: {syntax}'
                 }), 404
+            if getattr(graph, 'read_only', False):
+                return jsonify({
+                    'success': False,
+                    'error': f'Model {syntax} is read-only; use GET /api/graph/{syntax}?layout=... '
+                             'to get positions without storing them'
+                }), 409
+
+            options = dict(request.get_json(silent=True) or {})
+            algorithm = options.pop('algorithm', None) or layout_registry.default_layout_for(syntax)
+            if algorithm not in layout_registry.get_available_layouts():
+                return jsonify({
+                    'success': False,
+                    'error': f'Unknown layout: {algorithm}',
+                    'available': layout_registry.get_available_layouts()
+                }), 400
+
+            started = time.perf_counter()
+            try:
+                cached = layout_registry.get_applied(graph, algorithm, model_id=syntax, **options) is not None
+                positions = layout_registry.apply_layout(graph, algorithm, model_id=syntax, **options)
+            except (TypeError, ValueError) as e:
+                return jsonify({
+                    'success': False,
+                    'error': f'Invalid layout options: {e}'
+                }), 400
+            return jsonify({
+                'success': True,
+                'algorithm': algorithm,
+                'cached': cached,
+                'version': graph.version,
+                'nodes': {node_id: {'x': x, 'y': y} for node_id, (x, y) in positions.items()},
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+            })
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    @app.route('/api/graph/<syntax>/analytics')
+    def get_process_analytics(syntax):
+        """Reachability and critical-path report of a process graph (?node=<id> for one node)"""
+        try:
+            graph = model_manager.get_model_by_syntax(syntax)
+            if not graph:
+                return jsonify({
+                    'success': False,
+                    'error': f'No graph found for syntax: {syntax}'
+                }), 404
+
+            node_id = request.args.get('node')
+            try:
+                if node_id is None:
+                    return jsonify({
+                        'success': True,
+                        'analytics': process_analytics.report(graph, syntax)
+                    })
+                ends = process_analytics.reachable_ends(graph, node_id, syntax)
+                return jsonify({
+                    'success': True,
+                    'version': graph.version,
+                    'node': node_id,
+                    'reachable_ends': [node.id for node in ends],
+                    'reachable': process_analytics.is_reachable(graph, node_id, syntax),
+                    'can_complete': bool(ends)
+                })
+            except KeyError as e:
+                return jsonify({
+                    'success': False,
+                    'error': e.args[0]
+                }), 404
+            except ValueError as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 400
         except Exception as e:
             return jsonify({
                 'success': False,
                 'error': str(e)
             }), 500
 
+    @app.route('/api/graph/<syntax>/hierarchy')
+    def get_hierarchy_position(syntax):
+        """Depth, path to root and subtree of ?node=<id>; with ?ancestor=<id> whether the node is below it"""
+        try:
+            graph = model_manager.get_model_by_syntax(syntax)
+            if not graph:
+                return jsonify({
+                    'success': False,
+                    'error': f'No graph found for syntax: {syntax}'
+                }), 404
+
+            node_id = request.args.get('node')
+            if not node_id:
+                return jsonify({
+                    'success': False,
+                    'error': 'Query parameter "node" is required'
+                }), 400
+            try:
+                payload = {
+                    'success': True,
+                    'version': graph.version,
+                    'node': node_id,
+                    'depth': hierarchy_index.depth(graph, node_id, syntax),
+                    'path_to_root': [node.id for node in hierarchy_index.path_to_root(graph, node_id, syntax)],
+                    'children': [node.id for node in hierarchy_index.children(graph, node_id, syntax)],
+                    'descendants': [node.id for node in hierarchy_index.descendants(graph, node_id, syntax)]
+                }
+                ancestor = request.args.get('ancestor')
+                if ancestor:
+                    payload['ancestor'] = ancestor
+                    payload['is_descendant'] = hierarchy_index.is_ancestor(graph, ancestor, node_id, syntax)
+                return jsonify(payload)
+            except KeyError as e:
+                return jsonify({
+                    'success': False,
+                    'error': e.args[0]
+                }), 404
+            except ValueError as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 400
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
 
     @app.route('/api/graph/current')
     def get_current_graph():
@@ -94,10 +486,7 @@ def create_app():
         try:
             graph = model_manager.get_current_model()
             if graph:
-                return jsonify({
-                    'success': True,
-                    'graph': graph.to_dict()
-                })
+                return model_response(graph, model_manager.get_current_model_id())
             else:
                 return jsonify({
                     'success': False,
@@ -0,0 +1,96 @@
+"""
+Serialized graph payload cache for the web API
+"""
+
+import gzip
+import json
+import threading
+import uuid
+from typing import Any, Dict, Optional
+
+from src.models.graph import Graph
+from src.models.observers import ModelEvent, ModelObserver, event_cache_key
+
+
+class CachedPayload:
+    """Serialized graph response and its validators"""
+
+    __slots__ = ("graph_id", "version", "body", "etag", "gzip_body", "gzip_etag")
+
+    def __init__(self, graph_id: str, version: int, body: bytes, etag: str,
+                 gzip_body: Optional[bytes] = None, gzip_etag: Optional[str] = None):
+        self.graph_id = graph_id
+        self.version = version
+        self.body = body
+        self.etag = etag
+        self.gzip_body = gzip_body
+        self.gzip_etag = gzip_etag
+
+
+class GraphPayloadCache(ModelObserver):
+    """Per-graph cache of serialized JSON responses keyed by graph version
+
+    Entries are rebuilt when the graph version changes; as an observer of
+    ModelManager the cache also drops entries as soon as a graph changes
+    or is removed, so stale payloads do not stay in memory. Entries are
+    keyed by the model ID when given (what ModelManager events carry),
+    else by the graph ID. ETags are strong: they include a per-process
+    token, the key and graph version, and a suffix for the gzip
+    representation.
+    """
+
+    def __init__(self, compress: bool = True, compress_level: int = 6, min_compress_size: int = 1024):
+        self.compress = compress
+        self.compress_level = compress_level
+        self.min_compress_size = min_compress_size
+        self._token = uuid.uuid4().hex[:8]
+        self._entries: Dict[str, CachedPayload] = {}
+        self._lock = threading.Lock()
+
+    def etag_for(self, graph: Graph, model_id: Optional[str] = None) -> str:
+        """Get the (unquoted) identity ETag of the graph's current state"""
+        return f"{self._token}-{model_id or graph.id}-{graph.version}"
+
+    def get(self, graph: Graph, model_id: Optional[str] = None) -> CachedPayload:
+        """Get cached payload for the graph, serializing it if stale"""
+        key = model_id or graph.id
+        version = graph.version
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            return entry
+
+        body = json.dumps({
+            'success': True,
+            'version': version,
+            'graph': graph.to_dict()
+        }, separators=(',', ':')).encode('utf-8')
+        etag = f"{self._token}-{key}-{version}"
+        entry = CachedPayload(key, version, body, etag)
+        if self.compress and len(body) >= self.min_compress_size:
+            entry.gzip_body = gzip.compress(body, compresslevel=self.compress_level)
+            entry.gzip_etag = f"{etag}-gzip"
+
+        # Only store if the graph did not change while serializing
+        if graph.version == version:
+            with self._lock:
+                self._entries[key] = entry
+        return entry
+
+    def invalidate(self, key: str) -> None:
+        """Drop the cached payload of a model (or graph)"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached payloads"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def on_model_changed(self, event_type: ModelEvent, data: Dict[str, Any]) -> None:
+        key = event_cache_key(event_type, data)
+        if key is not None:
+            self.invalidate(key)
@@ -0,0 +1,143 @@
+"""
+Server-Sent Events stream of model changes
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Set
+
+from src.models.graph import Graph
+from src.models.observers import ModelEvent, ModelObserver
+
+
+class Subscription:
+    """Wake-up signal for one connected client"""
+
+    def __init__(self, model_id: str):
+        self.model_id = model_id
+        self.closed = False
+        # closed because the model was removed (not just unloaded)
+        self.removed = False
+        self._changed = threading.Event()
+
+    def notify(self) -> None:
+        """Signal that the model changed"""
+        self._changed.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for a change; returns False on timeout"""
+        changed = self._changed.wait(timeout)
+        self._changed.clear()
+        return changed
+
+
+class GraphEventBroadcaster(ModelObserver):
+    """Observer on ModelManager that wakes the streams of changed models
+
+    Events only set a flag per subscriber; each stream then reads the
+    graph change log itself, so any number of changes between two sends
+    is delivered as one versioned delta.
+    """
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, model_id: str) -> Subscription:
+        """Register a client for changes of a model"""
+        subscription = Subscription(model_id)
+        with self._lock:
+            self._subscriptions.setdefault(model_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a client"""
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.model_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.model_id]
+
+    def subscriber_count(self, model_id: Optional[str] = None) -> int:
+        """Get number of connected clients (for a model or in total)"""
+        with self._lock:
+            if model_id is not None:
+                return len(self._subscriptions.get(model_id, ()))
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def on_model_changed(self, event_type: ModelEvent, data: Dict[str, Any]) -> None:
+        model_id = data.get('model_id')
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(model_id, ()))
+        for subscription in subscriptions:
+            if event_type == ModelEvent.MODEL_REMOVED:
+                subscription.removed = True
+                subscription.closed = True
+            elif event_type == ModelEvent.MODEL_EVICTED:
+                # the stream ends; the client reconnects to the reloaded graph
+                subscription.closed = True
+            subscription.notify()
+
+
+def format_event(event: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    """Format one SSE message"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+def stream_graph_events(
+    graph: Graph,
+    broadcaster: GraphEventBroadcaster,
+    model_id: str,
+    last_event_id: Optional[int] = None,
+    heartbeat: float = 15.0,
+    batch_window: float = 0.25,
+    retry_ms: int = 3000
+) -> Iterator[str]:
+    """
+    Yield SSE messages for a graph until the client disconnects
+
+    After a change the stream waits batch_window seconds, so a burst of
+    changes goes out as one delta. The event id is the graph version. A
+    client resuming with Last-Event-ID gets a 'delta' from that version,
+    or a 'snapshot' when the change log no longer covers it.
+    """
+    subscription = broadcaster.subscribe(model_id)
+    try:
+        yield f"retry: {retry_ms}\n\n"
+
+        version = last_event_id
+        if version is None or version > graph.version:
+            version = graph.version
+            yield format_event("snapshot", {'version': version, 'graph': graph.to_dict()}, version)
+
+        while not subscription.closed:
+            if graph.version == version and not subscription.wait(heartbeat):
+                yield ": heartbeat\n\n"
+                continue
+            if subscription.closed:
+                break
+            if batch_window:
+                time.sleep(batch_window)
+
+            current = graph.version
+            if current == version:
+                continue
+            delta = graph.changes_since(version)
+            if delta is None:
+                yield format_event("snapshot", {'version': current, 'graph': graph.to_dict()}, current)
+            else:
+                yield format_event("delta", delta, delta['version'])
+                current = delta['version']
+            version = current
+
+        if subscription.removed:
+            yield format_event("removed", {'model_id': model_id})
+    finally:
+        broadcaster.unsubscribe(subscription)